@@ -34,21 +34,16 @@ def _csf_apply_slider(output: CommonConsoleCommandOutput, slider_name: str, amou
     facial_attributes = PersistenceBlobs_pb2.BlobSimFacialCustomizationData()
     facial_attributes.MergeFromString(sim_info.facial_attributes)
     from cncustomsliderframework.sliders.query.slider_query_utils import CSFSliderQueryUtils
-    custom_sliders = CSFSliderQueryUtils().get_sliders_by_name(sim_info, slider_name)
-    if not custom_sliders:
-        output(f'Invalid Slider! \'{slider_name}\'')
-        output('Available Sliders:')
-        for custom_slider in CSFSliderQueryUtils().get_sliders_for_sim(sim_info):
-            output('>{}'.format(custom_slider.raw_display_name))
-        return False
-    custom_slider = next(iter(custom_sliders))
+    custom_slider = CSFSliderQueryUtils().locate_by_name(sim_info, slider_name)
     if custom_slider is not None:
         output('Slider found.')
     else:
         output(f'Invalid Slider! \'{slider_name}\'')
-        output('Available Sliders:')
-        for custom_slider in CSFSliderQueryUtils().get_sliders_for_sim(sim_info):
-            output('>{}'.format(custom_slider.raw_display_name))
+        similar_sliders = CSFSliderQueryUtils().search_sliders_for_sim(sim_info, slider_name)
+        if similar_sliders:
+            output('Similar Sliders:')
+            for similar_slider in similar_sliders:
+                output('>{}'.format(similar_slider.raw_display_name))
         return False
     # noinspection PyBroadException
     try:
@@ -76,21 +71,16 @@ def _csf_reset_slider(output: CommonConsoleCommandOutput, slider_name: str, sim_
         return False
     output(f'Resetting slider for \'{sim_info}\'.')
     from cncustomsliderframework.sliders.query.slider_query_utils import CSFSliderQueryUtils
-    custom_sliders = CSFSliderQueryUtils().get_sliders_by_name(sim_info, slider_name)
-    if not custom_sliders:
-        output(f'Invalid Slider! \'{slider_name}\'')
-        output('Available Sliders:')
-        for custom_slider in CSFSliderQueryUtils().get_sliders_for_sim(sim_info):
-            output('>{}'.format(custom_slider.raw_display_name))
-        return False
-    custom_slider = next(iter(custom_sliders))
+    custom_slider = CSFSliderQueryUtils().locate_by_name(sim_info, slider_name)
     if custom_slider is not None:
         output('Slider found.')
     else:
         output(f'Invalid Slider! \'{slider_name}\'')
-        output('Available Sliders:')
-        for custom_slider in CSFSliderQueryUtils().get_sliders_for_sim(sim_info):
-            output('>{}'.format(custom_slider.raw_display_name))
+        similar_sliders = CSFSliderQueryUtils().search_sliders_for_sim(sim_info, slider_name)
+        if similar_sliders:
+            output('Similar Sliders:')
+            for similar_slider in similar_sliders:
+                output('>{}'.format(similar_slider.raw_display_name))
         return False
     CSFCustomSliderApplicationService().reset_slider(sim_info, custom_slider, trigger_event=True, persist_value=True)
     output('Success, Sliders reset.')
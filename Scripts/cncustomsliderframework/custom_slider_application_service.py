@@ -7,24 +7,49 @@ https://creativecommons.org/licenses/by-nd/4.0/legalcode
 Copyright (c) COLONOLNUTTY
 """
 import random
-from typing import Iterator, Union
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Set, Tuple, Union
 
+from cncustomsliderframework.dtos.sims.facial_attributes_entry import CSFFacialAttributesEntry
+from cncustomsliderframework.dtos.sims.facial_modifier_index import CSFFacialModifierIndex
+from cncustomsliderframework.dtos.sims.facial_modifier_set import CSFFacialModifierSet
 from cncustomsliderframework.dtos.sliders.applied_slider import CSFAppliedSlider
+from cncustomsliderframework.dtos.sliders.applied_sliders_library_by_sim_type import CSFAppliedSliderLibraryBySimType
 from cncustomsliderframework.dtos.sliders.slider import CSFSlider
 from cncustomsliderframework.events.slider_changed_event import CSFSliderValueChanged
 from cncustomsliderframework.modinfo import ModInfo
 from cncustomsliderframework.persistence.sim_data.csf_sim_slider_system_data_storage import CSFSimSliderSystemData
+from cncustomsliderframework.sim_details_cache import CSFSimDetailsCache
+from cncustomsliderframework.slider_edit_session import CSFSliderEditSession
 from protocolbuffers.PersistenceBlobs_pb2 import BlobSimFacialCustomizationData
 from sims.sim_info import SimInfo
+from sims4communitylib.enums.sim_type import CommonSimType
 from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
 from sims4communitylib.logging.has_log import HasLog
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
 from sims4communitylib.services.common_service import CommonService
-from sims4communitylib.utils.sims.common_sim_type_utils import CommonSimTypeUtils
+from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
 
 
 class CSFCustomSliderApplicationService(CommonService, HasLog):
-    """ Change and Reset Custom Sliders. """
+    """ Change and Reset Custom Sliders.
+
+    The facial attributes of the most recently used Sims are kept parsed along with the serialized bytes they were parsed from, so repeated reads of a Sim parse them once. The modifiers of the parsed facial attributes are indexed by key the first time a slider value is read from them.
+
+    """
+    MAXIMUM_CACHED_FACIAL_ATTRIBUTES = 32
+    _MODIFIER_LIST_DESCRIPTIONS: Dict[str, Tuple[str, str]] = {
+        CSFFacialModifierIndex.BODY_MODIFIERS: ('body modifier', 'a BODY MODIFIER'),
+        CSFFacialModifierIndex.AGED_BODY_MODIFIERS: ('aged body modifier', 'an AGED BODY MODIFIER'),
+        CSFFacialModifierIndex.FACE_MODIFIERS: ('face modifier', 'a FACE MODIFIER'),
+        CSFFacialModifierIndex.AGED_FACE_MODIFIERS: ('aged face modifier', 'an AGED FACE MODIFIER'),
+    }
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._facial_attributes_by_sim_id: OrderedDict = OrderedDict()
+        self._slider_value_changed_event_mod_names: Set[str] = set()
+
     # noinspection PyMissingOrEmptyDocstring
     @property
     def mod_identity(self) -> CommonModIdentity:
@@ -35,81 +60,80 @@ class CSFCustomSliderApplicationService(CommonService, HasLog):
     def log_identifier(self) -> str:
         return 'csf_slider_application_service'
 
+    @property
+    def slider_value_changed_events_enabled(self) -> bool:
+        """ Whether a CSFSliderValueChanged event is triggered for every slider that is changed. """
+        return len(self._slider_value_changed_event_mod_names) > 0
+
+    def enable_slider_value_changed_events(self, mod_identity: CommonModIdentity) -> None:
+        """enable_slider_value_changed_events(mod_identity)
+
+        Opt in to a CSFSliderValueChanged event being triggered for every slider that is changed.
+
+        By default, only a single CSFSlidersChangedBatch event is triggered for all sliders changed together. Mods listening for CSFSliderValueChanged must opt in for it to be triggered.
+
+        :param mod_identity: The identity of the mod listening for the event.
+        :type mod_identity: CommonModIdentity
+        """
+        self._slider_value_changed_event_mod_names.add(mod_identity.name)
+
+    def disable_slider_value_changed_events(self, mod_identity: CommonModIdentity) -> None:
+        """disable_slider_value_changed_events(mod_identity)
+
+        Opt out of a CSFSliderValueChanged event being triggered for every slider that is changed. The event keeps being triggered while other mods are opted in.
+
+        :param mod_identity: The identity of the mod that was listening for the event.
+        :type mod_identity: CommonModIdentity
+        """
+        self._slider_value_changed_event_mod_names.discard(mod_identity.name)
+
     def reapply_all_sliders(self, sim_info: SimInfo):
         """Reapply all sliders on a Sim."""
+        from cncustomsliderframework.sliders.query.slider_query_utils import CSFSliderQueryUtils
         sim_data = CSFSimSliderSystemData(sim_info)
-        current_sim_type = CommonSimTypeUtils.determine_sim_type(sim_info, use_current_occult_type=True)
+        current_sim_type = CSFSimDetailsCache().get_details(sim_info).sim_type
         slider_library = sim_data.applied_sliders.get_library(current_sim_type)
         if slider_library is None:
             return
+        slider_amounts: Dict[CSFSlider, float] = dict()
         for slider in slider_library.sliders.values():
             slider: CSFAppliedSlider = slider
-            self.apply_slider_by_name(sim_info, slider.slider_name, slider.slider_value, trigger_event=True, persist_value=False)
+            custom_slider = CSFSliderQueryUtils().locate_by_name(sim_info, slider.slider_name)
+            if custom_slider is None:
+                self.log.debug(f'No slider found with name: {slider.slider_name}')
+                continue
+            slider_amounts[custom_slider] = slider.slider_value
+        self.apply_sliders(sim_info, slider_amounts, trigger_event=True, persist_value=False)
 
     def _get_facial_attributes(self, sim_info: SimInfo) -> BlobSimFacialCustomizationData:
+        # The returned facial attributes are shared with the cache and must not be modified.
+        return self._get_facial_attributes_entry(sim_info).facial_attributes
+
+    def _get_facial_modifier_index(self, sim_info: SimInfo) -> CSFFacialModifierIndex:
+        return self._get_facial_attributes_entry(sim_info).modifier_index
+
+    def _get_facial_attributes_entry(self, sim_info: SimInfo) -> CSFFacialAttributesEntry:
+        sim_id = CommonSimUtils.get_sim_id(sim_info)
+        serialized_facial_attributes = sim_info.facial_attributes
+        cached_entry: CSFFacialAttributesEntry = self._facial_attributes_by_sim_id.get(sim_id, None)
+        if cached_entry is not None and cached_entry.is_parsed_from(serialized_facial_attributes):
+            self._facial_attributes_by_sim_id.move_to_end(sim_id)
+            return cached_entry
         facial_attributes = BlobSimFacialCustomizationData()
         # noinspection PyPropertyAccess
-        facial_attributes.MergeFromString(sim_info.facial_attributes)
-        return facial_attributes
+        facial_attributes.MergeFromString(serialized_facial_attributes)
+        facial_attributes_entry = CSFFacialAttributesEntry(serialized_facial_attributes, facial_attributes)
+        self._facial_attributes_by_sim_id[sim_id] = facial_attributes_entry
+        self._facial_attributes_by_sim_id.move_to_end(sim_id)
+        while len(self._facial_attributes_by_sim_id) > CSFCustomSliderApplicationService.MAXIMUM_CACHED_FACIAL_ATTRIBUTES:
+            self._facial_attributes_by_sim_id.popitem(last=False)
+        return facial_attributes_entry
 
     def _set_facial_attributes(self, sim_info: SimInfo, new_facial_attributes: BlobSimFacialCustomizationData):
+        self._facial_attributes_by_sim_id.pop(CommonSimUtils.get_sim_id(sim_info), None)
         sim_info.facial_attributes = new_facial_attributes.SerializeToString()
         sim_info.resend_facial_attributes()
 
-    def _get_existing_modifiers_for_edit(
-        self,
-        sim_info: SimInfo,
-        exclude_modifier_ids: Iterator[int] = ()
-    ) -> BlobSimFacialCustomizationData:
-        facial_attributes = self._get_facial_attributes(sim_info)
-        existing_modifiers = BlobSimFacialCustomizationData()
-
-        self.log.debug('Adding face modifiers.')
-        # noinspection PyUnresolvedReferences
-        for face_modifier in facial_attributes.face_modifiers:
-            # Exclude the opposite modifier so it no longer applies.
-            if face_modifier.key in exclude_modifier_ids:
-                self.log.debug(f'Excluding face modifier with key {face_modifier.key}')
-                continue
-            # noinspection PyUnresolvedReferences
-            existing_modifiers.face_modifiers.append(face_modifier)
-
-        self.log.debug('Adding aged face modifiers.')
-        # noinspection PyUnresolvedReferences
-        for aged_face_modifier in facial_attributes.aged_face_modifiers:
-            # Exclude the opposite modifier so it no longer applies.
-            if aged_face_modifier.key in exclude_modifier_ids:
-                self.log.debug(f'Excluding aged face modifier with key {aged_face_modifier.key}')
-                continue
-            # noinspection PyUnresolvedReferences
-            existing_modifiers.aged_face_modifiers.append(aged_face_modifier)
-
-        self.log.debug('Adding body modifiers.')
-        # noinspection PyUnresolvedReferences
-        for body_modifier in facial_attributes.body_modifiers:
-            if body_modifier.key in exclude_modifier_ids:
-                self.log.debug(f'Excluding body modifier with key {body_modifier.key}')
-                continue
-            # noinspection PyUnresolvedReferences
-            existing_modifiers.body_modifiers.append(body_modifier)
-
-        self.log.debug('Adding aged body modifiers.')
-        # noinspection PyUnresolvedReferences
-        for aged_body_modifier in facial_attributes.aged_body_modifiers:
-            if aged_body_modifier.key in exclude_modifier_ids:
-                self.log.debug(f'Excluding aged body modifier with key {aged_body_modifier.key}')
-                continue
-            # noinspection PyUnresolvedReferences
-            existing_modifiers.aged_body_modifiers.append(aged_body_modifier)
-
-        self.log.debug('Adding sculpt modifiers.')
-        # noinspection PyUnresolvedReferences
-        for sculpt in facial_attributes.sculpts:
-            sculpt: int = sculpt
-            # noinspection PyUnresolvedReferences
-            existing_modifiers.sculpts.append(sculpt)
-        return existing_modifiers
-
     def get_current_slider_value_by_identifier(self, sim_info: SimInfo, identifier: str, use_persisted_value: bool = False, **__) -> Union[float, None]:
         """get_current_slider_value_by_identifier(sim_info, identifier, use_persisted_value=True)
 
@@ -146,11 +170,7 @@ class CSFCustomSliderApplicationService(CommonService, HasLog):
         :rtype: Union[float, None]
         """
         from cncustomsliderframework.sliders.query.slider_query_utils import CSFSliderQueryUtils
-        custom_sliders = CSFSliderQueryUtils().get_sliders_by_name(sim_info, slider_name)
-        if not custom_sliders:
-            self.log.debug(f'No sliders found with name: {slider_name}')
-            return None
-        custom_slider = next(iter(custom_sliders))
+        custom_slider = CSFSliderQueryUtils().locate_by_name(sim_info, slider_name)
         if custom_slider is None:
             self.log.debug(f'No slider found with name: {slider_name}')
             return None
@@ -178,97 +198,14 @@ class CSFCustomSliderApplicationService(CommonService, HasLog):
         return_value = None
         if use_persisted_value:
             sim_data = CSFSimSliderSystemData(sim_info)
-            current_sim_type = CommonSimTypeUtils.determine_sim_type(sim_info, use_current_occult_type=True)
+            current_sim_type = CSFSimDetailsCache().get_details(sim_info).sim_type
             applied_sliders = sim_data.applied_sliders
             slider_value = applied_sliders.get_slider_value(current_sim_type, custom_slider.raw_display_name)
             if slider_value is not None:
                 return slider_value
 
         try:
-            facial_attributes = self._get_facial_attributes(sim_info)
-
-            # noinspection PyUnresolvedReferences
-            for body_modifier in facial_attributes.body_modifiers:
-                if body_modifier.amount == 0.0:
-                    continue
-                if custom_slider.has_negative_modifier_id() and body_modifier.key == custom_slider.negative_modifier_id:
-                    self.log.debug(f'Found existing negative body modifier value {body_modifier.amount} with key {body_modifier.key}')
-                    if not custom_slider.is_body_modifier:
-                        self.log.format_error_with_message(f'Not a BODY MODIFIER {custom_slider.raw_display_name}', custom_slider=custom_slider.raw_display_name, throw=False)
-                    return_value = (body_modifier.amount * -1.0)/0.01
-                    break
-                if custom_slider.has_positive_modifier_id() and body_modifier.key == custom_slider.positive_modifier_id:
-                    self.log.debug(f'Found existing positive body modifier value {body_modifier.amount} with key {body_modifier.key}')
-                    if not custom_slider.is_body_modifier:
-                        self.log.format_error_with_message(f'Not a BODY MODIFIER {custom_slider.raw_display_name}', custom_slider=custom_slider.raw_display_name, throw=False)
-                    return_value = body_modifier.amount/0.01
-                    break
-
-            if return_value is not None:
-                return return_value
-
-            # noinspection PyUnresolvedReferences
-            for aged_body_modifier in facial_attributes.aged_body_modifiers:
-                if aged_body_modifier.amount == 0.0:
-                    continue
-                if custom_slider.has_negative_modifier_id() and aged_body_modifier.key == custom_slider.negative_modifier_id:
-                    self.log.debug(f'Found existing negative aged body modifier value {aged_body_modifier.amount} with key {aged_body_modifier.key}')
-                    if not custom_slider.is_body_modifier:
-                        self.log.format_error_with_message(f'Not an AGED BODY MODIFIER {custom_slider.raw_display_name}', custom_slider=custom_slider.raw_display_name, throw=False)
-                    return_value = (aged_body_modifier.amount * -1.0)/0.01
-                    break
-                if custom_slider.has_positive_modifier_id() and aged_body_modifier.key == custom_slider.positive_modifier_id:
-                    self.log.debug(f'Found existing positive aged body modifier value {aged_body_modifier.amount} with key {aged_body_modifier.key}')
-                    if not custom_slider.is_body_modifier:
-                        self.log.format_error_with_message(f'Not an AGED BODY MODIFIER {custom_slider.raw_display_name}', custom_slider=custom_slider.raw_display_name, throw=False)
-                    return_value = aged_body_modifier.amount/0.01
-                    break
-
-            if return_value is not None:
-                return return_value
-
-            # noinspection PyUnresolvedReferences
-            for face_modifier in facial_attributes.face_modifiers:
-                if face_modifier.amount == 0.0:
-                    continue
-                if custom_slider.has_negative_modifier_id() and face_modifier.key == custom_slider.negative_modifier_id:
-                    self.log.debug(f'Found existing negative face modifier value {face_modifier.amount} with key {face_modifier.key}')
-                    if not custom_slider.is_face_modifier:
-                        self.log.format_error_with_message(f'Not a FACE MODIFIER {custom_slider.raw_display_name}', custom_slider=custom_slider.raw_display_name, throw=False)
-                    return_value = (face_modifier.amount * -1.0)/0.01
-                    break
-                if custom_slider.has_positive_modifier_id() and face_modifier.key == custom_slider.positive_modifier_id:
-                    self.log.debug(f'Found existing positive face modifier value {face_modifier.amount} with key {face_modifier.key}')
-                    if not custom_slider.is_face_modifier:
-                        self.log.format_error_with_message(f'Not a FACE MODIFIER {custom_slider.raw_display_name}', custom_slider=custom_slider.raw_display_name, throw=False)
-                    return_value = face_modifier.amount/0.01
-                    break
-
-            if return_value is not None:
-                return return_value
-
-            # noinspection PyUnresolvedReferences
-            for aged_face_modifier in facial_attributes.aged_face_modifiers:
-                if aged_face_modifier.amount == 0.0:
-                    continue
-                if custom_slider.has_negative_modifier_id() and aged_face_modifier.key == custom_slider.negative_modifier_id:
-                    self.log.debug(f'Found existing negative aged face modifier value {aged_face_modifier.amount} with key {aged_face_modifier.key}')
-                    if not custom_slider.is_face_modifier:
-                        self.log.format_error_with_message(f'Not an AGED FACE MODIFIER {custom_slider.raw_display_name}', custom_slider=custom_slider.raw_display_name, throw=False)
-                    return_value = (aged_face_modifier.amount * -1.0)/0.01
-                    break
-                if custom_slider.has_positive_modifier_id() and aged_face_modifier.key == custom_slider.positive_modifier_id:
-                    self.log.debug(f'Found existing positive aged face modifier value {aged_face_modifier.amount} with key {aged_face_modifier.key}')
-                    if not custom_slider.is_face_modifier:
-                        self.log.format_error_with_message(f'Not an AGED FACE MODIFIER {custom_slider.raw_display_name}', custom_slider=custom_slider.raw_display_name, throw=False)
-                    return_value = aged_face_modifier.amount/0.01
-                    break
-
-            if return_value is not None:
-                return return_value
-
-            self.log.format_with_message(f'Modifier not found. {custom_slider.raw_display_name}')
-            return_value = 0.0
+            return_value = self._read_slider_value(self._get_facial_modifier_index(sim_info), custom_slider)
             return return_value
         finally:
             if use_persisted_value and applied_sliders is not None and sim_data is not None and current_sim_type is not None:
@@ -278,43 +215,13 @@ class CSFCustomSliderApplicationService(CommonService, HasLog):
 
     def remove_slider(self, sim_info: SimInfo, custom_slider: CSFSlider, trigger_event: bool = True, persist_value: bool = False, **__) -> bool:
         """ Remove a slider from a Sim. """
-        try:
-            if sim_info is None or custom_slider is None:
-                self.log.debug('Missing sim_info or custom_slider')
-                return False
-
-            current_slider_amount = self.get_current_slider_value(sim_info, custom_slider, use_persisted_value=True)
-
-            if persist_value:
-                sim_data = CSFSimSliderSystemData(sim_info)
-                current_sim_type = CommonSimTypeUtils.determine_sim_type(sim_info, use_current_occult_type=True)
-                applied_sliders = sim_data.applied_sliders
-                slider_amount = applied_sliders.get_slider_value(current_sim_type, custom_slider.raw_display_name)
-                if slider_amount is not None:
-                    current_slider_amount = slider_amount
-                applied_sliders.clear_slider_value(current_sim_type, custom_slider.raw_display_name)
-                sim_data.applied_sliders = applied_sliders
-
-            self.log.debug('Applying facial attribute.')
-            modified_facial_attributes = self._get_existing_modifiers_for_edit(sim_info, exclude_modifier_ids=(*custom_slider.get_modifier_ids(), custom_slider.positive_modifier_id, custom_slider.negative_modifier_id))
-
-            self._set_facial_attributes(sim_info, modified_facial_attributes)
-            if trigger_event:
-                from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
-                CommonEventRegistry().dispatch(CSFSliderValueChanged(sim_info, custom_slider, current_slider_amount, 0.0))
-            return True
-        except Exception as ex:
-            CommonExceptionHandler.log_exception(self.mod_identity, f'Error occurred while applying slider: \'{custom_slider.raw_display_name}\'', exception=ex)
+        return self._change_sliders(sim_info, ((custom_slider, None),), trigger_event=trigger_event, persist_value=persist_value)
 
     def remove_slider_by_name(self, sim_info: SimInfo, name: str, trigger_event: bool = True, persist_value: bool = False, **__) -> bool:
         """ Remove a slider with its name. """
         from cncustomsliderframework.sliders.query.slider_query_utils import CSFSliderQueryUtils
         self.log.debug(f'Attempting to remove slider with name {name}')
-        custom_sliders = CSFSliderQueryUtils().get_sliders_by_name(sim_info, name)
-        if not custom_sliders:
-            self.log.debug(f'No sliders found with name: {name}')
-            return False
-        custom_slider = next(iter(custom_sliders))
+        custom_slider = CSFSliderQueryUtils().locate_by_name(sim_info, name)
         if custom_slider is None:
             self.log.debug(f'No slider found with name: {name}')
             return False
@@ -323,90 +230,188 @@ class CSFCustomSliderApplicationService(CommonService, HasLog):
 
     def apply_slider(self, sim_info: SimInfo, custom_slider: CSFSlider, amount: float, trigger_event: bool = True, persist_value: bool = False, **__) -> bool:
         """ Apply a slider to a Sim. """
+        return self._change_sliders(sim_info, ((custom_slider, amount),), trigger_event=trigger_event, persist_value=persist_value)
+
+    def apply_sliders(self, sim_info: SimInfo, slider_amounts: Dict[CSFSlider, float], trigger_event: bool = True, persist_value: bool = False, **__) -> bool:
+        """apply_sliders(sim_info, slider_amounts, trigger_event=True, persist_value=False)
+
+        Apply many sliders to a Sim at once.
+
+        The sliders are applied in order as if they were applied one at a time, but the facial attributes of the Sim are only serialized and resent once and the persisted values are only written once. If applying any slider fails with an error, no slider is changed.
+
+        :param sim_info: An instance of a Sim.
+        :type sim_info: SimInfo
+        :param slider_amounts: The amount to apply for each slider. An amount of zero removes the slider.
+        :type slider_amounts: Dict[CSFSlider, float]
+        :param trigger_event: If True, a CSFSlidersChangedBatch event will be triggered for the sliders that are changed. Default is True.
+        :type trigger_event: bool, optional
+        :param persist_value: If True, the values will be persisted for the Sim. Default is False.
+        :type persist_value: bool, optional
+        :return: True, if every slider was applied. False, if not.
+        :rtype: bool
+        """
+        return self._change_sliders(sim_info, tuple(slider_amounts.items()), trigger_event=trigger_event, persist_value=persist_value)
+
+    def edit_sliders(self, sim_info: SimInfo, trigger_event: bool = True, persist_value: bool = False) -> CSFSliderEditSession:
+        """edit_sliders(sim_info, trigger_event=True, persist_value=False)
+
+        Start a session of Slider changes to a Sim that are applied all at once when the session is committed or not at all when it is rolled back.
+
+        Example usage:
+
+        .. highlight:: python
+        .. code-block:: python
+
+            with CSFCustomSliderApplicationService().edit_sliders(sim_info, persist_value=True) as edit_session:
+                edit_session.apply_slider(custom_slider, 50.0)
+                edit_session.remove_slider(other_custom_slider)
+
+        :param sim_info: An instance of a Sim.
+        :type sim_info: SimInfo
+        :param trigger_event: If True, a CSFSlidersChangedBatch event will be triggered for the sliders that are changed once the session is committed. Default is True.
+        :type trigger_event: bool, optional
+        :param persist_value: If True, the values will be persisted for the Sim. Default is False.
+        :type persist_value: bool, optional
+        :return: A session of Slider changes, committed when used as a context manager and the block completes, rolled back when the block raises an exception.
+        :rtype: CSFSliderEditSession
+        """
+        return CSFSliderEditSession(self, sim_info, trigger_event=trigger_event, persist_value=persist_value)
+
+    def _change_sliders(self, sim_info: SimInfo, slider_changes: Tuple[Tuple[CSFSlider, Union[float, None]], ...], trigger_event: bool = True, persist_value: bool = False) -> bool:
+        # An amount of None removes the slider without checking if it is available for the Sim.
+        if sim_info is None:
+            self.log.debug('Missing sim_info or custom_slider')
+            return False
         try:
-            if sim_info is None or custom_slider is None:
-                self.log.debug('Missing sim_info or custom_slider')
-                return False
+            changed_sliders: List[bool] = list()
+            with self.edit_sliders(sim_info, trigger_event=trigger_event, persist_value=persist_value) as edit_session:
+                for (custom_slider, amount) in slider_changes:
+                    if amount is None:
+                        changed_sliders.append(edit_session.remove_slider(custom_slider))
+                    else:
+                        changed_sliders.append(edit_session.apply_slider(custom_slider, amount))
+            return all(changed_sliders)
+        except Exception as ex:
+            CommonExceptionHandler.log_exception(self.mod_identity, 'Error occurred while applying sliders, no slider was changed.', exception=ex)
+            return False
 
+    def _change_slider(
+        self,
+        sim_info: SimInfo,
+        facial_modifier_set: CSFFacialModifierSet,
+        applied_sliders: CSFAppliedSliderLibraryBySimType,
+        current_sim_type: CommonSimType,
+        custom_slider: CSFSlider,
+        amount: Union[float, None],
+        persist_value: bool
+    ) -> Union[Tuple[float, float, bool], None]:
+        # Returns the previous value, the new value and whether persisted values were changed or None if the slider was not changed.
+        if custom_slider is None:
+            self.log.debug('Missing sim_info or custom_slider')
+            return None
+
+        if amount is not None:
             if not custom_slider.is_available_for(sim_info):
                 self.log.format_with_message('The specified slider is not available for the Sim.', sim=sim_info, slider=custom_slider)
-                return False
+                return None
 
             amount = self._clamp_value(amount, custom_slider)
 
             if amount == 0.0:
                 self.log.format_with_message('Value is Zero, so we will remove the value instead.', slider_name=custom_slider.raw_display_name)
-                return self.remove_slider(sim_info, custom_slider, trigger_event=trigger_event, persist_value=persist_value)
-
-            self.log.debug(f'Determining which slider to use for {custom_slider.raw_display_name} with amount {amount}.')
-            if amount > 0:
-                self.log.debug(f'Amount is greater than 0.0. It is {amount}.')
-                if not custom_slider.has_positive_modifier_id():
-                    self.log.debug('No positive modifier id.')
-                    return False
-                self.log.debug('Has positive modifier id.')
-                slider_amount = amount * 0.01
-                slider_id = custom_slider.positive_modifier_id
-            else:
-                self.log.debug(f'Amount is less than zero. It is {amount}.')
-                if not custom_slider.has_negative_modifier_id():
-                    self.log.debug('No negative modifier id.')
-                    return False
-                self.log.debug('Has negative modifier id.')
-                slider_amount = amount * -0.01
-                slider_id = custom_slider.negative_modifier_id
-
-            if slider_id == 0:
-                self.log.error('Slider key is zero!')
-                return False
-
-            current_slider_amount = self.get_current_slider_value(sim_info, custom_slider, use_persisted_value=True)
+                amount = None
+
+        if amount is None:
+            (current_slider_amount, persisted_values_changed) = self._get_slider_value_for_edit(facial_modifier_set, applied_sliders, current_sim_type, custom_slider)
 
             if persist_value:
-                sim_data = CSFSimSliderSystemData(sim_info)
+                slider_amount = applied_sliders.get_slider_value(current_sim_type, custom_slider.raw_display_name)
+                if slider_amount is not None:
+                    current_slider_amount = slider_amount
+                applied_sliders.clear_slider_value(current_sim_type, custom_slider.raw_display_name)
+                persisted_values_changed = True
+
+            self.log.debug('Applying facial attribute.')
+            facial_modifier_set.remove_modifiers((*custom_slider.get_modifier_ids(), custom_slider.positive_modifier_id, custom_slider.negative_modifier_id))
+            return current_slider_amount, 0.0, persisted_values_changed
+
+        self.log.debug(f'Determining which slider to use for {custom_slider.raw_display_name} with amount {amount}.')
+        if amount > 0:
+            self.log.debug(f'Amount is greater than 0.0. It is {amount}.')
+            if not custom_slider.has_positive_modifier_id():
+                self.log.debug('No positive modifier id.')
+                return None
+            self.log.debug('Has positive modifier id.')
+            slider_amount = amount * 0.01
+            slider_id = custom_slider.positive_modifier_id
+        else:
+            self.log.debug(f'Amount is less than zero. It is {amount}.')
+            if not custom_slider.has_negative_modifier_id():
+                self.log.debug('No negative modifier id.')
+                return None
+            self.log.debug('Has negative modifier id.')
+            slider_amount = amount * -0.01
+            slider_id = custom_slider.negative_modifier_id
+
+        if slider_id == 0:
+            self.log.error('Slider key is zero!')
+            return None
+
+        (current_slider_amount, persisted_values_changed) = self._get_slider_value_for_edit(facial_modifier_set, applied_sliders, current_sim_type, custom_slider)
 
-                current_sim_type = CommonSimTypeUtils.determine_sim_type(sim_info, use_current_occult_type=True)
-                applied_sliders = sim_data.applied_sliders
-                current_slider_amount = applied_sliders.get_slider_value(current_sim_type, custom_slider.raw_display_name)
-                applied_sliders.set_slider_value(current_sim_type, custom_slider.raw_display_name, amount)
-                sim_data.applied_sliders = applied_sliders
+        if persist_value:
+            current_slider_amount = applied_sliders.get_slider_value(current_sim_type, custom_slider.raw_display_name)
+            applied_sliders.set_slider_value(current_sim_type, custom_slider.raw_display_name, amount)
+            persisted_values_changed = True
 
-            self.log.format_with_message(f'Applying facial attribute, current: {current_slider_amount}.')
-            modified_facial_attributes = self._get_existing_modifiers_for_edit(sim_info, exclude_modifier_ids=(*custom_slider.get_modifier_ids(), custom_slider.positive_modifier_id, custom_slider.negative_modifier_id))
+        self.log.format_with_message(f'Applying facial attribute, current: {current_slider_amount}.')
+        facial_modifier_set.remove_modifiers((*custom_slider.get_modifier_ids(), custom_slider.positive_modifier_id, custom_slider.negative_modifier_id))
 
+        if custom_slider.is_face_modifier or custom_slider.is_body_modifier:
             self.log.debug('Adding the custom slider because the amount is greater than zero.')
-            new_modifier = BlobSimFacialCustomizationData().Modifier()
-            new_modifier.key = slider_id
-            new_modifier.amount = self._clamp_value(slider_amount, custom_slider)
-            if custom_slider.is_face_modifier:
-                # noinspection PyUnresolvedReferences
-                modified_facial_attributes.face_modifiers.append(new_modifier)
-                # noinspection PyUnresolvedReferences
-                modified_facial_attributes.aged_face_modifiers.append(new_modifier)
-            elif custom_slider.is_body_modifier:
-                # noinspection PyUnresolvedReferences
-                modified_facial_attributes.body_modifiers.append(new_modifier)
-                # noinspection PyUnresolvedReferences
-                modified_facial_attributes.aged_body_modifiers.append(new_modifier)
-
-            self._set_facial_attributes(sim_info, modified_facial_attributes)
-            if trigger_event:
-                self.log.format_with_message(f'Triggering event with amount {amount}.')
-                from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
-                CommonEventRegistry().dispatch(CSFSliderValueChanged(sim_info, custom_slider, current_slider_amount, amount))
-            return True
-        except Exception as ex:
-            CommonExceptionHandler.log_exception(self.mod_identity, f'Error occurred while applying slider: \'{custom_slider.raw_display_name}\'', exception=ex)
+            facial_modifier_set.add_modifier(slider_id, self._clamp_value(slider_amount, custom_slider), custom_slider.is_face_modifier)
+        return current_slider_amount, amount, persisted_values_changed
+
+    def _get_slider_value_for_edit(
+        self,
+        facial_modifier_set: CSFFacialModifierSet,
+        applied_sliders: CSFAppliedSliderLibraryBySimType,
+        current_sim_type: CommonSimType,
+        custom_slider: CSFSlider
+    ) -> Tuple[float, bool]:
+        # The persisted value is preferred, otherwise the value is read from the modifiers being edited and persisted.
+        slider_value = applied_sliders.get_slider_value(current_sim_type, custom_slider.raw_display_name)
+        if slider_value is not None:
+            return slider_value, False
+        slider_value = self._read_slider_value(facial_modifier_set.index, custom_slider)
+        applied_sliders.set_slider_value(current_sim_type, custom_slider.raw_display_name, slider_value)
+        return slider_value, True
+
+    def _read_slider_value(self, facial_modifier_index: CSFFacialModifierIndex, custom_slider: CSFSlider) -> float:
+        located_modifier = facial_modifier_index.locate_first(
+            custom_slider.negative_modifier_id if custom_slider.has_negative_modifier_id() else 0,
+            custom_slider.positive_modifier_id if custom_slider.has_positive_modifier_id() else 0
+        )
+        if located_modifier is None:
+            self.log.format_with_message(f'Modifier not found. {custom_slider.raw_display_name}')
+            return 0.0
+        (modifier_key, modifier_list, modifier_amount) = located_modifier
+        (modifier_description, expected_modifier_description) = CSFCustomSliderApplicationService._MODIFIER_LIST_DESCRIPTIONS[modifier_list]
+        is_body_modifier_list = modifier_list in (CSFFacialModifierIndex.BODY_MODIFIERS, CSFFacialModifierIndex.AGED_BODY_MODIFIERS)
+        is_negative = custom_slider.has_negative_modifier_id() and modifier_key == custom_slider.negative_modifier_id
+        modifier_sign = 'negative' if is_negative else 'positive'
+        self.log.debug(f'Found existing {modifier_sign} {modifier_description} value {modifier_amount} with key {modifier_key}')
+        if (is_body_modifier_list and not custom_slider.is_body_modifier) or (not is_body_modifier_list and not custom_slider.is_face_modifier):
+            self.log.format_error_with_message(f'Not {expected_modifier_description} {custom_slider.raw_display_name}', custom_slider=custom_slider.raw_display_name, throw=False)
+        if is_negative:
+            return (modifier_amount * -1.0)/0.01
+        return modifier_amount/0.01
 
     def apply_slider_by_name(self, sim_info: SimInfo, name: str, amount: float, trigger_event: bool = True, persist_value: bool = False, **__) -> bool:
         """ Apply a slider with its name. """
         from cncustomsliderframework.sliders.query.slider_query_utils import CSFSliderQueryUtils
         self.log.debug(f'Attempting to apply slider with name {name} and amount {amount}')
-        custom_sliders = CSFSliderQueryUtils().get_sliders_by_name(sim_info, name)
-        if not custom_sliders:
-            self.log.debug(f'No sliders found with name: {name}')
-            return False
-        custom_slider = next(iter(custom_sliders))
+        custom_slider = CSFSliderQueryUtils().locate_by_name(sim_info, name)
         if custom_slider is None:
             self.log.debug(f'No slider found with name: {name}')
             return False
@@ -426,10 +431,17 @@ class CSFCustomSliderApplicationService(CommonService, HasLog):
 
     def apply_random(self, sim_info: SimInfo, custom_slider: CSFSlider, trigger_event: bool = True, persist_value: bool = False, **__) -> bool:
         """ Apply a random value for a slider. """
-        name = custom_slider.raw_display_name
-        amount = random.randint(int(custom_slider.minimum_value), int(custom_slider.maximum_value))
-        self.log.debug(f'Attempting to apply slider with name {name} and amount {amount}')
-        return self.apply_slider(sim_info, custom_slider, amount, trigger_event=trigger_event, persist_value=persist_value)
+        return self.apply_random_sliders(sim_info, (custom_slider,), trigger_event=trigger_event, persist_value=persist_value)
+
+    def apply_random_sliders(self, sim_info: SimInfo, custom_sliders: Iterator[CSFSlider], trigger_event: bool = True, persist_value: bool = False, **__) -> bool:
+        """ Apply a random value for many sliders at once. """
+        slider_amounts: Dict[CSFSlider, float] = dict()
+        for custom_slider in custom_sliders:
+            name = custom_slider.raw_display_name
+            amount = random.randint(int(custom_slider.minimum_value), int(custom_slider.maximum_value))
+            self.log.debug(f'Attempting to apply slider with name {name} and amount {amount}')
+            slider_amounts[custom_slider] = amount
+        return self.apply_sliders(sim_info, slider_amounts, trigger_event=trigger_event, persist_value=persist_value)
 
     def reset_slider(self, sim_info: SimInfo, custom_slider: CSFSlider, trigger_event: bool = True, persist_value: bool = False, **__) -> bool:
         """ Reset a Slider to its default for a Sim. """
@@ -438,8 +450,7 @@ class CSFCustomSliderApplicationService(CommonService, HasLog):
     def reset_all_sliders(self, sim_info: SimInfo, trigger_event: bool = True, persist_value: bool = False, **__) -> bool:
         """ Reset all Custom Sliders for a Sim. """
         from cncustomsliderframework.sliders.query.slider_query_utils import CSFSliderQueryUtils
-        for custom_slider in CSFSliderQueryUtils().get_sliders_for_sim(sim_info):
-            self.reset_slider(sim_info, custom_slider, trigger_event=trigger_event, persist_value=persist_value)
+        self.apply_sliders(sim_info, {custom_slider: 0.0 for custom_slider in CSFSliderQueryUtils().get_sliders_for_sim(sim_info)}, trigger_event=trigger_event, persist_value=persist_value)
         return True
 
     def _clamp_value(self, value: float, custom_slider: CSFSlider) -> float:
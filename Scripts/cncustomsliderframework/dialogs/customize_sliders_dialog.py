@@ -6,8 +6,7 @@ https://creativecommons.org/licenses/by-nd/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from collections import defaultdict
-from typing import Callable, Tuple, List, Dict
+from typing import Callable, Tuple
 
 from cncustomsliderframework.custom_slider_application_service import CSFCustomSliderApplicationService
 from cncustomsliderframework.dialogs.slider_template_dialog import CSFSliderTemplateDialog
@@ -15,6 +14,8 @@ from cncustomsliderframework.dtos.sliders.slider import CSFSlider
 from cncustomsliderframework.enums.string_ids import CSFStringId
 from cncustomsliderframework.modinfo import ModInfo
 from cncustomsliderframework.enums.slider_category import CSFSliderCategory
+from cncustomsliderframework.commonlib.dialogs.option_dialogs.options.objects.common_dialog_input_text_option import \
+    CommonDialogInputTextOption
 from sims.sim_info import SimInfo
 from sims4.resources import Types
 from sims4communitylib.dialogs.common_choice_outcome import CommonChoiceOutcome
@@ -40,6 +41,8 @@ from sims4communitylib.utils.misc.common_text_utils import CommonTextUtils
 
 class CSFCustomizeSlidersDialog(HasLog):
     """ A dialog for changing custom sliders. """
+    MAXIMUM_SEARCH_RESULTS = 50
+
     def __init__(self, on_close: Callable[[], None] = CommonFunctionUtils.noop):
         from cncustomsliderframework.sliders.query.slider_query_utils import CSFSliderQueryUtils
         super().__init__()
@@ -108,6 +111,29 @@ class CSFCustomizeSlidersDialog(HasLog):
                 mod_identity=self.mod_identity
             ).show(on_ok_selected=_on_confirm, on_cancel_selected=_on_cancel)
 
+        def _on_search(_: str, search_text: str, outcome: CommonChoiceOutcome) -> None:
+            if search_text is None or CommonChoiceOutcome.is_error_or_cancel(outcome):
+                self.log.debug('No search text entered.')
+                _reopen()
+                return
+            self._search_sliders(sim_info, search_text, on_close=_reopen)
+
+        option_dialog.add_option(
+            CommonDialogInputTextOption(
+                self.mod_identity,
+                'Search Sliders',
+                '',
+                CommonDialogOptionContext(
+                    CSFStringId.SEARCH_SLIDERS_NAME,
+                    CSFStringId.SEARCH_SLIDERS_DESCRIPTION,
+                    tag_list=[slider_category.name for slider_category in CSFSliderCategory.values]
+                ),
+                on_chosen=_on_search,
+                always_visible=True,
+                dialog_description_identifier=CSFStringId.SEARCH_SLIDERS_TEXT_DESCRIPTION
+            )
+        )
+
         self.log.debug('Opening Customize Slider dialog.')
 
         option_dialog.add_option(
@@ -122,11 +148,12 @@ class CSFCustomizeSlidersDialog(HasLog):
             )
         )
 
-        sliders: Tuple[CSFSlider] = self._slider_query_utils.get_sliders_for_sim(sim_info)
+        category_view = self._slider_query_utils.get_category_view_for_sim(sim_info)
 
-        if not sliders:
+        if not category_view.sliders:
             from cncustomsliderframework.sliders.slider_query_registry import CSFSliderQueryRegistry
-            if CSFSliderQueryRegistry()._collecting:
+            # Once Sliders have been organized, queries keep being answered while they are collected again.
+            if CSFSliderQueryRegistry()._collecting and CSFSliderQueryRegistry().generation == 0:
                 CommonOkDialog(
                     CSFStringId.SLIDERS_ARE_STILL_LOADING,
                     CSFStringId.SLIDERS_ARE_STILL_LOADING_DESCRIPTION,
@@ -136,33 +163,25 @@ class CSFCustomizeSlidersDialog(HasLog):
             else:
                 CommonOkDialog(
                     CSFStringId.NO_SLIDERS_FOUND,
-                    CSFStringId.NO_SLIDERS_FOUND,
+                    CSFStringId.NO_SLIDERS_FOUND_DESCRIPTION,
                     mod_identity=ModInfo.get_identity()
                 ).show()
             _on_close()
             return
 
-        self.log.debug('Adding slider count {}'.format(len(sliders)))
-        sorted_sliders = sorted(sliders, key=lambda s: s.name)
-        sliders_by_category: Dict[CSFSliderCategory, List[CSFSlider]] = defaultdict(list)
-        for custom_slider in sorted_sliders:
-            for slider_category in custom_slider.categories:
-                if custom_slider in sliders_by_category[slider_category]:
-                    continue
-                sliders_by_category[slider_category].append(custom_slider)
+        self.log.debug('Adding slider count {}'.format(len(category_view.sliders)))
 
-        def _on_category_chosen(_: str, _chosen: Tuple[CSFSliderCategory, List[CSFSlider]]):
+        def _on_category_chosen(_: str, _chosen: Tuple[CSFSliderCategory, Tuple[CSFSlider]]):
             if _chosen is None:
                 self.log.debug('No slider chosen, dialog closed.')
                 _on_close()
                 return
             _chosen_category = _chosen[0]
             _chosen_sliders = _chosen[1]
-            self._change_by_category(sim_info, _chosen_category, tuple(_chosen_sliders), on_close=_reopen)
+            self._change_by_category(sim_info, _chosen_category, _chosen_sliders, on_close=_reopen)
 
-        for (category, _sliders) in sliders_by_category.items():
-            if not _sliders:
-                continue
+        for category in category_view.categories:
+            _sliders = category_view.get_sliders(category)
             option_dialog.add_option(
                 CommonDialogSelectOption(
                     category.name,
@@ -206,10 +225,7 @@ class CSFCustomizeSlidersDialog(HasLog):
 
             def _on_confirm(_) -> None:
                 self.log.debug('Randomizing all sliders in category {}.'.format(category_name))
-                for slider in sliders:
-                    if category not in slider.categories:
-                        continue
-                    self.slider_application_service.apply_random(sim_info, slider, trigger_event=True, persist_value=True)
+                self.slider_application_service.apply_random_sliders(sim_info, [slider for slider in sliders if category in slider.categories], trigger_event=True, persist_value=True)
                 _reopen()
 
             def _on_cancel(_) -> None:
@@ -248,37 +264,81 @@ class CSFCustomizeSlidersDialog(HasLog):
             self._change_or_remove_slider_option(sim_info, _custom_slider, on_close=_reopen)
 
         for custom_slider in sliders:
-            if slider_category not in custom_slider.categories:
-                continue
-            if custom_slider.description is not None:
-                # noinspection PyTypeChecker
-                option_description = CommonLocalizationUtils.create_localized_string(custom_slider.description, tokens=(str(0.0), str(custom_slider.minimum_value), str(custom_slider.maximum_value)))
-            else:
-                # noinspection PyTypeChecker
-                option_description = CommonLocalizationUtils.create_localized_string(CSFStringId.CHANGE_THE_SLIDER, tokens=(custom_slider.display_name, ))
+            option_dialog.add_option(self._create_slider_option(sim_info, custom_slider, _on_slider_changed))
+
+        option_dialog.show(
+            sim_info=sim_info,
+            page=page
+        )
 
-            slider_value = self.slider_application_service.get_current_slider_value(sim_info, custom_slider, use_persisted_value=True)
+    def _search_sliders(self, sim_info: SimInfo, search_text: str, on_close: Callable[[], None], page: int = 1):
+        def _on_close() -> None:
+            self.log.debug('Search Sliders dialog closed.')
+            if on_close is not None:
+                on_close()
 
-            option_dialog.add_option(
-                CommonDialogSelectOption(
-                    custom_slider.unique_identifier,
-                    custom_slider,
-                    CommonDialogOptionContext(
-                        custom_slider.display_name,
-                        CommonLocalizationUtils.combine_localized_strings((option_description, str(CommonTextUtils.to_truncated_decimal(slider_value))), separator=CommonLocalizedStringSeparator.SPACE_PARENTHESIS_SURROUNDED),
-                        title_tokens=(str(slider_value),),
-                        icon=CommonResourceUtils.get_resource_key(Types.PNG, custom_slider.icon_id) if custom_slider.icon_id else None,
-                        tag_list=tuple([category.name for category in custom_slider.categories])
-                    ),
-                    on_chosen=_on_slider_changed
-                )
-            )
+        def _reopen() -> None:
+            self.log.debug('Reopening search sliders dialog.')
+            self._search_sliders(sim_info, search_text, on_close=on_close, page=option_dialog.current_page)
+
+        self.log.format_with_message('Searching sliders.', search_text=search_text)
+        sliders: Tuple[CSFSlider] = self._slider_query_utils.search_sliders_for_sim(sim_info, search_text, limit=CSFCustomizeSlidersDialog.MAXIMUM_SEARCH_RESULTS)
+        if not sliders:
+            CommonOkDialog(
+                CSFStringId.NO_SLIDERS_FOUND,
+                CSFStringId.NO_SLIDERS_MATCH_SEARCH_DESCRIPTION,
+                description_tokens=(search_text,),
+                mod_identity=self.mod_identity
+            ).show(on_acknowledged=lambda *_, **__: _on_close())
+            return
+
+        option_dialog = CommonChooseObjectOptionDialog(
+            CSFStringId.CUSTOMIZE_SLIDERS,
+            CSFStringId.CHOOSE_SLIDERS_TO_MODIFY,
+            mod_identity=self.mod_identity,
+            on_close=_on_close,
+            per_page=400
+        )
+
+        def _on_slider_chosen(slider_unique_identifier: str, _custom_slider: CSFSlider):
+            if slider_unique_identifier is None or _custom_slider is None:
+                self.log.debug('No slider chosen, dialog closed.')
+                _on_close()
+                return
+            self._change_or_remove_slider_option(sim_info, _custom_slider, on_close=_reopen)
+
+        # Sliders are shown best match first.
+        for custom_slider in sliders:
+            option_dialog.add_option(self._create_slider_option(sim_info, custom_slider, _on_slider_chosen))
 
         option_dialog.show(
             sim_info=sim_info,
             page=page
         )
 
+    def _create_slider_option(self, sim_info: SimInfo, custom_slider: CSFSlider, on_chosen: Callable[[str, CSFSlider], None]) -> CommonDialogSelectOption:
+        if custom_slider.description is not None:
+            # noinspection PyTypeChecker
+            option_description = CommonLocalizationUtils.create_localized_string(custom_slider.description, tokens=(str(0.0), str(custom_slider.minimum_value), str(custom_slider.maximum_value)))
+        else:
+            # noinspection PyTypeChecker
+            option_description = CommonLocalizationUtils.create_localized_string(CSFStringId.CHANGE_THE_SLIDER, tokens=(custom_slider.display_name, ))
+
+        slider_value = self.slider_application_service.get_current_slider_value(sim_info, custom_slider, use_persisted_value=True)
+
+        return CommonDialogSelectOption(
+            custom_slider.unique_identifier,
+            custom_slider,
+            CommonDialogOptionContext(
+                custom_slider.display_name,
+                CommonLocalizationUtils.combine_localized_strings((option_description, str(CommonTextUtils.to_truncated_decimal(slider_value))), separator=CommonLocalizedStringSeparator.SPACE_PARENTHESIS_SURROUNDED),
+                title_tokens=(str(slider_value),),
+                icon=CommonResourceUtils.get_resource_key(Types.PNG, custom_slider.icon_id) if custom_slider.icon_id else None,
+                tag_list=tuple([category.name for category in custom_slider.categories])
+            ),
+            on_chosen=on_chosen
+        )
+
     def _change_or_remove_slider_option(
         self,
         sim_info: SimInfo,
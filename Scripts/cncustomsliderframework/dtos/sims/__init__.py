@@ -0,0 +1,8 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
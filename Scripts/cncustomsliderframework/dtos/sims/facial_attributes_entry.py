@@ -0,0 +1,43 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from cncustomsliderframework.dtos.sims.facial_modifier_index import CSFFacialModifierIndex
+from protocolbuffers.PersistenceBlobs_pb2 import BlobSimFacialCustomizationData
+
+
+class CSFFacialAttributesEntry:
+    """ The facial attributes of a Sim parsed from serialized bytes, along with the bytes they were parsed from.
+
+    The modifiers of the facial attributes are indexed by key the first time the index is needed.
+
+    """
+    def __init__(self, serialized_facial_attributes: bytes, facial_attributes: BlobSimFacialCustomizationData) -> None:
+        self._serialized_facial_attributes = serialized_facial_attributes
+        self._facial_attributes = facial_attributes
+        self._modifier_index: CSFFacialModifierIndex = None
+
+    @property
+    def serialized_facial_attributes(self) -> bytes:
+        """ The serialized bytes the facial attributes were parsed from. """
+        return self._serialized_facial_attributes
+
+    @property
+    def facial_attributes(self) -> BlobSimFacialCustomizationData:
+        """ The parsed facial attributes. They are shared and must not be modified. """
+        return self._facial_attributes
+
+    @property
+    def modifier_index(self) -> CSFFacialModifierIndex:
+        """ The modifiers of the facial attributes organized by key. """
+        if self._modifier_index is None:
+            self._modifier_index = CSFFacialModifierIndex(self._facial_attributes)
+        return self._modifier_index
+
+    def is_parsed_from(self, serialized_facial_attributes: bytes) -> bool:
+        """ Determine if the facial attributes were parsed from the serialized bytes. """
+        return self._serialized_facial_attributes is serialized_facial_attributes or self._serialized_facial_attributes == serialized_facial_attributes
@@ -0,0 +1,72 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Dict, Tuple, Union
+
+from protocolbuffers.PersistenceBlobs_pb2 import BlobSimFacialCustomizationData
+
+
+class CSFFacialModifierIndex:
+    """ The modifiers of the facial attributes of a Sim organized by key.
+
+    Modifier lists are read in the order body, aged body, face and aged face. For each key, only the first modifier with a non-zero amount is kept, along with the list it was found in.
+
+    """
+    BODY_MODIFIERS = 'body_modifiers'
+    AGED_BODY_MODIFIERS = 'aged_body_modifiers'
+    FACE_MODIFIERS = 'face_modifiers'
+    AGED_FACE_MODIFIERS = 'aged_face_modifiers'
+    MODIFIER_LISTS: Tuple[str] = (BODY_MODIFIERS, AGED_BODY_MODIFIERS, FACE_MODIFIERS, AGED_FACE_MODIFIERS)
+
+    def __init__(self, facial_attributes: BlobSimFacialCustomizationData) -> None:
+        self._modifiers_by_key: Dict[int, Tuple[int, str, float]] = dict()
+        for modifier_list in CSFFacialModifierIndex.MODIFIER_LISTS:
+            for modifier in getattr(facial_attributes, modifier_list):
+                if modifier.amount == 0.0 or modifier.key in self._modifiers_by_key:
+                    continue
+                self._modifiers_by_key[modifier.key] = (len(self._modifiers_by_key), modifier_list, modifier.amount)
+
+    @property
+    def number_of_keys(self) -> int:
+        """ The number of keys with a non-zero amount. """
+        return len(self._modifiers_by_key)
+
+    def get_modifier(self, key: int) -> Union[Tuple[str, float], None]:
+        """get_modifier(key)
+
+        Retrieve the first modifier with a key.
+
+        :param key: The key of a modifier.
+        :type key: int
+        :return: The modifier list the modifier was found in and its amount or None if no modifier with a non-zero amount has the key.
+        :rtype: Union[Tuple[str, float], None]
+        """
+        modifier = self._modifiers_by_key.get(key, None)
+        if modifier is None:
+            return None
+        return modifier[1], modifier[2]
+
+    def locate_first(self, negative_key: int, positive_key: int) -> Union[Tuple[int, str, float], None]:
+        """locate_first(negative_key, positive_key)
+
+        Locate whichever of two keys comes first in the modifier lists. When both keys are the same, the negative key is located.
+
+        :param negative_key: The negative key of a Slider or zero if the Slider has none.
+        :type negative_key: int
+        :param positive_key: The positive key of a Slider or zero if the Slider has none.
+        :type positive_key: int
+        :return: The key that was located, the modifier list it was found in and its amount or None if neither key has a modifier with a non-zero amount.
+        :rtype: Union[Tuple[int, str, float], None]
+        """
+        negative_modifier = self._modifiers_by_key.get(negative_key, None) if negative_key != 0 else None
+        positive_modifier = self._modifiers_by_key.get(positive_key, None) if positive_key != 0 else None
+        if negative_modifier is not None and (positive_modifier is None or negative_modifier[0] <= positive_modifier[0]):
+            return negative_key, negative_modifier[1], negative_modifier[2]
+        if positive_modifier is not None:
+            return positive_key, positive_modifier[1], positive_modifier[2]
+        return None
@@ -0,0 +1,77 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, Iterator, List
+
+from cncustomsliderframework.dtos.sims.facial_modifier_index import CSFFacialModifierIndex
+from protocolbuffers.PersistenceBlobs_pb2 import BlobSimFacialCustomizationData
+
+
+class CSFFacialModifierSet:
+    """ An editable copy of the modifiers and sculpts of the facial attributes of a Sim.
+
+    Modifiers are removed and added in memory and are only turned into facial attributes once all changes have been made.
+
+    """
+    def __init__(self, facial_attributes: BlobSimFacialCustomizationData) -> None:
+        # The modifiers of the facial attributes are shared, they are only copied when facial attributes are created.
+        self.body_modifiers: List[Any] = list(facial_attributes.body_modifiers)
+        self.aged_body_modifiers: List[Any] = list(facial_attributes.aged_body_modifiers)
+        self.face_modifiers: List[Any] = list(facial_attributes.face_modifiers)
+        self.aged_face_modifiers: List[Any] = list(facial_attributes.aged_face_modifiers)
+        self.sculpts: List[int] = list(facial_attributes.sculpts)
+        self._index: CSFFacialModifierIndex = None
+
+    @property
+    def index(self) -> CSFFacialModifierIndex:
+        """ The modifiers of the set organized by key. """
+        if self._index is None:
+            self._index = CSFFacialModifierIndex(self)
+        return self._index
+
+    def remove_modifiers(self, modifier_ids: Iterator[int]) -> None:
+        """ Remove every modifier with one of the modifier ids. """
+        modifier_ids = set(modifier_ids)
+        for modifier_list in CSFFacialModifierIndex.MODIFIER_LISTS:
+            modifiers: List[Any] = getattr(self, modifier_list)
+            if any(modifier.key in modifier_ids for modifier in modifiers):
+                setattr(self, modifier_list, [modifier for modifier in modifiers if modifier.key not in modifier_ids])
+                self._index = None
+
+    def add_modifier(self, modifier_id: int, amount: float, is_face_modifier: bool) -> None:
+        """add_modifier(modifier_id, amount, is_face_modifier)
+
+        Add a modifier to both the face modifiers and the aged face modifiers or to both the body modifiers and the aged body modifiers.
+
+        :param modifier_id: The key of the modifier.
+        :type modifier_id: int
+        :param amount: The amount of the modifier.
+        :type amount: float
+        :param is_face_modifier: If True, the modifier is added to the face modifiers. If False, it is added to the body modifiers.
+        :type is_face_modifier: bool
+        """
+        new_modifier = BlobSimFacialCustomizationData().Modifier()
+        new_modifier.key = modifier_id
+        new_modifier.amount = amount
+        if is_face_modifier:
+            self.face_modifiers.append(new_modifier)
+            self.aged_face_modifiers.append(new_modifier)
+        else:
+            self.body_modifiers.append(new_modifier)
+            self.aged_body_modifiers.append(new_modifier)
+        self._index = None
+
+    def to_facial_attributes(self) -> BlobSimFacialCustomizationData:
+        """ Create facial attributes containing the modifiers and sculpts of the set. """
+        facial_attributes = BlobSimFacialCustomizationData()
+        for modifier_list in CSFFacialModifierIndex.MODIFIER_LISTS:
+            for modifier in getattr(self, modifier_list):
+                getattr(facial_attributes, modifier_list).append(modifier)
+        for sculpt in self.sculpts:
+            facial_attributes.sculpts.append(sculpt)
+        return facial_attributes
@@ -0,0 +1,83 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Tuple
+
+from sims4communitylib.enums.common_age import CommonAge
+from sims4communitylib.enums.common_gender import CommonGender
+from sims4communitylib.enums.common_occult_type import CommonOccultType
+from sims4communitylib.enums.common_species import CommonSpecies
+from sims4communitylib.enums.sim_type import CommonSimType
+
+
+class CSFSimDetails:
+    """ The details of a Sim that determine which Sliders are available to it and where its Slider values are stored. """
+    def __init__(
+        self,
+        gender: CommonGender,
+        age: CommonAge,
+        species: CommonSpecies,
+        occult_type: CommonOccultType,
+        sim_type: CommonSimType
+    ):
+        self._gender = gender
+        self._age = age
+        self._species = species
+        self._occult_type = occult_type
+        self._sim_type = sim_type
+        self._availability_key = (gender, age, species, occult_type)
+
+    @property
+    def gender(self) -> CommonGender:
+        """ The gender of the Sim. """
+        return self._gender
+
+    @property
+    def age(self) -> CommonAge:
+        """ The age of the Sim. """
+        return self._age
+
+    @property
+    def species(self) -> CommonSpecies:
+        """ The species of the Sim. """
+        return self._species
+
+    @property
+    def occult_type(self) -> CommonOccultType:
+        """ The current occult type of the Sim. """
+        return self._occult_type
+
+    @property
+    def sim_type(self) -> CommonSimType:
+        """ The sim type of the Sim, taking its current occult type into account. """
+        return self._sim_type
+
+    @property
+    def availability_key(self) -> Tuple[CommonGender, CommonAge, CommonSpecies, CommonOccultType]:
+        """ The gender, age, species and current occult type of the Sim. """
+        return self._availability_key
+
+    def __eq__(self, other: 'CSFSimDetails') -> bool:
+        if not isinstance(other, CSFSimDetails):
+            return False
+        return self.availability_key == other.availability_key and self.sim_type == other.sim_type
+
+    def __hash__(self) -> int:
+        return hash((self._availability_key, self._sim_type))
+
+    def __repr__(self) -> str:
+        return '<gender: {}, age: {}, species: {}, occult_type: {}, sim_type: {}>'.format(
+            self.gender,
+            self.age,
+            self.species,
+            self.occult_type,
+            self.sim_type
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
@@ -19,6 +19,7 @@ from sims4communitylib.enums.common_age import CommonAge
 from sims4communitylib.enums.common_gender import CommonGender
 from sims4communitylib.enums.common_occult_type import CommonOccultType
 from sims4communitylib.enums.common_species import CommonSpecies
+from sims4communitylib.enums.sim_type import CommonSimType
 from sims4communitylib.utils.common_log_registry import CommonLog
 from sims4communitylib.utils.localization.common_localization_utils import CommonLocalizationUtils
 
@@ -40,6 +41,7 @@ class CSFSlider:
         maximum_value: float=100.0,
         positive_modifier_id: int=0,
         negative_modifier_id: int=0,
+        available_for_sim_types: Tuple[CommonSimType]=(),
     ):
         self._display_name = display_name
         self._raw_display_name = raw_display_name
@@ -47,6 +49,7 @@ class CSFSlider:
         self._author = author
         self._icon_id = icon_id
         self._available_for = available_for
+        self._available_for_sim_types = available_for_sim_types
         self._categories = categories
         category_names: List[str] = list()
         for slider_category in self.categories:
@@ -61,6 +64,8 @@ class CSFSlider:
         self._unique_identifier = None
         self._tags = tags
         self._modifier_type = modifier_type
+        self._availability_mask: Union[int, None] = None
+        self._has_availability_mask = False
 
     @property
     def unique_identifier(self) -> str:
@@ -140,6 +145,20 @@ class CSFSlider:
         """ Availability of the slider. """
         return self._available_for
 
+    @property
+    def available_for_sim_types(self) -> Tuple[CommonSimType]:
+        """ The sim types the slider is available for. Empty if the slider is available for every sim type. """
+        return self._available_for_sim_types
+
+    @property
+    def availability_mask(self) -> Union[int, None]:
+        """ A mask of the genders, ages, species, occult types and sim types the slider is available for. None if availability has to be checked against the Sim instead. """
+        if not self._has_availability_mask:
+            from cncustomsliderframework.sliders.slider_availability import CSFSliderAvailability
+            self._availability_mask = CSFSliderAvailability.get_slider_mask(self.available_for, self.available_for_sim_types)
+            self._has_availability_mask = True
+        return self._availability_mask
+
     @property
     def modifier_type(self) -> CSFModifierType:
         """ The type of modifier the slider is. """
@@ -176,9 +195,31 @@ class CSFSlider:
             tags.append(str(part_tag))
         return tuple(tags)
 
-    def is_available_for(self, sim_info: SimInfo) -> bool:
-        """ Determine if available for a Sim. """
-        return self.available_for.is_available_for(sim_info)
+    def is_available_for(self, sim_info: SimInfo, sim_signature: int=None) -> bool:
+        """is_available_for(sim_info, sim_signature=None)
+
+        Determine if available for a Sim.
+
+        :param sim_info: An instance of a Sim.
+        :type sim_info: SimInfo
+        :param sim_signature: The availability signature of the Sim, to avoid retrieving it for every slider. Default is the cached signature of the Sim.
+        :type sim_signature: int, optional
+        :return: True, if the slider is available for the Sim. False, if not.
+        :rtype: bool
+        """
+        availability_mask = self.availability_mask
+        if availability_mask is not None:
+            if sim_signature is None:
+                from cncustomsliderframework.sliders.slider_availability import CSFSliderAvailability
+                sim_signature = CSFSliderAvailability().get_sim_signature(sim_info)
+            if sim_signature is not None:
+                return availability_mask & sim_signature == sim_signature
+        if not self.available_for.is_available_for(sim_info):
+            return False
+        if self.available_for_sim_types:
+            from cncustomsliderframework.sim_details_cache import CSFSimDetailsCache
+            return CSFSimDetailsCache().get_details(sim_info).sim_type in self.available_for_sim_types
+        return True
 
     def has_positive_modifier_id(self) -> bool:
         """ Determine if this slider has a positive modifier id. """
@@ -218,7 +259,7 @@ class CSFSlider:
         return hash((str(self.positive_modifier_id), str(self.negative_modifier_id), self.raw_display_name))
 
     def __repr__(self) -> str:
-        return '<display_name: {}, raw_display_name: {}, author:{}, icon_id {}, minimum_value:{}, maximum_value:{}, positive_modifier_id:{}, negative_modifier_id:{}, available_for: {}>'\
+        return '<display_name: {}, raw_display_name: {}, author:{}, icon_id {}, minimum_value:{}, maximum_value:{}, positive_modifier_id:{}, negative_modifier_id:{}, available_for: {}, available_for_sim_types: {}>'\
             .format(
                 self.display_name,
                 self.raw_display_name,
@@ -228,7 +269,8 @@ class CSFSlider:
                 self.maximum_value,
                 self.positive_modifier_id,
                 self.negative_modifier_id,
-                pformat(self.available_for)
+                pformat(self.available_for),
+                self.available_for_sim_types
             )
 
     def __str__(self) -> str:
@@ -281,7 +323,11 @@ class CSFSlider:
         if not available_for_genders and not available_for_ages and not available_for_species:
             log.warn('No Genders, Ages, or Species specified for slider \'{}\''.format(error_display_name))
             return None
-        available_for = CommonAvailableForSim(available_for_genders, available_for_ages, available_for_species, [occult_type for occult_type in CommonOccultType.values if occult_type != CommonOccultType.NONE])
+        available_for_occult_types: Tuple[CommonOccultType] = tuple(getattr(package_slider, 'available_for_occult_types', tuple()))
+        if not available_for_occult_types:
+            available_for_occult_types = tuple([occult_type for occult_type in CommonOccultType.values if occult_type != CommonOccultType.NONE])
+        available_for = CommonAvailableForSim(available_for_genders, available_for_ages, available_for_species, available_for_occult_types)
+        available_for_sim_types: Tuple[CommonSimType] = tuple(getattr(package_slider, 'available_for_sim_types', tuple()))
 
         tags = tuple(getattr(package_slider, 'tags', tuple()))
 
@@ -298,5 +344,6 @@ class CSFSlider:
             minimum_value=minimum_value,
             maximum_value=maximum_value,
             positive_modifier_id=positive_modifier_id,
-            negative_modifier_id=negative_modifier_id
+            negative_modifier_id=negative_modifier_id,
+            available_for_sim_types=available_for_sim_types
         )
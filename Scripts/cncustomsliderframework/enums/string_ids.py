@@ -42,6 +42,12 @@ class CSFStringId(CommonInt):
 
     NO_SLIDERS_FOUND = 886996514
     NO_SLIDERS_FOUND_DESCRIPTION = 1894623033
+    # Tokens: {0.String} (Search Text)
+    NO_SLIDERS_MATCH_SEARCH_DESCRIPTION = 0x248C4046
+
+    SEARCH_SLIDERS_NAME = 0xAAFF1DD1
+    SEARCH_SLIDERS_DESCRIPTION = 0x6551012E
+    SEARCH_SLIDERS_TEXT_DESCRIPTION = 0x0ECB9246
 
     # Slider Templates
     SLIDER_TEMPLATES_NAME = 3234288887
@@ -12,7 +12,11 @@ from sims4communitylib.events.event_handling.common_event import CommonEvent
 
 
 class CSFSliderValueChanged(CommonEvent):
-    """An event that occurs when a slider value has been changed on a Sim."""
+    """An event that occurs when a slider value has been changed on a Sim.
+
+    The event is only triggered while a mod has opted in with :func:`CSFCustomSliderApplicationService.enable_slider_value_changed_events`, otherwise only a :class:`CSFSlidersChangedBatch` event is triggered for all sliders changed together.
+
+    """
 
     def __init__(self, sim_info: SimInfo, slider: CSFSlider, old_value: float, new_value: float):
         self._sim_info = sim_info
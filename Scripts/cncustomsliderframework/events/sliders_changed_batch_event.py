@@ -0,0 +1,58 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Tuple, Union
+
+from cncustomsliderframework.dtos.sliders.slider import CSFSlider
+from sims.sim_info import SimInfo
+from sims4communitylib.events.event_handling.common_event import CommonEvent
+
+
+class CSFSlidersChangedBatch(CommonEvent):
+    """An event that occurs once when one or more slider values have been changed on a Sim at the same time, such as when applying a template or resetting all sliders."""
+
+    def __init__(self, sim_info: SimInfo, changed_values: Tuple[Tuple[CSFSlider, float, float]]):
+        self._sim_info = sim_info
+        self._changed_values = changed_values
+
+    @property
+    def sim_info(self) -> SimInfo:
+        """The Sim that changed."""
+        return self._sim_info
+
+    @property
+    def changed_values(self) -> Tuple[Tuple[CSFSlider, float, float]]:
+        """The sliders that changed along with the value they were at before the change and the value they are now at, in the order they were changed."""
+        return self._changed_values
+
+    @property
+    def sliders(self) -> Tuple[CSFSlider]:
+        """The sliders that changed."""
+        return tuple([slider for (slider, _, _) in self._changed_values])
+
+    def get_values(self, slider: CSFSlider) -> Union[Tuple[float, float], None]:
+        """get_values(slider)
+
+        Retrieve the values of a slider that changed. When a slider changed more than once, the value before the first change and the value after the last change are returned.
+
+        :param slider: A slider.
+        :type slider: CSFSlider
+        :return: The value the slider was at before the change and the value it is now at or None if the slider did not change.
+        :rtype: Union[Tuple[float, float], None]
+        """
+        old_value = None
+        new_value = None
+        for (changed_slider, changed_old_value, changed_new_value) in self._changed_values:
+            if changed_slider != slider:
+                continue
+            if new_value is None:
+                old_value = changed_old_value
+            new_value = changed_new_value
+        if new_value is None:
+            return None
+        return old_value, new_value
@@ -7,7 +7,7 @@ https://creativecommons.org/licenses/by-nd/4.0/legalcode
 Copyright (c) COLONOLNUTTY
 """
 from pprint import pformat
-from typing import Tuple, Callable, List
+from typing import Tuple, Callable, List, FrozenSet, Any, Union
 
 from cncustomsliderframework.enums.query_type import CSFQueryType
 from cncustomsliderframework.queries.query_tag import CSFQueryTag
@@ -26,6 +26,7 @@ class CSFQuery:
         self._include_all_tags = None
         self._include_any_tags = None
         self._exclude_tags = None
+        self._signature = None
 
     @property
     def include_all_tags(self) -> Tuple[CSFQueryTag]:
@@ -72,6 +73,23 @@ class CSFQuery:
                 tags.append(tag)
         return tuple(tags)
 
+    @property
+    def signature(self) -> Tuple[FrozenSet[Union[Tuple[Any, Any], None]], FrozenSet[Union[Tuple[Any, Any], None]], FrozenSet[Union[Tuple[Any, Any], None]], CSFQueryType]:
+        """ A normalized signature of the query. Queries with the same signature locate the same things, regardless of the order of their filters. """
+        if self._signature is not None:
+            return self._signature
+
+        def _to_keys(tags: Tuple[CSFQueryTag]) -> FrozenSet[Union[Tuple[Any, Any], None]]:
+            return frozenset([tag.key if tag is not None else None for tag in tags])
+
+        self._signature = (
+            _to_keys(self.include_all_tags),
+            _to_keys(self.include_any_tags),
+            _to_keys(self.exclude_tags),
+            self.query_type
+        )
+        return self._signature
+
     @property
     def query_type(self) -> CSFQueryType:
         """ The type of query. """
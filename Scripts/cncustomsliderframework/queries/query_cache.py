@@ -0,0 +1,163 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Union
+
+
+class CSFQueryCache:
+    """ A size bound cache of query results with least recently used eviction.
+
+    The cache is versioned by a generation. Results stored for any other generation than the current one are discarded.
+
+    """
+    def __init__(self, max_size: int=128):
+        self._max_size = max_size
+        self._generation = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        """ The maximum number of results kept. A size of zero disables the cache. """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        self._max_size = max(0, value)
+        self._evict()
+
+    @property
+    def generation(self) -> int:
+        """ The generation results are currently stored for. """
+        return self._generation
+
+    @property
+    def size(self) -> int:
+        """ The number of results currently stored. """
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        """ The number of times a result was found. """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """ The number of times a result was not found. """
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """ The number of results discarded to stay within the size bound. """
+        return self._evictions
+
+    def get(self, generation: int, signature: Hashable) -> Union[Any, None]:
+        """get(generation, signature)
+
+        Retrieve a stored result.
+
+        :param generation: The generation the result is needed for.
+        :type generation: int
+        :param signature: The normalized signature of the query.
+        :type signature: Hashable
+        :return: The stored result or None if no result is stored for the signature.
+        :rtype: Union[Any, None]
+        """
+        self._update_generation(generation)
+        result = self._entries.get(signature, None)
+        if result is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(signature)
+        return result
+
+    def peek(self, generation: int, signature: Hashable) -> Union[Any, None]:
+        """peek(generation, signature)
+
+        Retrieve a stored result without counting a hit or a miss and without marking the result as recently used.
+
+        :param generation: The generation the result is needed for.
+        :type generation: int
+        :param signature: The normalized signature of the query.
+        :type signature: Hashable
+        :return: The stored result or None if no result is stored for the signature.
+        :rtype: Union[Any, None]
+        """
+        if generation != self._generation:
+            return None
+        return self._entries.get(signature, None)
+
+    def put(self, generation: int, signature: Hashable, result: Any) -> None:
+        """put(generation, signature, result)
+
+        Store a result.
+
+        :param generation: The generation the result was produced for.
+        :type generation: int
+        :param signature: The normalized signature of the query.
+        :type signature: Hashable
+        :param result: The result of the query.
+        :type result: Any
+        """
+        self._update_generation(generation)
+        if self._max_size <= 0 or result is None:
+            return
+        self._entries[signature] = result
+        self._entries.move_to_end(signature)
+        self._evict()
+
+    def invalidate(self, should_invalidate: Callable[[Hashable], bool]) -> int:
+        """invalidate(should_invalidate)
+
+        Discard the stored results of queries that may have been affected by a change.
+
+        :param should_invalidate: A callback that receives the signature of a stored result and returns True if the result should be discarded.
+        :type should_invalidate: Callable[[Hashable], bool]
+        :return: The number of results discarded.
+        :rtype: int
+        """
+        invalidated_signatures = [signature for signature in self._entries.keys() if should_invalidate(signature)]
+        for signature in invalidated_signatures:
+            del self._entries[signature]
+        return len(invalidated_signatures)
+
+    def clear(self, reset_statistics: bool=False) -> None:
+        """ Discard all stored results. """
+        self._entries.clear()
+        if reset_statistics:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _update_generation(self, generation: int) -> None:
+        if generation == self._generation:
+            return
+        self._entries.clear()
+        self._generation = generation
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def __repr__(self) -> str:
+        return '<generation: {}, size: {}/{}, hits: {}, misses: {}, evictions: {}>'.format(
+            self.generation,
+            self.size,
+            self.max_size,
+            self.hits,
+            self.misses,
+            self.evictions
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
@@ -0,0 +1,99 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Dict
+
+from cncustomsliderframework.dtos.sims.sim_details import CSFSimDetails
+from cncustomsliderframework.modinfo import ModInfo
+from sims.sim_info import SimInfo
+from sims4communitylib.enums.common_age import CommonAge
+from sims4communitylib.enums.common_occult_type import CommonOccultType
+from sims4communitylib.enums.common_species import CommonSpecies
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.sim.events.sim_changed_age import S4CLSimChangedAgeEvent
+from sims4communitylib.events.sim.events.sim_changed_gender import S4CLSimChangedGenderEvent
+from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLateLoadEvent
+from sims4communitylib.logging.has_log import HasLog
+from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.sims.common_gender_utils import CommonGenderUtils
+from sims4communitylib.utils.sims.common_sim_type_utils import CommonSimTypeUtils
+from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
+
+
+class CSFSimDetailsCache(CommonService, HasLog):
+    """ A cache of the details of Sims, so they are not determined again for every Slider operation.
+
+    The details of a Sim are invalidated when it ages up or changes gender and are determined again the next time they are needed. The details of every Sim are cleared whenever a zone is loaded, such as after exiting Create A Sim, where the gender, age or species of a Sim can be changed without either event.
+
+    .. note:: The details of a Sim are also invalidated when it spawns or changes occult type, by the handlers in event_handlers/_on_sim_load.py, so they are up to date when its sliders are reapplied right after.
+
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self._details_by_sim_id: Dict[int, CSFSimDetails] = dict()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def log_identifier(self) -> str:
+        return 'csf_sim_details_cache'
+
+    def get_details(self, sim_info: SimInfo) -> CSFSimDetails:
+        """get_details(sim_info)
+
+        Retrieve the details of a Sim.
+
+        :param sim_info: An instance of a Sim.
+        :type sim_info: SimInfo
+        :return: The gender, age, species, occult type and sim type of the Sim.
+        :rtype: CSFSimDetails
+        """
+        sim_id = CommonSimUtils.get_sim_id(sim_info)
+        details = self._details_by_sim_id.get(sim_id, None)
+        if details is None:
+            details = CSFSimDetails(
+                CommonGenderUtils.get_gender(sim_info),
+                CommonAge.get_age(sim_info),
+                CommonSpecies.get_species(sim_info),
+                CommonOccultType.determine_current_occult_type(sim_info),
+                CommonSimTypeUtils.determine_sim_type(sim_info, use_current_occult_type=True)
+            )
+            self._details_by_sim_id[sim_id] = details
+        return details
+
+    def invalidate(self, sim_info: SimInfo) -> None:
+        """ Forget the details of a Sim, they are determined again the next time they are needed. """
+        self._details_by_sim_id.pop(CommonSimUtils.get_sim_id(sim_info), None)
+
+    def clear(self) -> None:
+        """ Forget the details of all Sims. """
+        self._details_by_sim_id.clear()
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity())
+    def _invalidate_on_sim_age_changed(event_data: S4CLSimChangedAgeEvent) -> bool:
+        CSFSimDetailsCache().invalidate(event_data.sim_info)
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity())
+    def _invalidate_on_sim_gender_changed(event_data: S4CLSimChangedGenderEvent) -> bool:
+        CSFSimDetailsCache().invalidate(event_data.sim_info)
+        return True
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity())
+    def _clear_on_zone_load(event_data: S4CLZoneLateLoadEvent) -> bool:
+        # Exiting Create A Sim loads the zone again, any Sim may have been edited there.
+        CSFSimDetailsCache().clear()
+        return True
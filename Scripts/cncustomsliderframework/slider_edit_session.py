@@ -0,0 +1,139 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import List, Tuple, Union
+
+from cncustomsliderframework.dtos.sims.facial_modifier_set import CSFFacialModifierSet
+from cncustomsliderframework.dtos.sliders.slider import CSFSlider
+from cncustomsliderframework.events.slider_changed_event import CSFSliderValueChanged
+from cncustomsliderframework.events.sliders_changed_batch_event import CSFSlidersChangedBatch
+from cncustomsliderframework.persistence.sim_data.csf_sim_slider_system_data_storage import CSFSimSliderSystemData
+from cncustomsliderframework.sim_details_cache import CSFSimDetailsCache
+from sims.sim_info import SimInfo
+
+
+class CSFSliderEditSession:
+    """ A set of Slider changes to a Sim that are applied all at once or not at all.
+
+    Changes are made against an in-memory copy of the modifiers and persisted values of the Sim. When the session is committed, the facial attributes of the Sim are serialized and resent once, the persisted values are written once and a single event is triggered for all changes. When the session is rolled back, every change is discarded.
+
+    Used as a context manager, the session is committed when the block completes and rolled back when the block raises an exception.
+
+    Facial attributes given to the Sim by anything other than the session while it is open are overwritten when it is committed.
+
+    """
+    def __init__(self, slider_application_service: 'CSFCustomSliderApplicationService', sim_info: SimInfo, trigger_event: bool = True, persist_value: bool = False) -> None:
+        self._slider_application_service = slider_application_service
+        self._sim_info = sim_info
+        self._trigger_event = trigger_event
+        self._persist_value = persist_value
+        # noinspection PyProtectedMember
+        self._facial_modifier_set = CSFFacialModifierSet(slider_application_service._get_facial_attributes(sim_info))
+        self._sim_data = CSFSimSliderSystemData(sim_info)
+        self._current_sim_type = CSFSimDetailsCache().get_details(sim_info).sim_type
+        self._applied_sliders = self._sim_data.applied_sliders
+        self._changed_values: List[Tuple[CSFSlider, float, float]] = list()
+        self._persisted_values_changed = False
+        self._is_open = True
+
+    @property
+    def sim_info(self) -> SimInfo:
+        """ The Sim being edited. """
+        return self._sim_info
+
+    @property
+    def is_open(self) -> bool:
+        """ Whether the session can still be changed, committed or rolled back. """
+        return self._is_open
+
+    @property
+    def changed_values(self) -> Tuple[Tuple[CSFSlider, float, float]]:
+        """ The Sliders changed so far along with their previous value and their new value, in the order they were changed. """
+        return tuple(self._changed_values)
+
+    def apply_slider(self, custom_slider: CSFSlider, amount: float) -> bool:
+        """apply_slider(custom_slider, amount)
+
+        Apply a Slider within the session. An amount of zero removes the Slider.
+
+        :param custom_slider: The Slider to apply.
+        :type custom_slider: CSFSlider
+        :param amount: The amount to apply.
+        :type amount: float
+        :return: True, if the Slider was applied. False, if not.
+        :rtype: bool
+        """
+        return self._change_slider(custom_slider, amount)
+
+    def remove_slider(self, custom_slider: CSFSlider) -> bool:
+        """ Remove a Slider within the session. """
+        return self._change_slider(custom_slider, None)
+
+    def reset_slider(self, custom_slider: CSFSlider) -> bool:
+        """ Reset a Slider to its default within the session. """
+        return self._change_slider(custom_slider, 0.0)
+
+    def commit(self) -> None:
+        """ Apply every change of the session to the Sim and close the session. """
+        self._verify_is_open()
+        self._is_open = False
+        if self._persisted_values_changed:
+            self._sim_data.applied_sliders = self._applied_sliders
+        if not self._changed_values:
+            return
+        # noinspection PyProtectedMember
+        self._slider_application_service._set_facial_attributes(self._sim_info, self._facial_modifier_set.to_facial_attributes())
+        if self._trigger_event:
+            from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+            if self._slider_application_service.slider_value_changed_events_enabled:
+                for (custom_slider, previous_value, new_value) in self._changed_values:
+                    self._slider_application_service.log.format_with_message(f'Triggering event with amount {new_value}.')
+                    CommonEventRegistry().dispatch(CSFSliderValueChanged(self._sim_info, custom_slider, previous_value, new_value))
+            self._slider_application_service.log.format_with_message(f'Triggering batch event with {len(self._changed_values)} changes.')
+            CommonEventRegistry().dispatch(CSFSlidersChangedBatch(self._sim_info, tuple(self._changed_values)))
+
+    def rollback(self) -> None:
+        """ Discard every change of the session and close the session. """
+        self._verify_is_open()
+        self._is_open = False
+        self._changed_values.clear()
+
+    def _change_slider(self, custom_slider: CSFSlider, amount: Union[float, None]) -> bool:
+        self._verify_is_open()
+        # noinspection PyProtectedMember
+        slider_change = self._slider_application_service._change_slider(
+            self._sim_info,
+            self._facial_modifier_set,
+            self._applied_sliders,
+            self._current_sim_type,
+            custom_slider,
+            amount,
+            self._persist_value
+        )
+        if slider_change is None:
+            return False
+        (previous_value, new_value, persisted_values_changed) = slider_change
+        self._persisted_values_changed = self._persisted_values_changed or persisted_values_changed
+        self._changed_values.append((custom_slider, previous_value, new_value))
+        return True
+
+    def _verify_is_open(self) -> None:
+        if not self._is_open:
+            raise RuntimeError('The slider edit session for {} has already been committed or rolled back.'.format(self._sim_info))
+
+    def __enter__(self) -> 'CSFSliderEditSession':
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> bool:
+        if not self._is_open:
+            return False
+        if exception_type is not None:
+            self.rollback()
+            return False
+        self.commit()
+        return False
@@ -110,7 +110,18 @@ class CSFSliderTemplate(HasClassLog):
     def get_sliders(self, sim_info: SimInfo) -> Iterator[Tuple[CSFSlider, float]]:
         """Retrieve sliders associated with this template."""
         from cncustomsliderframework.sliders.query.slider_query_utils import CSFSliderQueryUtils
+        from cncustomsliderframework.sliders.slider_query_registry import CSFSliderQueryRegistry
+        slider_query_registry = CSFSliderQueryRegistry()
+        index = slider_query_registry.index
+        # The sliders available for the Sim are determined for all organized sliders at once, rather than for each slider of the template.
+        available_bitmap = slider_query_registry.slider_table.get_available_bitmap(sim_info)
         for (identifier, amount) in self._slider_to_value_library.items():
+            ordinal = index.get_ordinal(identifier)
+            if ordinal is not None:
+                if (available_bitmap >> ordinal) & 1:
+                    yield index.get_first_slider(1 << ordinal), amount
+                continue
+            # Sliders that are not organized yet are checked one at a time.
             custom_slider = CSFSliderQueryUtils().locate_by_identifier(identifier)
             if custom_slider is None:
                 self.log.debug('No slider found with identifier: {}'.format(identifier))
@@ -125,9 +136,15 @@ class CSFSliderTemplate(HasClassLog):
     ) -> bool:
         """Apply the template to a Sim."""
         from cncustomsliderframework.custom_slider_application_service import CSFCustomSliderApplicationService
-        slider_application_service = CSFCustomSliderApplicationService()
+        from cncustomsliderframework.sliders.query.slider_query_utils import CSFSliderQueryUtils
+        slider_amounts: Dict[CSFSlider, float] = dict()
         for (slider_identifier, amount) in self._slider_to_value_library.items():
-            slider_application_service.apply_slider_by_identifier(sim_info, slider_identifier, amount, trigger_event=True, persist_value=True)
+            custom_slider = CSFSliderQueryUtils().locate_by_identifier(slider_identifier)
+            if custom_slider is None:
+                self.log.debug('No slider found with identifier: {}'.format(slider_identifier))
+                continue
+            slider_amounts[custom_slider] = amount
+        CSFCustomSliderApplicationService().apply_sliders(sim_info, slider_amounts, trigger_event=True, persist_value=True)
         return True
 
     @classmethod
@@ -24,22 +24,18 @@ log = CommonLogRegistry().register_log(ModInfo.get_identity(), 'csf_slider_query
     'Show a list of all sliders by tags.',
 )
 def _csf_command_log_slider_tags(output: CommonConsoleCommandOutput):
-    output('Logging Slider tags, this will take awhile and your game may freeze. Be Patient!')
+    output('Logging Slider tags.')
     try:
         log.enable()
-        slider_results = []
-        for slider_tag_value in CSFSliderQueryRegistry()._slider_library.keys():
-            sliders = CSFSliderQueryRegistry()._slider_library[slider_tag_value]
-            count = len(sliders)
-            slider_result = {
-                'tag_type': str(slider_tag_value),
-                'count': count,
-            }
-            slider_results.append(slider_result)
-        sorted_sliders = sorted(slider_results, key=lambda res: res['tag_type'])
+        slider_index = CSFSliderQueryRegistry().index
+        tag_statistics = slider_index.statistics
+        output('Sliders: {}, Tags: {}, Total: {}'.format(slider_index.number_of_sliders, tag_statistics.number_of_keys, tag_statistics.total_count))
+        for tag_type in sorted(tag_statistics.tag_types, key=lambda _tag_type: _tag_type.name):
+            output('{}: {} values, {} total'.format(tag_type.name, tag_statistics.get_number_of_values(tag_type), tag_statistics.get_total_count(tag_type)))
+        sorted_sliders = sorted([(str(slider_tag_value), count) for (slider_tag_value, count) in tag_statistics.get_counts().items()])
         log.debug('<Slider Tag>: <Count>')
-        for slider in sorted_sliders:
-            log.debug('{}: {}'.format(slider['tag_type'], slider['count']))
+        for (slider_tag_value, count) in sorted_sliders:
+            log.debug('{}: {}'.format(slider_tag_value, count))
         log.disable()
         output('Slider Tags logged')
     except Exception as ex:
@@ -56,20 +52,20 @@ def _csf_command_log_slider_tags(output: CommonConsoleCommandOutput):
     ),
 )
 def _csf_command_log_slider_counts(output: CommonConsoleCommandOutput, sliders_count: int = 5):
-    output('Logging Sliders, this will take awhile and your game may freeze. Be Patient!')
+    output('Logging Sliders.')
     output('Will print pretty printed Sliders when the total count of them in a filter is less than {}'.format(sliders_count))
     try:
         log.enable()
         slider_results = []
-        for (slider_tag_value, sliders) in CSFSliderQueryRegistry()._slider_library.items():
-            count = len(sliders)
+        slider_index = CSFSliderQueryRegistry().index
+        for (slider_tag_value, count) in slider_index.statistics.get_counts().items():
             slider_result = {
                 'filter_key': slider_tag_value,
                 'count': count,
                 'sliders': tuple()
             }
             if count < sliders_count:
-                slider_result['sliders'] = sliders
+                slider_result['sliders'] = tuple([slider.unique_identifier for slider in slider_index.to_sliders(slider_index.get_bitmap(slider_tag_value))])
             slider_results.append(slider_result)
         sorted_sliders = sorted(slider_results, key=lambda res: res['filter_key'])
         for slider in sorted_sliders:
@@ -98,8 +94,9 @@ def _csf_command_log_sliders_for_author(output: CommonConsoleCommandOutput, auth
     try:
         log.enable()
         sliders_to_log: Dict[str, Any] = {}
-        for (slider_tag_value, sliders) in CSFSliderQueryRegistry()._slider_library.items():
-            for slider in sliders:
+        slider_index = CSFSliderQueryRegistry().index
+        for (slider_tag_value, slider_bitmap) in slider_index.library.items():
+            for slider in slider_index.to_sliders(slider_bitmap):
                 if str(author).lower() != str(slider.author).lower():
                     continue
                 slider_identifier = str(slider.unique_identifier)
@@ -120,3 +117,25 @@ def _csf_command_log_sliders_for_author(output: CommonConsoleCommandOutput, auth
     except Exception as ex:
         log.error('Something happened', exception=ex)
         output('Failed to log.')
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    'csf.log_sliders_for_modifier',
+    'Show a list of all sliders changing a modifier.',
+    command_arguments=(
+        CommonConsoleCommandArgument('modifier_id', 'Decimal Number', 'The decimal identifier of a positive or negative modifier.'),
+    ),
+)
+def _csf_command_log_sliders_for_modifier(output: CommonConsoleCommandOutput, modifier_id: int):
+    output('Logging Sliders for modifier {}.'.format(modifier_id))
+    try:
+        log.enable()
+        sliders = CSFSliderQueryRegistry().get_sliders_for_modifier(modifier_id)
+        for slider in sliders:
+            log.format(slider=slider)
+        log.disable()
+        output('Logged {} Sliders.'.format(len(sliders)))
+    except Exception as ex:
+        log.error('Something happened', exception=ex)
+        output('Failed to log.')
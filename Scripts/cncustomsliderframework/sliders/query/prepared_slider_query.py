@@ -0,0 +1,143 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+from cncustomsliderframework.enums.query_type import CSFQueryType
+from cncustomsliderframework.sliders.query.slider_query import CSFSliderQuery
+from cncustomsliderframework.sliders.slider_query_tag import CSFSliderQueryTag
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from cncustomsliderframework.sliders.tag_filters.slider_tag_filter import CSFSliderTagFilter
+
+
+class CSFSliderQueryParameter(CSFSliderTagFilter):
+    """ A placeholder within a prepared query for a tag whose value is only known when the query is bound. """
+    def __init__(self, tag_type: CSFSliderTagType, match_all_tags: bool=True, exclude_tags: bool=False):
+        super().__init__(match_all_tags, exclude_tags=exclude_tags, tag_type=tag_type)
+
+    def __str__(self) -> str:
+        return '{}: {}'.format(
+            self.__class__.__name__,
+            self.tag_type
+        )
+
+
+class CSFBoundSliderQuery(CSFSliderQuery):
+    """ A prepared query with values bound to its parameters.
+
+    Its tags and signature are assembled from the prepared query rather than recomputed from filters.
+
+    """
+    def __init__(
+        self,
+        include_all_tags: Tuple[CSFSliderQueryTag],
+        include_any_tags: Tuple[CSFSliderQueryTag],
+        exclude_tags: Tuple[CSFSliderQueryTag],
+        signature: Tuple[FrozenSet[Tuple[CSFSliderTagType, Any]], FrozenSet[Tuple[CSFSliderTagType, Any]], FrozenSet[Tuple[CSFSliderTagType, Any]], CSFQueryType],
+        query_type: CSFQueryType
+    ):
+        super().__init__(tuple(), query_type=query_type)
+        self._include_all_tags = include_all_tags
+        self._include_any_tags = include_any_tags
+        self._exclude_tags = exclude_tags
+        self._signature = signature
+
+
+class CSFPreparedSliderQuery:
+    """ A query compiled once from filters and parameters, to be bound to parameter values any number of times.
+
+    The tags and signature keys of the filters are computed when the query is prepared. Binding only creates tags for the parameters and bound queries are reused for the same parameter values.
+
+    :param filters: Filters whose tags are the same every time the query is bound.
+    :type filters: Tuple[CSFSliderTagFilter]
+    :param parameters: Parameters whose values are specified when the query is bound, in the order they will be specified in.
+    :type parameters: Tuple[CSFSliderQueryParameter]
+    :param query_type: The type of query. Default is ALL_PLUS_ANY.
+    :type query_type: CSFQueryType, optional
+    :param max_bound_queries: The maximum number of bound queries kept for reuse. Default is 128.
+    :type max_bound_queries: int, optional
+    """
+    def __init__(
+        self,
+        filters: Tuple[CSFSliderTagFilter],
+        parameters: Tuple[CSFSliderQueryParameter]=(),
+        query_type: CSFQueryType=CSFQueryType.ALL_PLUS_ANY,
+        max_bound_queries: int=128
+    ):
+        compiled_query = CSFSliderQuery(tuple(filters), query_type=query_type)
+        self._include_all_tags = compiled_query.include_all_tags
+        self._include_any_tags = compiled_query.include_any_tags
+        self._exclude_tags = compiled_query.exclude_tags
+        (self._include_all_keys, self._include_any_keys, self._exclude_keys, self._query_type) = compiled_query.signature
+        self._parameters = tuple(parameters)
+        self._max_bound_queries = max_bound_queries
+        self._bound_queries: Dict[Tuple[Any, ...], CSFBoundSliderQuery] = dict()
+
+    @property
+    def parameters(self) -> Tuple[CSFSliderQueryParameter]:
+        """ The parameters of the query, in the order their values are bound in. """
+        return self._parameters
+
+    @property
+    def query_type(self) -> CSFQueryType:
+        """ The type of query. """
+        return self._query_type
+
+    def bind(self, *values: Any) -> CSFBoundSliderQuery:
+        """bind(*values)
+
+        Bind values to the parameters of the query.
+
+        :param values: A value for each parameter, in the order of the parameters.
+        :type values: Any
+        :return: A query locating Sliders with the bound values.
+        :rtype: CSFBoundSliderQuery
+        """
+        bound_query = self._bound_queries.get(values, None)
+        if bound_query is not None:
+            return bound_query
+        if len(values) != len(self._parameters):
+            raise ValueError('Expected {} parameter values, but got {}.'.format(len(self._parameters), len(values)))
+        include_all_tags: List[CSFSliderQueryTag] = list(self._include_all_tags)
+        include_any_tags: List[CSFSliderQueryTag] = list(self._include_any_tags)
+        exclude_tags: List[CSFSliderQueryTag] = list(self._exclude_tags)
+        for (parameter, value) in zip(self._parameters, values):
+            tag = CSFSliderQueryTag(parameter.tag_type, value)
+            if parameter.exclude_tags:
+                exclude_tags.append(tag)
+            elif parameter.match_all_tags:
+                include_all_tags.append(tag)
+            else:
+                include_any_tags.append(tag)
+        include_all_tags: Tuple[CSFSliderQueryTag] = tuple(include_all_tags)
+        include_any_tags: Tuple[CSFSliderQueryTag] = tuple(include_any_tags)
+        exclude_tags: Tuple[CSFSliderQueryTag] = tuple(exclude_tags)
+        signature = (
+            self._include_all_keys.union([tag.key for tag in include_all_tags[len(self._include_all_tags):]]),
+            self._include_any_keys.union([tag.key for tag in include_any_tags[len(self._include_any_tags):]]),
+            self._exclude_keys.union([tag.key for tag in exclude_tags[len(self._exclude_tags):]]),
+            self._query_type
+        )
+        bound_query = CSFBoundSliderQuery(include_all_tags, include_any_tags, exclude_tags, signature, self._query_type)
+        if len(self._bound_queries) >= self._max_bound_queries:
+            self._bound_queries.clear()
+        self._bound_queries[values] = bound_query
+        return bound_query
+
+    def __repr__(self) -> str:
+        return '{}: Include All: {}, Include Any: {}, Exclude: {}, Parameters: {}, Query Type: {}'.format(
+            self.__class__.__name__,
+            self._include_all_tags,
+            self._include_any_tags,
+            self._exclude_tags,
+            [str(parameter) for parameter in self._parameters],
+            self._query_type
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
@@ -0,0 +1,58 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Dict, Iterator, List, Tuple
+
+from cncustomsliderframework.dtos.sliders.slider import CSFSlider
+from cncustomsliderframework.enums.slider_category import CSFSliderCategory
+
+
+class CSFSliderCategoryView:
+    """ Sliders sorted by name and grouped by category, ready to be shown.
+
+    Categories are ordered by the first Slider within them and each Slider is listed once per category it is a part of.
+
+    """
+    def __init__(self, sliders: Iterator[CSFSlider]) -> None:
+        # Sliders sharing a name are ordered by identifier, so the same Sliders always produce the same view.
+        sorted_sliders: Tuple[CSFSlider] = tuple(sorted(sliders, key=lambda slider: (slider.name, slider.unique_identifier)))
+        sliders_by_category: Dict[CSFSliderCategory, List[CSFSlider]] = dict()
+        for custom_slider in sorted_sliders:
+            # A Slider may list a category more than once, but is only grouped into it once.
+            for slider_category in dict.fromkeys(custom_slider.categories):
+                sliders_by_category.setdefault(slider_category, list()).append(custom_slider)
+        self._sliders = sorted_sliders
+        self._sliders_by_category: Dict[CSFSliderCategory, Tuple[CSFSlider]] = {slider_category: tuple(category_sliders) for (slider_category, category_sliders) in sliders_by_category.items()}
+
+    @property
+    def sliders(self) -> Tuple[CSFSlider]:
+        """ The Sliders sorted by name. """
+        return self._sliders
+
+    @property
+    def categories(self) -> Tuple[CSFSliderCategory]:
+        """ The categories with at least one Slider. """
+        return tuple(self._sliders_by_category.keys())
+
+    @property
+    def sliders_by_category(self) -> Dict[CSFSliderCategory, Tuple[CSFSlider]]:
+        """ The Sliders sorted by name, organized by category. """
+        return dict(self._sliders_by_category)
+
+    def get_sliders(self, slider_category: CSFSliderCategory) -> Tuple[CSFSlider]:
+        """ Retrieve the Sliders of a category, sorted by name. """
+        return self._sliders_by_category.get(slider_category, tuple())
+
+    def __repr__(self) -> str:
+        return '<number_of_sliders: {}, categories: {}>'.format(
+            len(self._sliders),
+            ', '.join(['{}: {}'.format(slider_category.name, len(category_sliders)) for (slider_category, category_sliders) in self._sliders_by_category.items()])
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
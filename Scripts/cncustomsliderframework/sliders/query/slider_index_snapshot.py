@@ -0,0 +1,196 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import os
+from typing import Any, Dict, List, Tuple, Union
+
+from cncustomsliderframework.dtos.sliders.slider import CSFSlider
+from cncustomsliderframework.enums.slider_category import CSFSliderCategory
+from cncustomsliderframework.modinfo import ModInfo
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from sims4communitylib.enums.common_age import CommonAge
+from sims4communitylib.enums.common_gender import CommonGender
+from sims4communitylib.enums.common_occult_type import CommonOccultType
+from sims4communitylib.enums.common_species import CommonSpecies
+from sims4communitylib.enums.sim_type import CommonSimType
+from sims4communitylib.logging.has_log import HasLog
+from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_json_io_utils import CommonJSONIOUtils
+from sims4communitylib.utils.common_log_utils import CommonLogUtils
+
+
+class CSFSliderIndexSnapshot(CommonService, HasLog):
+    """ Save and load an organized slider index to and from a file in the mod data folder.
+
+    A snapshot is only loaded when it was saved with the same fingerprint, so any change to the loaded sliders or tag handlers causes the sliders to be organized again.
+
+    .. note:: Sliders themselves are still loaded from their tuning, since their display names and descriptions are Localized Strings. The snapshot only spares organizing them.
+
+    """
+    VERSION = 3
+    FILE_NAME = 'slider_index_cache.json'
+    # The enum the values of each tag type are members of. Values of other tag types are saved as they are and must be strings or numbers.
+    ENUM_TYPES_BY_TAG_TYPE = {
+        CSFSliderTagType.GENDER: CommonGender,
+        CSFSliderTagType.AGE: CommonAge,
+        CSFSliderTagType.SPECIES: CommonSpecies,
+        CSFSliderTagType.CATEGORY: CSFSliderCategory,
+        CSFSliderTagType.OCCULT_TYPE: CommonOccultType,
+        CSFSliderTagType.SIM_TYPE: CommonSimType,
+    }
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def log_identifier(self) -> str:
+        return 'csf_slider_index_snapshot'
+
+    @property
+    def file_path(self) -> str:
+        """ The path of the snapshot file. """
+        return os.path.join(CommonLogUtils.get_mod_data_location_path(), self.mod_identity.base_namespace.lower(), CSFSliderIndexSnapshot.FILE_NAME)
+
+    def save(self, index: CSFSliderTagIndex, fingerprint: str) -> bool:
+        """save(index, fingerprint)
+
+        Save an index to the snapshot file.
+
+        :param index: The index to save.
+        :type index: CSFSliderTagIndex
+        :param fingerprint: A fingerprint of the sliders and tag handlers the index was organized from.
+        :type fingerprint: str
+        :return: True, if the index was saved. False, if not.
+        :rtype: bool
+        """
+        try:
+            (sliders_by_ordinal, tag_keys_by_ordinal, combined_tag_types, library) = index.get_state()
+            data = {
+                'version': CSFSliderIndexSnapshot.VERSION,
+                'fingerprint': fingerprint,
+                'identifiers': [slider.unique_identifier if slider is not None else None for slider in sliders_by_ordinal],
+                'tag_keys': [[self._encode_tag_key(tag_key, combined_tag_types) for tag_key in tag_keys] for tag_keys in tag_keys_by_ordinal],
+                'combined_tag_types': [[combined_tag_type.name, [tag_type.name for tag_type in tag_types]] for (combined_tag_type, tag_types) in combined_tag_types.items()],
+                'library': [[self._encode_tag_key(tag_key, combined_tag_types), '{:x}'.format(bitmap)] for (tag_key, bitmap) in library.items()],
+            }
+            file_path = self.file_path
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            if not CommonJSONIOUtils.write_to_file(file_path, data):
+                return False
+            self.log.format_with_message('Saved slider index snapshot.', file_path=file_path, number_of_keys=len(library))
+            return True
+        except Exception as ex:
+            self.log.error('Failed to save slider index snapshot.', exception=ex)
+            return False
+
+    def load(self, fingerprint: str, sliders: Tuple[CSFSlider]) -> Union[CSFSliderTagIndex, None]:
+        """load(fingerprint, sliders)
+
+        Load an index from the snapshot file.
+
+        :param fingerprint: A fingerprint of the sliders and tag handlers the index should be organized from.
+        :type fingerprint: str
+        :param sliders: The loaded sliders, which the ordinals of the snapshot refer to by identifier.
+        :type sliders: Tuple[CSFSlider]
+        :return: The loaded index or None if no snapshot exists, the fingerprint does not match or any slider of the snapshot is not loaded.
+        :rtype: Union[CSFSliderTagIndex, None]
+        """
+        try:
+            file_path = self.file_path
+            if not os.path.exists(file_path):
+                return None
+            data: Dict[str, Any] = CommonJSONIOUtils.load_from_file(file_path)
+            if not data or data.get('version', None) != CSFSliderIndexSnapshot.VERSION:
+                self.log.debug('Slider index snapshot is of a different version.')
+                return None
+            if data.get('fingerprint', None) != fingerprint:
+                self.log.debug('Slider index snapshot is out of date.')
+                return None
+            sliders_by_identifier: Dict[str, CSFSlider] = {slider.unique_identifier: slider for slider in sliders}
+            sliders_by_ordinal: List[Union[CSFSlider, None]] = list()
+            for identifier in data['identifiers']:
+                if identifier is None:
+                    sliders_by_ordinal.append(None)
+                    continue
+                if identifier not in sliders_by_identifier:
+                    self.log.format_with_message('Slider index snapshot refers to a slider that is not loaded.', identifier=identifier)
+                    return None
+                sliders_by_ordinal.append(sliders_by_identifier[identifier])
+            if len(sliders_by_identifier) != len([slider for slider in sliders_by_ordinal if slider is not None]):
+                self.log.debug('Slider index snapshot is missing loaded sliders.')
+                return None
+            combined_tag_types: Dict[CSFSliderTagType, Tuple[CSFSliderTagType, ...]] = {
+                self._decode_tag_type(combined_tag_type_name): tuple([self._decode_tag_type(tag_type_name) for tag_type_name in tag_type_names])
+                for (combined_tag_type_name, tag_type_names) in data['combined_tag_types']
+            }
+            index = CSFSliderTagIndex.from_state(
+                sliders_by_ordinal,
+                [tuple([self._decode_tag_key(tag_key, combined_tag_types) for tag_key in tag_keys]) for tag_keys in data['tag_keys']],
+                combined_tag_types,
+                {self._decode_tag_key(tag_key, combined_tag_types): int(bitmap, 16) for (tag_key, bitmap) in data['library']}
+            )
+            self.log.format_with_message('Loaded slider index snapshot.', file_path=file_path, number_of_keys=len(index.library))
+            return index
+        except Exception as ex:
+            self.log.error('Failed to load slider index snapshot.', exception=ex)
+            return None
+
+    def delete(self) -> bool:
+        """ Delete the snapshot file. """
+        file_path = self.file_path
+        if not os.path.exists(file_path):
+            return False
+        try:
+            os.remove(file_path)
+            return True
+        except OSError as ex:
+            self.log.error('Failed to delete slider index snapshot.', exception=ex)
+            return False
+
+    def _encode_tag_key(self, tag_key: Tuple[CSFSliderTagType, Any], combined_tag_types: Dict[CSFSliderTagType, Tuple[CSFSliderTagType, ...]]) -> List[Any]:
+        (tag_type, value) = tag_key
+        if tag_type in combined_tag_types:
+            return [tag_type.name, [self._encode_value(combined_tag_type, combined_value) for (combined_tag_type, combined_value) in zip(combined_tag_types[tag_type], value)]]
+        return [tag_type.name, self._encode_value(tag_type, value)]
+
+    def _decode_tag_key(self, encoded_tag_key: List[Any], combined_tag_types: Dict[CSFSliderTagType, Tuple[CSFSliderTagType, ...]]) -> Tuple[CSFSliderTagType, Any]:
+        (tag_type_name, encoded_value) = encoded_tag_key
+        tag_type = self._decode_tag_type(tag_type_name)
+        if tag_type in combined_tag_types:
+            return tag_type, tuple([self._decode_value(combined_tag_type, combined_value) for (combined_tag_type, combined_value) in zip(combined_tag_types[tag_type], encoded_value)])
+        return tag_type, self._decode_value(tag_type, encoded_value)
+
+    def _encode_value(self, tag_type: CSFSliderTagType, value: Any) -> Any:
+        enum_type = CSFSliderIndexSnapshot.ENUM_TYPES_BY_TAG_TYPE.get(tag_type, None)
+        if enum_type is not None:
+            if not isinstance(value, enum_type):
+                raise TypeError('Tag value {} of tag type {} is not a {}'.format(value, tag_type.name, enum_type.__name__))
+            return value.name
+        if type(value) not in (str, int, float, bool):
+            raise TypeError('Unable to encode tag value of type {} for tag type {}'.format(type(value), tag_type.name))
+        return value
+
+    def _decode_value(self, tag_type: CSFSliderTagType, encoded_value: Any) -> Any:
+        enum_type = CSFSliderIndexSnapshot.ENUM_TYPES_BY_TAG_TYPE.get(tag_type, None)
+        if enum_type is None:
+            return encoded_value
+        value = getattr(enum_type, encoded_value, None)
+        if not isinstance(value, enum_type):
+            raise ValueError('{} is not a {}'.format(encoded_value, enum_type.__name__))
+        return value
+
+    def _decode_tag_type(self, tag_type_name: str) -> CSFSliderTagType:
+        tag_type = getattr(CSFSliderTagType, tag_type_name, None)
+        if not isinstance(tag_type, CSFSliderTagType):
+            raise ValueError('{} is not a {}'.format(tag_type_name, CSFSliderTagType.__name__))
+        return tag_type
@@ -0,0 +1,413 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, Dict, Hashable, List, Set, Tuple
+
+from cncustomsliderframework.enums.query_type import CSFQueryType
+from cncustomsliderframework.sliders.query.slider_query import CSFSliderQuery
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.slider_query_tag import CSFSliderQueryTag
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+
+
+class CSFSliderQueryExpression:
+    """ A boolean expression over tags, used to locate sliders.
+
+    Expressions are combined with the `&`, `|` and `~` operators or with the And, Or and Not expressions directly. Expressions with the same structure are equal, regardless of the order of their operands.
+
+    .. note:: Use :func:`evaluate` to locate Sliders. It folds constants first and then evaluates each distinct sub expression only once.
+
+    """
+    @property
+    def key(self) -> Hashable:
+        """ A normalized key of the expression. Expressions with the same key locate the same sliders. """
+        raise NotImplementedError()
+
+    @property
+    def tag_keys(self) -> Set[Tuple[CSFSliderTagType, Any]]:
+        """ The tag keys the expression refers to. """
+        raise NotImplementedError()
+
+    @property
+    def is_limited_to_tags(self) -> bool:
+        """ True, if every Slider located by the expression has one of its tags. The result of such an expression only changes when Sliders with one of its tags change. """
+        raise NotImplementedError()
+
+    def fold(self, index: CSFSliderTagIndex) -> 'CSFSliderQueryExpression':
+        """fold(index)
+
+        Fold the parts of the expression known to locate no or all Sliders into constants.
+
+        :param index: The index the expression will be evaluated against.
+        :type index: CSFSliderTagIndex
+        :return: An expression locating the same Sliders as this one.
+        :rtype: CSFSliderQueryExpression
+        """
+        return self
+
+    def evaluate(self, index: CSFSliderTagIndex, results: Dict[Hashable, int]=None) -> int:
+        """evaluate(index, results=None)
+
+        Evaluate the expression against an index.
+
+        :param index: The index to evaluate against.
+        :type index: CSFSliderTagIndex
+        :param results: Results of sub expressions by their key. Sub expressions found here are not evaluated again and new results are added to it. Default is None.
+        :type results: Dict[Hashable, int], optional
+        :return: A bitmap of the Sliders located by the expression.
+        :rtype: int
+        """
+        if results is None:
+            results = dict()
+        return self.fold(index)._evaluate(index, results)
+
+    def _evaluate(self, index: CSFSliderTagIndex, results: Dict[Hashable, int]) -> int:
+        key = self.key
+        if key in results:
+            return results[key]
+        bitmap = self._evaluate_uncached(index, results)
+        results[key] = bitmap
+        return bitmap
+
+    def _evaluate_uncached(self, index: CSFSliderTagIndex, results: Dict[Hashable, int]) -> int:
+        raise NotImplementedError()
+
+    def _estimate(self, index: CSFSliderTagIndex) -> int:
+        # Used to order the operands of an And expression. Compound expressions are evaluated after tags.
+        return index.slider_count + 1
+
+    @classmethod
+    def from_query(cls, query: CSFSliderQuery) -> 'CSFSliderQueryExpression':
+        """from_query(query)
+
+        Create an expression locating the same Sliders as a query.
+
+        :param query: The query to convert.
+        :type query: CSFSliderQuery
+        :return: An expression locating the same Sliders as the query.
+        :rtype: CSFSliderQueryExpression
+        """
+        all_tags = query.include_all_tags
+        any_tags = query.include_any_tags
+        include_any = CSFSliderOrExpression(*[CSFSliderTagExpression(tag) for tag in any_tags if tag is not None])
+        if not all_tags:
+            return include_any
+        all_tags_without_none = [tag for tag in all_tags if tag is not None]
+        if not all_tags_without_none:
+            return CSFSliderConstantExpression(False)
+        include_all = CSFSliderAndExpression(*[CSFSliderTagExpression(tag) for tag in all_tags_without_none])
+        query_type = query.query_type
+        if not any_tags and (query_type == CSFQueryType.ALL_INTERSECT_ANY or query_type == CSFQueryType.ALL_INTERSECT_ANY_MUST_HAVE_ONE):
+            query_type = CSFQueryType.ALL_PLUS_ANY
+        if query_type == CSFQueryType.ALL_PLUS_ANY or query_type == CSFQueryType.ALL_PLUS_ANY_MUST_HAVE_ONE:
+            found = include_all | include_any
+        else:
+            found = include_all & include_any
+        if query_type == CSFQueryType.ALL_PLUS_ANY_MUST_HAVE_ONE or query_type == CSFQueryType.ALL_INTERSECT_ANY_MUST_HAVE_ONE:
+            found = CSFSliderIfAnyExpression(include_any, found)
+        # A query locates nothing at all when any of its Include All tags has no Sliders, even if Include Any tags are added to the result.
+        for include_all_operand in include_all.operands:
+            found = CSFSliderIfAnyExpression(include_all_operand, found)
+        return CSFSliderAndExpression(found, *[~CSFSliderTagExpression(tag) for tag in query.exclude_tags if tag is not None])
+
+    def __and__(self, other: 'CSFSliderQueryExpression') -> 'CSFSliderQueryExpression':
+        return CSFSliderAndExpression(self, other)
+
+    def __or__(self, other: 'CSFSliderQueryExpression') -> 'CSFSliderQueryExpression':
+        return CSFSliderOrExpression(self, other)
+
+    def __invert__(self) -> 'CSFSliderQueryExpression':
+        return CSFSliderNotExpression(self)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, CSFSliderQueryExpression) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
+class CSFSliderConstantExpression(CSFSliderQueryExpression):
+    """ An expression locating either no Sliders or every Slider. """
+    def __init__(self, value: bool):
+        self._value = value
+
+    @property
+    def value(self) -> bool:
+        """ True, if the expression locates every Slider. False, if it locates none. """
+        return self._value
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def key(self) -> Hashable:
+        return self._value
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def tag_keys(self) -> Set[Tuple[CSFSliderTagType, Any]]:
+        return set()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def is_limited_to_tags(self) -> bool:
+        return not self._value
+
+    def _evaluate_uncached(self, index: CSFSliderTagIndex, results: Dict[Hashable, int]) -> int:
+        if not self._value:
+            return 0
+        return index.get_all_bitmap()
+
+    def _estimate(self, index: CSFSliderTagIndex) -> int:
+        return 0 if not self._value else index.slider_count
+
+    def __repr__(self) -> str:
+        return 'All' if self._value else 'Nothing'
+
+
+class CSFSliderTagExpression(CSFSliderQueryExpression):
+    """ An expression locating the Sliders with a tag. """
+    def __init__(self, tag: CSFSliderQueryTag):
+        self._tag = tag
+
+    @property
+    def tag(self) -> CSFSliderQueryTag:
+        """ The tag Sliders must have. """
+        return self._tag
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def key(self) -> Hashable:
+        return self._tag.key
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def tag_keys(self) -> Set[Tuple[CSFSliderTagType, Any]]:
+        return {self._tag.key}
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def is_limited_to_tags(self) -> bool:
+        return True
+
+    # noinspection PyMissingOrEmptyDocstring
+    def fold(self, index: CSFSliderTagIndex) -> CSFSliderQueryExpression:
+        if not index.has_key(self._tag.key):
+            return CSFSliderConstantExpression(False)
+        return self
+
+    def _evaluate_uncached(self, index: CSFSliderTagIndex, results: Dict[Hashable, int]) -> int:
+        return index.get_bitmap(self._tag.key)
+
+    def _estimate(self, index: CSFSliderTagIndex) -> int:
+        return index.get_count(self._tag.key)
+
+    def __repr__(self) -> str:
+        return str(self._tag)
+
+
+class CSFSliderNotExpression(CSFSliderQueryExpression):
+    """ An expression locating the Sliders not located by another expression. """
+    def __init__(self, operand: CSFSliderQueryExpression):
+        self._operand = operand
+        self._key = ('not', operand.key)
+
+    @property
+    def operand(self) -> CSFSliderQueryExpression:
+        """ The expression to negate. """
+        return self._operand
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def key(self) -> Hashable:
+        return self._key
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def tag_keys(self) -> Set[Tuple[CSFSliderTagType, Any]]:
+        return self._operand.tag_keys
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def is_limited_to_tags(self) -> bool:
+        # Sliders without any tag of the operand are located as well.
+        return False
+
+    # noinspection PyMissingOrEmptyDocstring
+    def fold(self, index: CSFSliderTagIndex) -> CSFSliderQueryExpression:
+        operand = self._operand.fold(index)
+        if isinstance(operand, CSFSliderConstantExpression):
+            return CSFSliderConstantExpression(not operand.value)
+        if isinstance(operand, CSFSliderNotExpression):
+            return operand.operand
+        if operand is self._operand:
+            return self
+        return CSFSliderNotExpression(operand)
+
+    def _evaluate_uncached(self, index: CSFSliderTagIndex, results: Dict[Hashable, int]) -> int:
+        return index.get_all_bitmap() & ~self._operand._evaluate(index, results)
+
+    def __repr__(self) -> str:
+        return 'Not({})'.format(self._operand)
+
+
+class CSFSliderAndExpression(CSFSliderQueryExpression):
+    """ An expression locating the Sliders located by all of its operands.
+
+    Operands are evaluated from the least to the most common tag and evaluation stops as soon as nothing is left. Negated operands are subtracted from the result instead of being evaluated on their own.
+
+    """
+    _IDENTITY = True
+
+    def __init__(self, *operands: CSFSliderQueryExpression):
+        flattened_operands: List[CSFSliderQueryExpression] = list()
+        operand_keys: Set[Hashable] = set()
+        for operand in operands:
+            # Nested expressions of the same kind are merged and duplicate operands are removed.
+            for flattened_operand in (operand.operands if type(operand) is type(self) else (operand,)):
+                if flattened_operand.key in operand_keys:
+                    continue
+                operand_keys.add(flattened_operand.key)
+                flattened_operands.append(flattened_operand)
+        self._operands: Tuple[CSFSliderQueryExpression, ...] = tuple(flattened_operands)
+        self._key = (self.__class__.__name__, frozenset(operand_keys))
+
+    @property
+    def operands(self) -> Tuple[CSFSliderQueryExpression, ...]:
+        """ The operands of the expression. """
+        return self._operands
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def key(self) -> Hashable:
+        return self._key
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def tag_keys(self) -> Set[Tuple[CSFSliderTagType, Any]]:
+        tag_keys: Set[Tuple[CSFSliderTagType, Any]] = set()
+        for operand in self._operands:
+            tag_keys |= operand.tag_keys
+        return tag_keys
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def is_limited_to_tags(self) -> bool:
+        return any(operand.is_limited_to_tags for operand in self._operands)
+
+    # noinspection PyMissingOrEmptyDocstring
+    def fold(self, index: CSFSliderTagIndex) -> CSFSliderQueryExpression:
+        identity = self.__class__._IDENTITY
+        folded_operands: List[CSFSliderQueryExpression] = list()
+        for operand in self._operands:
+            folded_operand = operand.fold(index)
+            if isinstance(folded_operand, CSFSliderConstantExpression):
+                if folded_operand.value != identity:
+                    # Nothing And anything is nothing, All Or anything is all.
+                    return folded_operand
+                continue
+            folded_operands.append(folded_operand)
+        if not folded_operands:
+            return CSFSliderConstantExpression(identity)
+        if len(folded_operands) == 1:
+            return folded_operands[0]
+        return self.__class__(*folded_operands)
+
+    def _evaluate_uncached(self, index: CSFSliderTagIndex, results: Dict[Hashable, int]) -> int:
+        included_operands = [operand for operand in self._operands if not isinstance(operand, CSFSliderNotExpression)]
+        excluded_operands = [operand.operand for operand in self._operands if isinstance(operand, CSFSliderNotExpression)]
+        if not included_operands:
+            found_bitmap = index.get_all_bitmap()
+        else:
+            # -1 has every bit set, so it is the identity for the first intersection.
+            found_bitmap = -1
+            for operand in sorted(included_operands, key=lambda _operand: _operand._estimate(index)):
+                found_bitmap &= operand._evaluate(index, results)
+                if not found_bitmap:
+                    return 0
+        for operand in excluded_operands:
+            found_bitmap &= ~operand._evaluate(index, results)
+            if not found_bitmap:
+                return 0
+        return found_bitmap
+
+    def _estimate(self, index: CSFSliderTagIndex) -> int:
+        return min([operand._estimate(index) for operand in self._operands])
+
+    def __repr__(self) -> str:
+        return 'And({})'.format(', '.join([str(operand) for operand in self._operands]))
+
+
+class CSFSliderOrExpression(CSFSliderAndExpression):
+    """ An expression locating the Sliders located by any of its operands. """
+    _IDENTITY = False
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def is_limited_to_tags(self) -> bool:
+        return all(operand.is_limited_to_tags for operand in self._operands)
+
+    def _evaluate_uncached(self, index: CSFSliderTagIndex, results: Dict[Hashable, int]) -> int:
+        found_bitmap = 0
+        for operand in self._operands:
+            found_bitmap |= operand._evaluate(index, results)
+        return found_bitmap
+
+    def _estimate(self, index: CSFSliderTagIndex) -> int:
+        return sum([operand._estimate(index) for operand in self._operands])
+
+    def __repr__(self) -> str:
+        return 'Or({})'.format(', '.join([str(operand) for operand in self._operands]))
+
+
+class CSFSliderIfAnyExpression(CSFSliderQueryExpression):
+    """ An expression locating the Sliders of an expression, but only if a condition locates any Slider at all. """
+    def __init__(self, condition: CSFSliderQueryExpression, expression: CSFSliderQueryExpression):
+        self._condition = condition
+        self._expression = expression
+        self._key = ('if_any', condition.key, expression.key)
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def key(self) -> Hashable:
+        return self._key
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def tag_keys(self) -> Set[Tuple[CSFSliderTagType, Any]]:
+        return self._condition.tag_keys | self._expression.tag_keys
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def is_limited_to_tags(self) -> bool:
+        return self._expression.is_limited_to_tags
+
+    # noinspection PyMissingOrEmptyDocstring
+    def fold(self, index: CSFSliderTagIndex) -> CSFSliderQueryExpression:
+        condition = self._condition.fold(index)
+        if isinstance(condition, CSFSliderConstantExpression) and not condition.value:
+            return condition
+        expression = self._expression.fold(index)
+        if isinstance(expression, CSFSliderConstantExpression) and not expression.value:
+            return expression
+        if isinstance(condition, CSFSliderTagExpression):
+            # Tags without Sliders are removed from the index, so a tag that was not folded always locates a Slider.
+            return expression
+        return CSFSliderIfAnyExpression(condition, expression)
+
+    def _evaluate_uncached(self, index: CSFSliderTagIndex, results: Dict[Hashable, int]) -> int:
+        if not self._condition._evaluate(index, results):
+            return 0
+        return self._expression._evaluate(index, results)
+
+    def _estimate(self, index: CSFSliderTagIndex) -> int:
+        return self._expression._estimate(index)
+
+    def __repr__(self) -> str:
+        return 'IfAny({}, {})'.format(self._condition, self._expression)
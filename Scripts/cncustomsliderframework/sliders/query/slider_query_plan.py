@@ -0,0 +1,215 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, Dict, Iterator, Tuple
+
+from cncustomsliderframework.enums.query_type import CSFQueryType
+from cncustomsliderframework.sliders.query.slider_query import CSFSliderQuery
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+
+
+class CSFSliderQueryPlan:
+    """ The order in which the tags of a query are evaluated against an index.
+
+    Include All tags are intersected from the least to the most common tag, so the candidate Sliders shrink as fast as possible and evaluation stops as soon as nothing is left.
+    Exclude tags are only applied to the final candidates, from the most to the least common tag.
+
+    """
+    def __init__(
+        self,
+        include_all_keys: Tuple[Tuple[CSFSliderTagType, Any], ...],
+        include_any_keys: Tuple[Tuple[CSFSliderTagType, Any], ...],
+        exclude_keys: Tuple[Tuple[CSFSliderTagType, Any], ...],
+        query_type: CSFQueryType,
+        is_empty: bool=False,
+        is_any_only: bool=False
+    ):
+        self._include_all_keys = include_all_keys
+        self._include_any_keys = include_any_keys
+        self._exclude_keys = exclude_keys
+        self._query_type = query_type
+        self._is_empty = is_empty
+        self._is_any_only = is_any_only
+
+    @property
+    def include_all_keys(self) -> Tuple[Tuple[CSFSliderTagType, Any], ...]:
+        """ Keys that must all match, in order of evaluation. """
+        return self._include_all_keys
+
+    @property
+    def include_any_keys(self) -> Tuple[Tuple[CSFSliderTagType, Any], ...]:
+        """ Keys of which any may match. """
+        return self._include_any_keys
+
+    @property
+    def exclude_keys(self) -> Tuple[Tuple[CSFSliderTagType, Any], ...]:
+        """ Keys that must not match, in order of evaluation. """
+        return self._exclude_keys
+
+    @property
+    def query_type(self) -> CSFQueryType:
+        """ The way Include All and Include Any results are combined. """
+        return self._query_type
+
+    @property
+    def is_empty(self) -> bool:
+        """ Whether the plan is known to locate nothing without evaluating it. """
+        return self._is_empty
+
+    @property
+    def is_any_only(self) -> bool:
+        """ Whether the plan only consists of Include Any keys. """
+        return self._is_any_only
+
+    @classmethod
+    def create(cls, query: CSFSliderQuery, index: CSFSliderTagIndex, has_bound_key: bool=False) -> 'CSFSliderQueryPlan':
+        """create(query, index, has_bound_key=False)
+
+        Plan the evaluation of a query against an index.
+
+        :param query: The query to plan.
+        :type query: CSFSliderQuery
+        :param index: The index the plan will be evaluated against.
+        :type index: CSFSliderTagIndex
+        :param has_bound_key: If True, the plan will be evaluated with :func:`execute_bound`, which adds one more Include All key to the query for each evaluation. Default is False.
+        :type has_bound_key: bool, optional
+        :return: A plan for the query.
+        :rtype: CSFSliderQueryPlan
+        """
+        all_tags = query.include_all_tags
+        any_tags = query.include_any_tags
+        include_all_keys = tuple([tag.key for tag in all_tags if tag is not None])
+        include_any_keys = tuple([tag.key for tag in any_tags if tag is not None if index.has_key(tag.key)])
+        exclude_keys = tuple([tag.key for tag in query.exclude_tags if tag is not None if index.has_key(tag.key)])
+        query_type = query.query_type
+        if not any_tags and (query_type == CSFQueryType.ALL_INTERSECT_ANY or query_type == CSFQueryType.ALL_INTERSECT_ANY_MUST_HAVE_ONE):
+            query_type = CSFQueryType.ALL_PLUS_ANY
+
+        if not all_tags and not has_bound_key:
+            return cls(tuple(), include_any_keys, tuple(), query_type, is_empty=not include_any_keys, is_any_only=True)
+
+        is_empty = not include_all_keys and not has_bound_key
+        for include_all_key in include_all_keys:
+            if not index.has_key(include_all_key):
+                # One of the All keys is not within the slider library! This means no sliders match ALL tags.
+                is_empty = True
+                break
+        if not include_any_keys and (query_type == CSFQueryType.ALL_PLUS_ANY_MUST_HAVE_ONE or query_type == CSFQueryType.ALL_INTERSECT_ANY_MUST_HAVE_ONE):
+            is_empty = True
+
+        return cls(
+            tuple(sorted(set(include_all_keys), key=index.get_count)),
+            include_any_keys,
+            tuple(sorted(set(exclude_keys), key=index.get_count, reverse=True)),
+            query_type,
+            is_empty=is_empty
+        )
+
+    def execute(self, index: CSFSliderTagIndex) -> int:
+        """execute(index)
+
+        Evaluate the plan against an index.
+
+        :param index: The index to evaluate against.
+        :type index: CSFSliderTagIndex
+        :return: A bitmap of the Sliders located by the plan.
+        :rtype: int
+        """
+        if self._is_empty:
+            return 0
+        found_via_any_tags_bitmap = self._get_any_bitmap(index)
+        if self._is_any_only:
+            return found_via_any_tags_bitmap
+
+        found_bitmap = self._get_all_bitmap(index)
+        found_bitmap = self._combine(found_bitmap, found_via_any_tags_bitmap)
+        for exclude_key in self._exclude_keys:
+            if not found_bitmap:
+                break
+            found_bitmap &= ~index.get_bitmap(exclude_key)
+        return found_bitmap
+
+    def execute_bound(self, index: CSFSliderTagIndex, bound_keys: Iterator[Tuple[CSFSliderTagType, Any]]) -> Dict[Tuple[CSFSliderTagType, Any], int]:
+        """execute_bound(index, bound_keys)
+
+        Evaluate the plan against an index once for each bound key, as if the bound key was one more Include All key of the query.
+
+        The Include All, Include Any and Exclude keys of the plan are only evaluated once and are shared by every bound key.
+
+        :param index: The index to evaluate against.
+        :type index: CSFSliderTagIndex
+        :param bound_keys: The keys to evaluate the plan with.
+        :type bound_keys: Iterator[Tuple[CSFSliderTagType, Any]]
+        :return: A bitmap of the Sliders located for each bound key.
+        :rtype: Dict[Tuple[CSFSliderTagType, Any], int]
+        """
+        bound_keys = tuple(bound_keys)
+        if self._is_empty:
+            return {bound_key: 0 for bound_key in bound_keys}
+        found_via_any_tags_bitmap = self._get_any_bitmap(index)
+        shared_bitmap = self._get_all_bitmap(index)
+        excluded_bitmap = 0
+        for exclude_key in self._exclude_keys:
+            excluded_bitmap |= index.get_bitmap(exclude_key)
+
+        bitmaps: Dict[Tuple[CSFSliderTagType, Any], int] = dict()
+        for bound_key in bound_keys:
+            if not index.has_key(bound_key):
+                bitmaps[bound_key] = 0
+                continue
+            found_bitmap = self._combine(shared_bitmap & index.get_bitmap(bound_key), found_via_any_tags_bitmap)
+            bitmaps[bound_key] = found_bitmap & ~excluded_bitmap
+        return bitmaps
+
+    def _get_any_bitmap(self, index: CSFSliderTagIndex) -> int:
+        found_via_any_tags_bitmap = 0
+        for include_any_key in self._include_any_keys:
+            found_via_any_tags_bitmap |= index.get_bitmap(include_any_key)
+        return found_via_any_tags_bitmap
+
+    def _get_all_bitmap(self, index: CSFSliderTagIndex) -> int:
+        return index.intersect(self._include_all_keys)
+
+    def _combine(self, found_bitmap: int, found_via_any_tags_bitmap: int) -> int:
+        query_type = self._query_type
+        if query_type == CSFQueryType.ALL_PLUS_ANY or query_type == CSFQueryType.ALL_PLUS_ANY_MUST_HAVE_ONE:
+            return found_bitmap | found_via_any_tags_bitmap
+        if query_type == CSFQueryType.ALL_INTERSECT_ANY or query_type == CSFQueryType.ALL_INTERSECT_ANY_MUST_HAVE_ONE:
+            return found_bitmap & found_via_any_tags_bitmap
+        return found_bitmap
+
+    def explain(self, index: CSFSliderTagIndex) -> str:
+        """ Describe the plan, with the number of Sliders of each key. """
+        if self._is_empty:
+            return 'Empty'
+
+        def _describe(keys: Tuple[Tuple[CSFSliderTagType, Any], ...]) -> str:
+            return ', '.join(['{}={}'.format(key, index.get_count(key)) for key in keys])
+
+        if self._is_any_only:
+            return 'Any [{}]'.format(_describe(self._include_any_keys))
+        return 'All [{}] {} Any [{}] Exclude [{}]'.format(
+            _describe(self._include_all_keys),
+            self._query_type.name,
+            _describe(self._include_any_keys),
+            _describe(self._exclude_keys)
+        )
+
+    def __repr__(self) -> str:
+        return '<include_all_keys: {}, include_any_keys: {}, exclude_keys: {}, query_type: {}, is_empty: {}, is_any_only: {}>'.format(
+            self.include_all_keys,
+            self.include_any_keys,
+            self.exclude_keys,
+            self.query_type,
+            self.is_empty,
+            self.is_any_only
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
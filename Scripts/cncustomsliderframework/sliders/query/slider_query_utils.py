@@ -6,19 +6,26 @@ https://creativecommons.org/licenses/by-nd/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from typing import Tuple, Iterator, Union
+from typing import Tuple, Iterator, Union, Dict, Any, List, Set
 
 from cncustomsliderframework.dtos.sliders.slider import CSFSlider
 from cncustomsliderframework.enums.query_type import CSFQueryType
 from cncustomsliderframework.enums.slider_category import CSFSliderCategory
 from cncustomsliderframework.modinfo import ModInfo
+from cncustomsliderframework.sim_details_cache import CSFSimDetailsCache
+from cncustomsliderframework.sliders.query.prepared_slider_query import CSFPreparedSliderQuery, CSFSliderQueryParameter
+from cncustomsliderframework.sliders.query.slider_category_view import CSFSliderCategoryView
 from cncustomsliderframework.sliders.query.slider_query import CSFSliderQuery
+from cncustomsliderframework.sliders.slider_query_tag import CSFSliderQueryTag
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
 from cncustomsliderframework.sliders.tag_filters.category_filter import CSFSliderCategorySliderFilter
 from cncustomsliderframework.sliders.tag_filters.sim_details import CSFSimDetailsSliderFilter
+from cncustomsliderframework.sliders.tag_filters.sim_type import CSFSimTypeSliderFilter
 from cncustomsliderframework.sliders.tag_filters.slider_name_filter import CSFSliderNameSliderFilter
 from cncustomsliderframework.sliders.tag_filters.slider_tag_filter import CSFSliderTagFilter
 from cncustomsliderframework.sliders.tag_filters.tags_filter import CSFTagsSliderFilter
 from sims.sim_info import SimInfo
+from sims4communitylib.enums.sim_type import CommonSimType
 from sims4communitylib.utils.sims.common_sim_name_utils import CommonSimNameUtils
 
 from sims4communitylib.logging.has_log import HasLog
@@ -27,6 +34,27 @@ from sims4communitylib.mod_support.mod_identity import CommonModIdentity
 
 class CSFSliderQueryUtils(HasLog):
     """ Query for Sliders using various filter configurations. """
+    # Queries for the most common criteria are prepared once and only bound to the details of a Sim when used.
+    _SIM_QUERY = CSFPreparedSliderQuery(
+        (CSFSimTypeSliderFilter(CSFSimTypeSliderFilter.UNRESTRICTED_SIM_TYPE),),
+        parameters=(CSFSliderQueryParameter(CSFSliderTagType.SIM_DETAILS), CSFSliderQueryParameter(CSFSliderTagType.SIM_TYPE, match_all_tags=False)),
+        query_type=CSFQueryType.ALL_INTERSECT_ANY
+    )
+    _SIM_AND_CATEGORY_QUERY = CSFPreparedSliderQuery(
+        (CSFSimTypeSliderFilter(CSFSimTypeSliderFilter.UNRESTRICTED_SIM_TYPE),),
+        parameters=(CSFSliderQueryParameter(CSFSliderTagType.SIM_DETAILS), CSFSliderQueryParameter(CSFSliderTagType.SIM_TYPE, match_all_tags=False), CSFSliderQueryParameter(CSFSliderTagType.CATEGORY)),
+        query_type=CSFQueryType.ALL_INTERSECT_ANY
+    )
+    _SIM_AND_NAME_QUERY = CSFPreparedSliderQuery(
+        (CSFSimTypeSliderFilter(CSFSimTypeSliderFilter.UNRESTRICTED_SIM_TYPE),),
+        parameters=(CSFSliderQueryParameter(CSFSliderTagType.SIM_DETAILS), CSFSliderQueryParameter(CSFSliderTagType.SIM_TYPE, match_all_tags=False), CSFSliderQueryParameter(CSFSliderTagType.SLIDER_NAME)),
+        query_type=CSFQueryType.ALL_INTERSECT_ANY
+    )
+    # Sliders available for a sim type, used to limit the results of queries built from the filters of a caller.
+    _SIM_TYPE_QUERY = CSFPreparedSliderQuery(
+        (CSFSimTypeSliderFilter(CSFSimTypeSliderFilter.UNRESTRICTED_SIM_TYPE),),
+        parameters=(CSFSliderQueryParameter(CSFSliderTagType.SIM_TYPE, match_all_tags=False),)
+    )
 
     # noinspection PyMissingOrEmptyDocstring
     @property
@@ -84,23 +112,79 @@ class CSFSliderQueryUtils(HasLog):
         :return: A collection of Sliders matching the criteria.
         :rtype: Tuple[CSFSlider]
         """
+        additional_filters = tuple(additional_filters)
         self.log.format_with_message(
             'Get Sliders by name.',
             name=name,
-            additional_filters=tuple(additional_filters),
+            additional_filters=additional_filters,
             ignore_sliders=ignore_sliders,
             additional_tags=additional_tags
         )
+        sim_details = CSFSimDetailsCache().get_details(sim_info)
+        if not additional_tags and not additional_filters:
+            queries: Tuple[CSFSliderQuery] = (CSFSliderQueryUtils._SIM_AND_NAME_QUERY.bind(sim_details.availability_key, sim_details.sim_type, name),)
+            return tuple(self._query_registry.get_sliders(queries))
         filters: Tuple[CSFSliderTagFilter] = (
             CSFSimDetailsSliderFilter(sim_info),
             CSFSliderNameSliderFilter(name),
             CSFTagsSliderFilter(additional_tags),
-            *tuple(additional_filters)
+            *additional_filters
         )
         # Include Object Tag, Include Category Tag
 
         queries: Tuple[CSFSliderQuery] = (self._query_registry.create_query(filters, query_type=CSFQueryType.ALL_PLUS_ANY),)
-        return tuple(self._query_registry.get_sliders(queries))
+        return tuple(self._query_registry.get_sliders(queries) & self._get_sliders_available_for_sim_type(sim_details.sim_type))
+
+    def locate_by_name(self, sim_info: SimInfo, name: str) -> Union[CSFSlider, None]:
+        """locate_by_name(sim_info, name)
+
+        Locate a Slider available for a Sim by its name.
+
+        .. note:: When multiple Sliders share the name, the first one loaded is located.
+
+        :param sim_info: An instance of a Sim
+        :type sim_info: SimInfo
+        :param name: The name of the slider to locate.
+        :type name: str
+        :return: The Slider with the name or None if no Slider with the name is available for the Sim.
+        :rtype: Union[CSFSlider, None]
+        """
+        sim_details = CSFSimDetailsCache().get_details(sim_info)
+        return self._query_registry.locate_first(
+            (
+                (CSFSliderTagType.SLIDER_NAME, name),
+                (CSFSliderTagType.SIM_DETAILS, sim_details.availability_key)
+            ),
+            include_any_tag_keys=(
+                (CSFSliderTagType.SIM_TYPE, sim_details.sim_type),
+                (CSFSliderTagType.SIM_TYPE, CSFSimTypeSliderFilter.UNRESTRICTED_SIM_TYPE)
+            )
+        )
+
+    def search_sliders_for_sim(
+        self,
+        sim_info: SimInfo,
+        text: str,
+        limit: int=10,
+        slider_category: CSFSliderCategory=None
+    ) -> Tuple[CSFSlider]:
+        """search_sliders_for_sim(sim_info, text, limit=10, slider_category=None)
+
+        Search the Sliders available for a Sim by name, author and tags, best match first.
+
+        :param sim_info: An instance of a Sim
+        :type sim_info: SimInfo
+        :param text: The text to search for.
+        :type text: str
+        :param limit: The maximum number of Sliders to return. Default is 10.
+        :type limit: int, optional
+        :param slider_category: The category of slider. If not specified, sliders will not be filtered by category. Default is None.
+        :type slider_category: CSFSliderCategory, optional
+        :return: The Sliders best matching the text.
+        :rtype: Tuple[CSFSlider]
+        """
+        queries = self._create_queries_for_sim(sim_info, slider_category)
+        return self._query_registry.search_sliders(text, queries=queries, limit=limit)
 
     def has_sliders_for_sim(
         self,
@@ -133,14 +217,139 @@ class CSFSliderQueryUtils(HasLog):
         :return: True, if Sliders exist for the criteria. False, if not.
         :rtype: bool
         """
-        self.log.format_with_message(
-            'Checking if Sliders exist for Sim.',
-            sim_name=CommonSimNameUtils.get_full_name(sim_info),
-            slider_category=slider_category,
-            additional_filters=additional_filters,
-            ignore_sliders=ignore_sliders,
-            additional_tags=additional_tags
+        additional_filters = tuple(additional_filters)
+        if self.log.enabled:
+            self.log.format_with_message(
+                'Checking if Sliders exist for Sim.',
+                sim_name=CommonSimNameUtils.get_full_name(sim_info),
+                slider_category=slider_category,
+                additional_filters=additional_filters,
+                ignore_sliders=ignore_sliders,
+                additional_tags=additional_tags
+            )
+        if additional_tags or additional_filters:
+            return len(self._get_sliders_matching_filters(sim_info, slider_category, additional_tags, additional_filters)) > 0
+        queries = self._create_queries_for_sim(sim_info, slider_category)
+        return self._query_registry.has_sliders(queries)
+
+    def count_sliders_for_sim(
+        self,
+        sim_info: SimInfo,
+        slider_category: CSFSliderCategory=None,
+        ignore_sliders: Tuple[str]=(),
+        additional_tags: Tuple[str]=(),
+        additional_filters: Iterator[CSFSliderTagFilter]=()
+    ) -> int:
+        """count_sliders_for_sim(\
+            sim_info,\
+            slider_category=None,\
+            ignore_sliders=(),\
+            additional_tags=(),\
+            additional_filters=()\
+        )
+
+        Count the Sliders matching the criteria.
+
+        :param sim_info: An instance of a Sim
+        :type sim_info: SimInfo
+        :param slider_category: The category of slider. If not specified, sliders will not be filtered by category. Default is None.
+        :type slider_category: CSFSliderCategory, optional
+        :param additional_tags: Additional tags to add to the query. Default is an empty collection.
+        :type additional_tags: Tuple[Any], optional
+        :param ignore_sliders: A collection of identifiers to ignore. Default is an empty collection.
+        :type ignore_sliders: Tuple[str], optional
+        :param additional_filters: Additional filters. Default is an empty collection.
+        :type additional_filters: Iterator[CSFSliderTagFilter], optional.
+        :return: The number of Sliders matching the criteria.
+        :rtype: int
+        """
+        additional_filters = tuple(additional_filters)
+        if self.log.enabled:
+            self.log.format_with_message(
+                'Counting Sliders for Sim.',
+                sim_name=CommonSimNameUtils.get_full_name(sim_info),
+                slider_category=slider_category,
+                additional_filters=additional_filters,
+                ignore_sliders=ignore_sliders,
+                additional_tags=additional_tags
+            )
+        if additional_tags or additional_filters:
+            return len(self._get_sliders_matching_filters(sim_info, slider_category, additional_tags, additional_filters))
+        queries = self._create_queries_for_sim(sim_info, slider_category)
+        return self._query_registry.count_sliders(queries)
+
+    def get_sliders_for_sim(
+        self,
+        sim_info: SimInfo,
+        slider_category: CSFSliderCategory=None,
+        ignore_sliders: Tuple[str]=(),
+        additional_tags: Tuple[str]=(),
+        additional_filters: Iterator[CSFSliderTagFilter]=()
+    ) -> Tuple[CSFSlider]:
+        """get_sliders_for_sim(\
+            sim_info,\
+            slider_category=None,\
+            ignore_sliders=(),\
+            additional_tags=(),\
+            additional_filters=()\
         )
+
+        Retrieve Sliders using the criteria.
+
+        :param sim_info: An instance of a Sim
+        :type sim_info: SimInfo
+        :param slider_category: The category of slider. If not specified, sliders will not be filtered by category. Default is None.
+        :type slider_category: CSFSliderCategory, optional
+        :param additional_tags: Additional tags to add to the query. Default is an empty collection.
+        :type additional_tags: Tuple[Any], optional
+        :param ignore_sliders: A collection of identifiers to ignore. Default is an empty collection.
+        :type ignore_sliders: Tuple[str], optional
+        :param additional_filters: Additional filters. Default is an empty collection.
+        :type additional_filters: Iterator[CSFSliderTagFilter], optional.
+        :return: A collection of Sliders matching the criteria.
+        :rtype: Tuple[CSFSlider]
+        """
+        additional_filters = tuple(additional_filters)
+        if self.log.enabled:
+            self.log.format_with_message(
+                'Get Sliders for Sim.',
+                sim_name=CommonSimNameUtils.get_full_name(sim_info),
+                slider_category=slider_category,
+                additional_filters=additional_filters,
+                ignore_sliders=ignore_sliders,
+                additional_tags=additional_tags
+            )
+        if additional_tags or additional_filters:
+            return tuple(self._get_sliders_matching_filters(sim_info, slider_category, additional_tags, additional_filters))
+        queries = self._create_queries_for_sim(sim_info, slider_category)
+        return tuple(self._query_registry.get_sliders(queries))
+
+    def get_category_view_for_sim(self, sim_info: SimInfo) -> CSFSliderCategoryView:
+        """get_category_view_for_sim(sim_info)
+
+        Retrieve the Sliders available for a Sim sorted by name and grouped by category.
+
+        :param sim_info: An instance of a Sim
+        :type sim_info: SimInfo
+        :return: A view of the Sliders available for the Sim. Sims sharing the same Sim Details share the same view.
+        :rtype: CSFSliderCategoryView
+        """
+        queries = self._create_queries_for_sim(sim_info, None)
+        return self._query_registry.get_category_view(queries)
+
+    def _create_queries_for_sim(self, sim_info: SimInfo, slider_category: Union[CSFSliderCategory, None]) -> Tuple[CSFSliderQuery]:
+        sim_details = CSFSimDetailsCache().get_details(sim_info)
+        if slider_category is None:
+            return CSFSliderQueryUtils._SIM_QUERY.bind(sim_details.availability_key, sim_details.sim_type),
+        return CSFSliderQueryUtils._SIM_AND_CATEGORY_QUERY.bind(sim_details.availability_key, sim_details.sim_type, slider_category),
+
+    def _get_sliders_matching_filters(
+        self,
+        sim_info: SimInfo,
+        slider_category: Union[CSFSliderCategory, None],
+        additional_tags: Tuple[str],
+        additional_filters: Tuple[CSFSliderTagFilter]
+    ) -> Set[CSFSlider]:
         filters: Tuple[CSFSliderTagFilter] = (
             CSFSimDetailsSliderFilter(sim_info),
             CSFTagsSliderFilter(additional_tags),
@@ -154,28 +363,35 @@ class CSFSliderQueryUtils(HasLog):
         # Include Object Tag, Include Category Tag
 
         queries: Tuple[CSFSliderQuery] = (self._query_registry.create_query(filters, query_type=CSFQueryType.ALL_PLUS_ANY),)
-        return self._query_registry.has_sliders(queries)
+        sim_details = CSFSimDetailsCache().get_details(sim_info)
+        return self._query_registry.get_sliders(queries) & self._get_sliders_available_for_sim_type(sim_details.sim_type)
 
-    def get_sliders_for_sim(
+    def _get_sliders_available_for_sim_type(self, sim_type: CommonSimType) -> Set[CSFSlider]:
+        # The Include Any tags of a caller would be combined with the Include Any tags of the sim type, so the sim type is matched by its own query.
+        return self._query_registry.get_sliders((CSFSliderQueryUtils._SIM_TYPE_QUERY.bind(sim_type),))
+
+    def get_sliders_for_sims(
         self,
-        sim_info: SimInfo,
+        sim_infos: Iterator[SimInfo],
         slider_category: CSFSliderCategory=None,
         ignore_sliders: Tuple[str]=(),
         additional_tags: Tuple[str]=(),
         additional_filters: Iterator[CSFSliderTagFilter]=()
-    ) -> Tuple[CSFSlider]:
-        """get_sliders_for_sim(\
-            sim_info,\
+    ) -> Dict[SimInfo, Tuple[CSFSlider]]:
+        """get_sliders_for_sims(\
+            sim_infos,\
             slider_category=None,\
             ignore_sliders=(),\
             additional_tags=(),\
             additional_filters=()\
         )
 
-        Retrieve Sliders using the criteria.
+        Retrieve Sliders using the criteria for many Sims at once.
 
-        :param sim_info: An instance of a Sim
-        :type sim_info: SimInfo
+        .. note:: Sims sharing the same Sim Details and sim type share the same result and the criteria other than the Sim Details are only evaluated once per sim type.
+
+        :param sim_infos: Instances of Sims.
+        :type sim_infos: Iterator[SimInfo]
         :param slider_category: The category of slider. If not specified, sliders will not be filtered by category. Default is None.
         :type slider_category: CSFSliderCategory, optional
         :param additional_tags: Additional tags to add to the query. Default is an empty collection.
@@ -184,28 +400,47 @@ class CSFSliderQueryUtils(HasLog):
         :type ignore_sliders: Tuple[str], optional
         :param additional_filters: Additional filters. Default is an empty collection.
         :type additional_filters: Iterator[CSFSliderTagFilter], optional.
-        :return: A collection of Sliders matching the criteria.
-        :rtype: Tuple[CSFSlider]
+        :return: A collection of Sliders matching the criteria, organized by Sim.
+        :rtype: Dict[SimInfo, Tuple[CSFSlider]]
         """
+        sim_infos = tuple(sim_infos)
+        additional_filters = tuple(additional_filters)
         self.log.format_with_message(
-            'Get Sliders for Sim.',
-            sim_name=CommonSimNameUtils.get_full_name(sim_info),
+            'Get Sliders for Sims.',
+            sim_count=len(sim_infos),
             slider_category=slider_category,
-            additional_filters=tuple(additional_filters),
+            additional_filters=additional_filters,
             ignore_sliders=ignore_sliders,
             additional_tags=additional_tags
         )
+        # Sims are grouped by sim type first, since the Sliders located for a sim type are shared by its Sims.
+        sim_infos_by_key_by_sim_type: Dict[CommonSimType, Dict[Tuple[CSFSliderTagType, Any], List[SimInfo]]] = dict()
+        sim_details_tags_by_sim_type: Dict[CommonSimType, List[CSFSliderQueryTag]] = dict()
+        for sim_info in sim_infos:
+            sim_details = CSFSimDetailsCache().get_details(sim_info)
+            sim_infos_by_key = sim_infos_by_key_by_sim_type.setdefault(sim_details.sim_type, dict())
+            sim_details_tag = CSFSliderQueryTag(CSFSliderTagType.SIM_DETAILS, sim_details.availability_key)
+            if sim_details_tag.key not in sim_infos_by_key:
+                sim_infos_by_key[sim_details_tag.key] = list()
+                sim_details_tags_by_sim_type.setdefault(sim_details.sim_type, list()).append(sim_details_tag)
+            sim_infos_by_key[sim_details_tag.key].append(sim_info)
+
         filters: Tuple[CSFSliderTagFilter] = (
-            CSFSimDetailsSliderFilter(sim_info),
             CSFTagsSliderFilter(additional_tags),
-            *tuple(additional_filters)
+            *additional_filters
         )
         if slider_category is not None:
             filters = (
                 *filters,
                 CSFSliderCategorySliderFilter(slider_category),
             )
-        # Include Object Tag, Include Category Tag
 
-        queries: Tuple[CSFSliderQuery] = (self._query_registry.create_query(filters, query_type=CSFQueryType.ALL_PLUS_ANY),)
-        return tuple(self._query_registry.get_sliders(queries))
+        query: CSFSliderQuery = self._query_registry.create_query(filters, query_type=CSFQueryType.ALL_PLUS_ANY)
+        sliders_by_sim_info: Dict[SimInfo, Tuple[CSFSlider]] = dict()
+        for (sim_type, sim_infos_by_key) in sim_infos_by_key_by_sim_type.items():
+            available_sliders = self._get_sliders_available_for_sim_type(sim_type)
+            for (sim_details_key, sliders) in self._query_registry.get_sliders_bound(query, sim_details_tags_by_sim_type[sim_type]).items():
+                sliders = tuple(sliders & available_sliders)
+                for sim_info in sim_infos_by_key[sim_details_key]:
+                    sliders_by_sim_info[sim_info] = sliders
+        return sliders_by_sim_info
@@ -0,0 +1,168 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import re
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Set, Tuple
+
+from cncustomsliderframework.dtos.sliders.slider import CSFSlider
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+
+
+class CSFSliderSearchIndex:
+    """ A search index over the names, authors and tags of the Sliders of a tag index.
+
+    Every word of a term starts a key running to the end of the term. Keys are kept sorted, so the keys starting with a prefix are found with a binary search. Terms are also split into trigrams for fuzzy matches. Every key and every trigram holds the ordinals of its Sliders, the same ordinals as the tag index.
+
+    """
+    NAME_FIELD = 0
+    OTHER_FIELD = 1
+    # The share of the trigrams of the text a Slider must have for a fuzzy match. Text with one character replaced, added or removed still matches a word of four or more characters.
+    FUZZY_MATCH_THRESHOLD = 0.3
+    # The score of a prefix match after two neighbouring characters of the text are swapped, such as 'nsoe' for 'nose'. Trigrams miss these, since nearly every trigram of the text changes.
+    TRANSPOSED_MATCH_SCORE = 0.9
+    _WORD_SEPARATOR = re.compile('[^0-9a-z]+')
+
+    def __init__(self, index: CSFSliderTagIndex) -> None:
+        self._index = index
+        self._sliders: Dict[int, CSFSlider] = dict()
+        self._names: Dict[int, str] = dict()
+        self._ordinals_by_key: Tuple[Dict[str, List[int]], Dict[str, List[int]]] = (dict(), dict())
+        self._sorted_keys: Tuple[List[str], List[str]] = (list(), list())
+        self._trigrams: Tuple[Dict[str, List[int]], Dict[str, List[int]]] = (dict(), dict())
+        self._build()
+
+    def _build(self) -> None:
+        for (ordinal, slider) in self._index.iterate_sliders():
+            self._sliders[ordinal] = slider
+            name = self.normalize(slider.raw_display_name or '')
+            self._names[ordinal] = name
+            self._add_terms(CSFSliderSearchIndex.NAME_FIELD, ordinal, (name,))
+            other_terms: List[str] = list()
+            if slider.author:
+                other_terms.append(self.normalize(slider.author))
+            for tag in slider.tags:
+                other_terms.append(self.normalize(str(tag)))
+            self._add_terms(CSFSliderSearchIndex.OTHER_FIELD, ordinal, other_terms)
+        for field in (CSFSliderSearchIndex.NAME_FIELD, CSFSliderSearchIndex.OTHER_FIELD):
+            self._sorted_keys[field].extend(sorted(self._ordinals_by_key[field].keys()))
+
+    def _add_terms(self, field: int, ordinal: int, terms: Tuple[str, ...]) -> None:
+        ordinals_by_key = self._ordinals_by_key[field]
+        trigrams = self._trigrams[field]
+        for term in terms:
+            if not term:
+                continue
+            # Every word of a term is a prefix entry point, so 'nose' finds 'Nose Width' and 'Wide Nose'.
+            for word_start in self._get_word_starts(term):
+                self._add_ordinal(ordinals_by_key, term[word_start:], ordinal)
+            for trigram in self.get_trigrams(term):
+                self._add_ordinal(trigrams, trigram, ordinal)
+
+    @staticmethod
+    def _add_ordinal(ordinals_by_key: Dict[str, List[int]], key: str, ordinal: int) -> None:
+        ordinals = ordinals_by_key.setdefault(key, list())
+        # Sliders are added in ordinal order, so an ordinal already added to the key is always the last one.
+        if not ordinals or ordinals[-1] != ordinal:
+            ordinals.append(ordinal)
+
+    def search(self, text: str, limit: int=10, available_bitmap: int=-1) -> Tuple[CSFSlider]:
+        """search(text, limit=10, available_bitmap=-1)
+
+        Search for Sliders, ranked by how well they match the text.
+
+        Exact name matches rank first, followed by name prefix matches, author and tag prefix matches and finally fuzzy matches, either by prefix with two neighbouring characters of the text swapped or by shared trigrams.
+
+        :param text: The text to search for.
+        :type text: str
+        :param limit: The maximum number of Sliders to return. Default is 10.
+        :type limit: int, optional
+        :param available_bitmap: A bitmap of the Sliders that may be returned. Default is every Slider.
+        :type available_bitmap: int, optional
+        :return: The best matching Sliders, best match first.
+        :rtype: Tuple[CSFSlider]
+        """
+        text = self.normalize(text)
+        if not text or limit <= 0 or not available_bitmap:
+            return tuple()
+        scores: Dict[int, float] = dict()
+
+        def _score(ordinals: Iterator[int], score: float) -> None:
+            for ordinal in ordinals:
+                if not (available_bitmap >> ordinal) & 1:
+                    continue
+                if scores.get(ordinal, 0.0) < score:
+                    scores[ordinal] = score
+
+        _score(self._iterate_prefix_ordinals(CSFSliderSearchIndex.NAME_FIELD, text), 2.0)
+        _score(self._iterate_prefix_ordinals(CSFSliderSearchIndex.OTHER_FIELD, text), 1.5)
+        for ordinal in tuple(scores.keys()):
+            if self._names[ordinal] == text:
+                scores[ordinal] = 3.0
+
+        # Fuzzy matches score below 1.0.
+        for transposed_text in self._get_transpositions(text):
+            _score(self._iterate_prefix_ordinals(CSFSliderSearchIndex.NAME_FIELD, transposed_text), CSFSliderSearchIndex.TRANSPOSED_MATCH_SCORE)
+            _score(self._iterate_prefix_ordinals(CSFSliderSearchIndex.OTHER_FIELD, transposed_text), 0.75 * CSFSliderSearchIndex.TRANSPOSED_MATCH_SCORE)
+
+        # Trigram matches score by the share of trigrams of the text found within the Slider.
+        text_trigrams = self.get_trigrams(text)
+        for (field_weight, trigrams) in ((1.0, self._trigrams[CSFSliderSearchIndex.NAME_FIELD]), (0.75, self._trigrams[CSFSliderSearchIndex.OTHER_FIELD])):
+            field_shared_trigrams: Dict[int, int] = dict()
+            for trigram in text_trigrams:
+                for ordinal in trigrams.get(trigram, tuple()):
+                    field_shared_trigrams[ordinal] = field_shared_trigrams.get(ordinal, 0) + 1
+            for (ordinal, number_of_shared_trigrams) in field_shared_trigrams.items():
+                if not (available_bitmap >> ordinal) & 1:
+                    continue
+                score = field_weight * number_of_shared_trigrams / (len(text_trigrams) + 1)
+                if score >= CSFSliderSearchIndex.FUZZY_MATCH_THRESHOLD and scores.get(ordinal, 0.0) < score:
+                    scores[ordinal] = score
+
+        ranked_ordinals = sorted(scores.keys(), key=lambda _ordinal: (-scores[_ordinal], self._names[_ordinal], _ordinal))
+        return tuple([self._sliders[ordinal] for ordinal in ranked_ordinals[:limit]])
+
+    def _iterate_prefix_ordinals(self, field: int, prefix: str) -> Iterator[int]:
+        sorted_keys = self._sorted_keys[field]
+        ordinals_by_key = self._ordinals_by_key[field]
+        position = bisect_left(sorted_keys, prefix)
+        while position < len(sorted_keys) and sorted_keys[position].startswith(prefix):
+            yield from ordinals_by_key[sorted_keys[position]]
+            position += 1
+
+    def _get_word_starts(self, term: str) -> Tuple[int, ...]:
+        word_starts: List[int] = [0]
+        for match in CSFSliderSearchIndex._WORD_SEPARATOR.finditer(term):
+            if match.end() < len(term):
+                word_starts.append(match.end())
+        return tuple(word_starts)
+
+    @staticmethod
+    def _get_transpositions(text: str) -> Tuple[str, ...]:
+        transpositions: List[str] = list()
+        for position in range(len(text) - 1):
+            if text[position] == text[position + 1]:
+                continue
+            transpositions.append(text[:position] + text[position + 1] + text[position] + text[position + 2:])
+        return tuple(transpositions)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """ Normalize text for searching. """
+        return str(text).strip().lower()
+
+    @staticmethod
+    def get_trigrams(term: str) -> Tuple[str, ...]:
+        """ Split a normalized term into its distinct trigrams, padded so that short terms and word boundaries have trigrams too. """
+        trigrams: Set[str] = set()
+        for word in CSFSliderSearchIndex._WORD_SEPARATOR.split(term):
+            if not word:
+                continue
+            padded_word = '  {} '.format(word)
+            trigrams.update([padded_word[position:position + 3] for position in range(len(padded_word) - 2)])
+        return tuple(trigrams)
@@ -0,0 +1,223 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+
+from cncustomsliderframework.dtos.sliders.slider import CSFSlider
+from cncustomsliderframework.enums.modifier_types import CSFModifierType
+from cncustomsliderframework.enums.slider_category import CSFSliderCategory
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.slider_availability import CSFSliderAvailability
+from sims.sim_info import SimInfo
+
+
+class CSFSliderTable:
+    """ The Sliders of a tag index stored column by column, one row per ordinal.
+
+    Availability columns store the section of the availability mask of each Slider for genders, ages, species, occult types and sim types, using the bits of CSFSliderAvailability. The categories column stores a mask with the bit of the value of each category set. Masks are Python ints, so they are not limited in the number of values they hold.
+
+    Bulk questions are answered by scanning a column once into a bitmap of the rows matching it. Bitmaps of availability values and of the Sliders available for each Sim signature are kept, so they are only scanned for once.
+
+    """
+    GENDERS = 'genders'
+    AGES = 'ages'
+    SPECIES = 'species'
+    OCCULT_TYPES = 'occult_types'
+    SIM_TYPES = 'sim_types'
+    CATEGORIES = 'categories'
+    MODIFIER_TYPES = 'modifier_types'
+    MINIMUM_VALUES = 'minimum_values'
+    MAXIMUM_VALUES = 'maximum_values'
+    POSITIVE_MODIFIER_IDS = 'positive_modifier_ids'
+    NEGATIVE_MODIFIER_IDS = 'negative_modifier_ids'
+    AVAILABILITY_COLUMNS: Tuple[str, ...] = (GENDERS, AGES, SPECIES, OCCULT_TYPES, SIM_TYPES)
+
+    def __init__(self, index: CSFSliderTagIndex) -> None:
+        self._index = index
+        self._columns: Dict[str, Union[array, List[int]]] = {
+            CSFSliderTable.GENDERS: list(),
+            CSFSliderTable.AGES: list(),
+            CSFSliderTable.SPECIES: list(),
+            CSFSliderTable.OCCULT_TYPES: list(),
+            CSFSliderTable.SIM_TYPES: list(),
+            CSFSliderTable.CATEGORIES: list(),
+            CSFSliderTable.MODIFIER_TYPES: array('b'),
+            CSFSliderTable.MINIMUM_VALUES: array('d'),
+            CSFSliderTable.MAXIMUM_VALUES: array('d'),
+            CSFSliderTable.POSITIVE_MODIFIER_IDS: array('Q'),
+            CSFSliderTable.NEGATIVE_MODIFIER_IDS: array('Q'),
+        }
+        self._present_bitmap = 0
+        # Sliders with an availability value CSFSliderAvailability has no bit for are checked against the Sim instead.
+        self._unmasked_bitmap = 0
+        self._bitmaps_by_bit: Dict[Tuple[str, int], int] = dict()
+        self._available_bitmaps_by_signature: Dict[int, int] = dict()
+        self._build()
+
+    def _build(self) -> None:
+        columns = self._columns
+        number_of_rows = self._index.slider_count
+        # Rows of removed Sliders are kept empty, so that row numbers equal ordinals.
+        for column in (*CSFSliderTable.AVAILABILITY_COLUMNS, CSFSliderTable.CATEGORIES):
+            columns[column].extend([0] * number_of_rows)
+        columns[CSFSliderTable.MODIFIER_TYPES].extend([-1] * number_of_rows)
+        columns[CSFSliderTable.MINIMUM_VALUES].extend([0.0] * number_of_rows)
+        columns[CSFSliderTable.MAXIMUM_VALUES].extend([0.0] * number_of_rows)
+        columns[CSFSliderTable.POSITIVE_MODIFIER_IDS].extend([0] * number_of_rows)
+        columns[CSFSliderTable.NEGATIVE_MODIFIER_IDS].extend([0] * number_of_rows)
+        # noinspection PyProtectedMember
+        (_, section_masks) = CSFSliderAvailability._get_layout()
+        present_ordinals: List[int] = list()
+        unmasked_ordinals: List[int] = list()
+        for (ordinal, slider) in self._index.iterate_sliders():
+            present_ordinals.append(ordinal)
+            availability_mask = slider.availability_mask
+            if availability_mask is None:
+                unmasked_ordinals.append(ordinal)
+                availability_mask = 0
+            for column in CSFSliderTable.AVAILABILITY_COLUMNS:
+                columns[column][ordinal] = availability_mask & section_masks[column]
+            category_mask = 0
+            for slider_category in slider.categories:
+                category_mask |= 1 << int(slider_category)
+            columns[CSFSliderTable.CATEGORIES][ordinal] = category_mask
+            columns[CSFSliderTable.MODIFIER_TYPES][ordinal] = int(slider.modifier_type)
+            columns[CSFSliderTable.MINIMUM_VALUES][ordinal] = slider.minimum_value
+            columns[CSFSliderTable.MAXIMUM_VALUES][ordinal] = slider.maximum_value
+            columns[CSFSliderTable.POSITIVE_MODIFIER_IDS][ordinal] = slider.positive_modifier_id
+            columns[CSFSliderTable.NEGATIVE_MODIFIER_IDS][ordinal] = slider.negative_modifier_id
+        self._present_bitmap = CSFSliderTagIndex.to_bitmap(present_ordinals)
+        self._unmasked_bitmap = CSFSliderTagIndex.to_bitmap(unmasked_ordinals)
+
+    @property
+    def number_of_rows(self) -> int:
+        """ The number of rows of the table, including empty rows of removed Sliders. """
+        return len(self._columns[CSFSliderTable.MODIFIER_TYPES])
+
+    def get_column(self, column: str) -> Union[array, List[int]]:
+        """ Retrieve the values of a column, indexed by ordinal. """
+        return self._columns[column]
+
+    def get_value(self, column: str, ordinal: int) -> Any:
+        """ Retrieve the value of a column for an ordinal. """
+        return self._columns[column][ordinal]
+
+    def get_available_bitmap(self, sim_info: SimInfo) -> int:
+        """get_available_bitmap(sim_info)
+
+        Retrieve a bitmap of the Sliders available for a Sim.
+
+        :param sim_info: An instance of a Sim.
+        :type sim_info: SimInfo
+        :return: A bitmap of the Sliders available for the gender, age, species, current occult type and sim type of the Sim.
+        :rtype: int
+        """
+        sim_signature = CSFSliderAvailability().get_sim_signature(sim_info)
+        if sim_signature is None:
+            return self._select_sliders(self._present_bitmap, lambda slider: slider.is_available_for(sim_info))
+        available_bitmap = self.get_available_bitmap_for_signature(sim_signature)
+        if self._unmasked_bitmap:
+            available_bitmap |= self._select_sliders(self._unmasked_bitmap, lambda slider: slider.is_available_for(sim_info, sim_signature=sim_signature))
+        return available_bitmap
+
+    def get_available_bitmap_for_signature(self, sim_signature: int) -> int:
+        """get_available_bitmap_for_signature(sim_signature)
+
+        Retrieve a bitmap of the Sliders available for an availability signature.
+
+        .. note:: Sliders with an availability value that has no bit are not included.
+
+        :param sim_signature: The availability signature of a Sim, from CSFSliderAvailability.
+        :type sim_signature: int
+        :return: A bitmap of the Sliders whose availability mask contains the whole signature.
+        :rtype: int
+        """
+        available_bitmap = self._available_bitmaps_by_signature.get(sim_signature, None)
+        if available_bitmap is not None:
+            return available_bitmap
+        # noinspection PyProtectedMember
+        (_, section_masks) = CSFSliderAvailability._get_layout()
+        available_bitmap = self._present_bitmap & ~self._unmasked_bitmap
+        for column in CSFSliderTable.AVAILABILITY_COLUMNS:
+            available_bitmap &= self.get_bitmap_with_bits(column, sim_signature & section_masks[column])
+            if not available_bitmap:
+                break
+        self._available_bitmaps_by_signature[sim_signature] = available_bitmap
+        return available_bitmap
+
+    def get_bitmap_with_bits(self, column: str, bits: int) -> int:
+        """get_bitmap_with_bits(column, bits)
+
+        Retrieve a bitmap of the rows of a mask column containing every one of the bits.
+
+        :param column: One of the AVAILABILITY_COLUMNS or CATEGORIES.
+        :type column: str
+        :param bits: The bits to look for.
+        :type bits: int
+        :return: A bitmap of the rows whose mask contains all of the bits.
+        :rtype: int
+        """
+        bitmap = self._bitmaps_by_bit.get((column, bits), None)
+        if bitmap is None:
+            bitmap = self.select(column, lambda mask: mask & bits == bits)
+            self._bitmaps_by_bit[(column, bits)] = bitmap
+        return bitmap
+
+    def get_bitmap_for_category(self, slider_category: CSFSliderCategory) -> int:
+        """ Retrieve a bitmap of the Sliders within a category. """
+        return self.get_bitmap_with_bits(CSFSliderTable.CATEGORIES, 1 << int(slider_category))
+
+    def get_bitmap_for_modifiers(self, modifier_ids: Iterator[int]) -> int:
+        """get_bitmap_for_modifiers(modifier_ids)
+
+        Retrieve a bitmap of the Sliders changing any of the modifiers, either with their positive or their negative modifier id.
+
+        :param modifier_ids: The decimal identifiers of modifiers.
+        :type modifier_ids: Iterator[int]
+        :return: A bitmap of the Sliders changing at least one of the modifiers.
+        :rtype: int
+        """
+        modifier_ids = set(modifier_ids)
+        modifier_ids.discard(0)
+        if not modifier_ids:
+            return 0
+        return self.select(CSFSliderTable.POSITIVE_MODIFIER_IDS, lambda modifier_id: modifier_id in modifier_ids)\
+            | self.select(CSFSliderTable.NEGATIVE_MODIFIER_IDS, lambda modifier_id: modifier_id in modifier_ids)
+
+    def get_bitmap_for_modifier_type(self, modifier_type: CSFModifierType) -> int:
+        """ Retrieve a bitmap of the Sliders of a modifier type. """
+        return self.select(CSFSliderTable.MODIFIER_TYPES, lambda value: value == int(modifier_type))
+
+    def select(self, column: str, predicate: Callable[[Any], bool]) -> int:
+        """select(column, predicate)
+
+        Scan a column for the rows matching a predicate.
+
+        :param column: The column to scan.
+        :type column: str
+        :param predicate: A function invoked with the value of each row.
+        :type predicate: Callable[[Any], bool]
+        :return: A bitmap of the Sliders whose value matches the predicate.
+        :rtype: int
+        """
+        return CSFSliderTagIndex.to_bitmap([ordinal for (ordinal, value) in enumerate(self._columns[column]) if predicate(value)]) & self._present_bitmap
+
+    def to_sliders(self, bitmap: int) -> Tuple[CSFSlider]:
+        """ Convert a bitmap into the Sliders it contains, in ordinal order. """
+        return self._index.to_sliders(bitmap)
+
+    def iterate_rows(self, bitmap: int, *columns: str) -> Iterator[Tuple[Any, ...]]:
+        """ Iterate the values of columns for each ordinal within a bitmap. """
+        selected_columns = [self._columns[column] for column in columns]
+        for ordinal in CSFSliderTagIndex.iterate_ordinals(bitmap & self._present_bitmap):
+            yield tuple([selected_column[ordinal] for selected_column in selected_columns])
+
+    def _select_sliders(self, bitmap: int, predicate: Callable[[CSFSlider], bool]) -> int:
+        # The bitmap only contains rows of Sliders within the index, so its ordinals and its Sliders line up.
+        return CSFSliderTagIndex.to_bitmap([ordinal for (ordinal, slider) in zip(CSFSliderTagIndex.iterate_ordinals(bitmap), self._index.to_sliders(bitmap)) if predicate(slider)])
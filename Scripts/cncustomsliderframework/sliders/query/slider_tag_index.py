@@ -0,0 +1,370 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, Dict, Iterator, List, Set, Tuple, Union
+
+from cncustomsliderframework.dtos.sliders.slider import CSFSlider
+from cncustomsliderframework.sliders.query.slider_tag_statistics import CSFSliderTagStatistics
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+
+
+class CSFSliderTagIndex:
+    """ An index of Sliders organized by tag keys.
+
+    Every Slider is given a dense integer ordinal and every tag key holds a bitmap (a Python int) of the ordinals of the Sliders that have the tag.
+
+    Sliders may be added, removed or updated after the index is built. Ordinals of removed Sliders are left empty until the index is built again.
+
+    """
+    def __init__(self) -> None:
+        self._sliders_by_ordinal: List[Union[CSFSlider, None]] = list()
+        self._ordinal_by_identifier: Dict[str, int] = dict()
+        self._library: Dict[Tuple[CSFSliderTagType, Any], int] = dict()
+        self._statistics = CSFSliderTagStatistics()
+        self._tag_keys_by_ordinal: List[Tuple[Tuple[CSFSliderTagType, Any], ...]] = list()
+        self._combined_tag_types: Dict[CSFSliderTagType, Tuple[CSFSliderTagType, ...]] = dict()
+
+    @property
+    def library(self) -> Dict[Tuple[CSFSliderTagType, Any], int]:
+        """ A library of Slider bitmaps organized by tag keys. """
+        return self._library
+
+    @property
+    def statistics(self) -> CSFSliderTagStatistics:
+        """ The number of Sliders of each tag key and of each tag type. """
+        return self._statistics
+
+    @property
+    def number_of_sliders(self) -> int:
+        """ The number of Sliders within the index. """
+        return len(self._ordinal_by_identifier)
+
+    @property
+    def slider_count(self) -> int:
+        """ The number of ordinals handed out by the index. """
+        return len(self._sliders_by_ordinal)
+
+    @classmethod
+    def build(cls, slider_tag_keys: Iterator[Tuple[CSFSlider, Iterator[Tuple[CSFSliderTagType, Any]]]]) -> 'CSFSliderTagIndex':
+        """build(slider_tag_keys)
+
+        Build an index from Sliders and the tag keys that apply to them.
+
+        :param slider_tag_keys: An iterable of Sliders paired with the tag keys of each Slider.
+        :type slider_tag_keys: Iterator[Tuple[CSFSlider, Iterator[Tuple[CSFSliderTagType, Any]]]]
+        :return: The built index.
+        :rtype: CSFSliderTagIndex
+        """
+        index = cls()
+        ordinals_by_key: Dict[Tuple[CSFSliderTagType, Any], List[int]] = dict()
+        for (slider, tag_keys) in slider_tag_keys:
+            slider_identifier = slider.unique_identifier
+            if slider_identifier in index._ordinal_by_identifier:
+                continue
+            tag_keys = tuple(tag_keys)
+            ordinal = len(index._sliders_by_ordinal)
+            index._sliders_by_ordinal.append(slider)
+            index._ordinal_by_identifier[slider_identifier] = ordinal
+            index._tag_keys_by_ordinal.append(tag_keys)
+            for tag_key in tag_keys:
+                if tag_key not in ordinals_by_key:
+                    ordinals_by_key[tag_key] = list()
+                ordinals_by_key[tag_key].append(ordinal)
+
+        for (tag_key, ordinals) in ordinals_by_key.items():
+            bitmap = cls.to_bitmap(ordinals)
+            index._library[tag_key] = bitmap
+            index._statistics._set_count(tag_key, cls.count(bitmap))
+        return index
+
+    @classmethod
+    def from_state(
+        cls,
+        sliders_by_ordinal: Iterator[Union[CSFSlider, None]],
+        tag_keys_by_ordinal: Iterator[Tuple[Tuple[CSFSliderTagType, Any], ...]],
+        combined_tag_types: Dict[CSFSliderTagType, Tuple[CSFSliderTagType, ...]],
+        library: Dict[Tuple[CSFSliderTagType, Any], int]
+    ) -> 'CSFSliderTagIndex':
+        """from_state(sliders_by_ordinal, tag_keys_by_ordinal, combined_tag_types, library)
+
+        Restore an index from the state retrieved with :func:`get_state`.
+
+        :param sliders_by_ordinal: The Slider of each ordinal, None for ordinals of removed Sliders.
+        :type sliders_by_ordinal: Iterator[Union[CSFSlider, None]]
+        :param tag_keys_by_ordinal: The tag keys of each ordinal, excluding combined keys.
+        :type tag_keys_by_ordinal: Iterator[Tuple[Tuple[CSFSliderTagType, Any], ...]]
+        :param combined_tag_types: The tag types combined into each combined tag type.
+        :type combined_tag_types: Dict[CSFSliderTagType, Tuple[CSFSliderTagType, ...]]
+        :param library: The bitmap of each tag key, including combined keys.
+        :type library: Dict[Tuple[CSFSliderTagType, Any], int]
+        :return: The restored index.
+        :rtype: CSFSliderTagIndex
+        """
+        index = cls()
+        index._sliders_by_ordinal = list(sliders_by_ordinal)
+        index._tag_keys_by_ordinal = [tuple(tag_keys) for tag_keys in tag_keys_by_ordinal]
+        for (ordinal, slider) in enumerate(index._sliders_by_ordinal):
+            if slider is None:
+                continue
+            index._ordinal_by_identifier[slider.unique_identifier] = ordinal
+        index._combined_tag_types = dict(combined_tag_types)
+        for (tag_key, bitmap) in library.items():
+            if not bitmap:
+                continue
+            index._library[tag_key] = bitmap
+            index._statistics._set_count(tag_key, cls.count(bitmap))
+        return index
+
+    def get_state(self) -> Tuple[Tuple[Union[CSFSlider, None], ...], Tuple[Tuple[Tuple[CSFSliderTagType, Any], ...], ...], Dict[CSFSliderTagType, Tuple[CSFSliderTagType, ...]], Dict[Tuple[CSFSliderTagType, Any], int]]:
+        """ Retrieve the Slider of each ordinal, the tag keys of each ordinal, the combined tag types and the bitmap of each tag key, for use with :func:`from_state`. """
+        return tuple(self._sliders_by_ordinal), tuple(self._tag_keys_by_ordinal), dict(self._combined_tag_types), dict(self._library)
+
+    def add_combined_keys(self, combined_tag_type: CSFSliderTagType, tag_types: Tuple[CSFSliderTagType, ...]) -> int:
+        """add_combined_keys(combined_tag_type, tag_types)
+
+        Precompute the Sliders matching every combination of values of the tag types.
+
+        Each combination is stored under the key (combined_tag_type, (value, value, ...)) with values in the order of the tag types. Combinations no Slider matches are not stored.
+
+        :param combined_tag_type: The tag type the combinations are stored under.
+        :type combined_tag_type: CSFSliderTagType
+        :param tag_types: The tag types to combine.
+        :type tag_types: Tuple[CSFSliderTagType, ...]
+        :return: The number of combinations stored.
+        :rtype: int
+        """
+        self._combined_tag_types[combined_tag_type] = tag_types
+        values_by_tag_type: Dict[CSFSliderTagType, List[Any]] = {tag_type: list() for tag_type in tag_types}
+        for (tag_type, value) in tuple(self._library.keys()):
+            if tag_type not in values_by_tag_type:
+                continue
+            values_by_tag_type[tag_type].append(value)
+
+        combinations: List[Tuple[Tuple[Any, ...], int]] = [(tuple(), -1)]
+        for tag_type in tag_types:
+            next_combinations: List[Tuple[Tuple[Any, ...], int]] = list()
+            for (values, bitmap) in combinations:
+                for value in values_by_tag_type[tag_type]:
+                    combined_bitmap = self.intersect(((tag_type, value),), bitmap=bitmap)
+                    if not combined_bitmap:
+                        continue
+                    next_combinations.append(((*values, value), combined_bitmap))
+            combinations = next_combinations
+
+        for (values, bitmap) in combinations:
+            combined_tag_key = (combined_tag_type, values)
+            self._library[combined_tag_key] = bitmap
+            self._statistics._set_count(combined_tag_key, self.count(bitmap))
+        return len(combinations)
+
+    def add_slider(self, slider: CSFSlider, tag_keys: Iterator[Tuple[CSFSliderTagType, Any]]) -> Set[Tuple[CSFSliderTagType, Any]]:
+        """add_slider(slider, tag_keys)
+
+        Add a Slider to the index, giving it the next ordinal.
+
+        :param slider: The Slider to add.
+        :type slider: CSFSlider
+        :param tag_keys: The tag keys of the Slider.
+        :type tag_keys: Iterator[Tuple[CSFSliderTagType, Any]]
+        :return: The tag keys whose Sliders changed, including combined keys. Empty if the Slider is already within the index.
+        :rtype: Set[Tuple[CSFSliderTagType, Any]]
+        """
+        slider_identifier = slider.unique_identifier
+        if slider_identifier in self._ordinal_by_identifier:
+            return set()
+        tag_keys = tuple(tag_keys)
+        ordinal = len(self._sliders_by_ordinal)
+        self._sliders_by_ordinal.append(slider)
+        self._ordinal_by_identifier[slider_identifier] = ordinal
+        self._tag_keys_by_ordinal.append(tag_keys)
+        changed_tag_keys = self._with_combined_keys(tag_keys)
+        for tag_key in changed_tag_keys:
+            self._set_ordinal(tag_key, ordinal)
+        return changed_tag_keys
+
+    def remove_slider(self, slider_identifier: str) -> Set[Tuple[CSFSliderTagType, Any]]:
+        """remove_slider(slider_identifier)
+
+        Remove a Slider from the index. Tag keys no Slider has anymore are removed as well.
+
+        :param slider_identifier: The identifier of the Slider to remove.
+        :type slider_identifier: str
+        :return: The tag keys whose Sliders changed, including combined keys. Empty if the Slider is not within the index.
+        :rtype: Set[Tuple[CSFSliderTagType, Any]]
+        """
+        ordinal = self._ordinal_by_identifier.pop(slider_identifier, None)
+        if ordinal is None:
+            return set()
+        changed_tag_keys = self._with_combined_keys(self._tag_keys_by_ordinal[ordinal])
+        self._sliders_by_ordinal[ordinal] = None
+        self._tag_keys_by_ordinal[ordinal] = tuple()
+        for tag_key in changed_tag_keys:
+            self._clear_ordinal(tag_key, ordinal)
+        return changed_tag_keys
+
+    def update_slider(self, slider: CSFSlider, tag_keys: Iterator[Tuple[CSFSliderTagType, Any]]) -> Set[Tuple[CSFSliderTagType, Any]]:
+        """update_slider(slider, tag_keys)
+
+        Replace a Slider within the index, keeping its ordinal. The Slider is added if it is not within the index.
+
+        :param slider: The Slider to update.
+        :type slider: CSFSlider
+        :param tag_keys: The tag keys of the Slider.
+        :type tag_keys: Iterator[Tuple[CSFSliderTagType, Any]]
+        :return: The tag keys whose Sliders changed, including combined keys. The keys of both the old and the new Slider are included, since results of either hold the replaced Slider.
+        :rtype: Set[Tuple[CSFSliderTagType, Any]]
+        """
+        ordinal = self._ordinal_by_identifier.get(slider.unique_identifier, None)
+        if ordinal is None:
+            return self.add_slider(slider, tag_keys)
+        tag_keys = tuple(tag_keys)
+        old_tag_keys = self._with_combined_keys(self._tag_keys_by_ordinal[ordinal])
+        new_tag_keys = self._with_combined_keys(tag_keys)
+        self._sliders_by_ordinal[ordinal] = slider
+        self._tag_keys_by_ordinal[ordinal] = tag_keys
+        for tag_key in old_tag_keys - new_tag_keys:
+            self._clear_ordinal(tag_key, ordinal)
+        for tag_key in new_tag_keys - old_tag_keys:
+            self._set_ordinal(tag_key, ordinal)
+        return old_tag_keys | new_tag_keys
+
+    def _with_combined_keys(self, tag_keys: Tuple[Tuple[CSFSliderTagType, Any], ...]) -> Set[Tuple[CSFSliderTagType, Any]]:
+        all_tag_keys = set(tag_keys)
+        for (combined_tag_type, tag_types) in self._combined_tag_types.items():
+            values_by_tag_type: Dict[CSFSliderTagType, List[Any]] = {tag_type: list() for tag_type in tag_types}
+            for (tag_type, value) in all_tag_keys:
+                if tag_type not in values_by_tag_type:
+                    continue
+                values_by_tag_type[tag_type].append(value)
+            combinations: List[Tuple[Any, ...]] = [tuple()]
+            for tag_type in tag_types:
+                combinations = [(*values, value) for values in combinations for value in values_by_tag_type[tag_type]]
+            for values in combinations:
+                all_tag_keys.add((combined_tag_type, values))
+        return all_tag_keys
+
+    def _set_ordinal(self, tag_key: Tuple[CSFSliderTagType, Any], ordinal: int) -> None:
+        bitmap = self._library.get(tag_key, 0)
+        ordinal_bit = 1 << ordinal
+        if bitmap & ordinal_bit:
+            return
+        self._library[tag_key] = bitmap | ordinal_bit
+        self._statistics._set_count(tag_key, self._statistics.get_count(tag_key) + 1)
+
+    def _clear_ordinal(self, tag_key: Tuple[CSFSliderTagType, Any], ordinal: int) -> None:
+        bitmap = self._library.get(tag_key, 0)
+        ordinal_bit = 1 << ordinal
+        if not bitmap & ordinal_bit:
+            return
+        bitmap &= ~ordinal_bit
+        if not bitmap:
+            # Keep the library free of empty keys, a missing key means no Slider has the tag.
+            del self._library[tag_key]
+            self._statistics._set_count(tag_key, 0)
+            return
+        self._library[tag_key] = bitmap
+        self._statistics._set_count(tag_key, self._statistics.get_count(tag_key) - 1)
+
+    def has_key(self, tag_key: Tuple[CSFSliderTagType, Any]) -> bool:
+        """ Determine if any Slider has a tag key. """
+        return tag_key in self._library
+
+    def get_bitmap(self, tag_key: Tuple[CSFSliderTagType, Any]) -> int:
+        """ Retrieve the bitmap of Sliders with a tag key. """
+        return self._library.get(tag_key, 0)
+
+    def get_count(self, tag_key: Tuple[CSFSliderTagType, Any]) -> int:
+        """ Retrieve the number of Sliders with a tag key. """
+        return self._statistics.get_count(tag_key)
+
+    def intersect(self, tag_keys: Iterator[Tuple[CSFSliderTagType, Any]], bitmap: int = -1) -> int:
+        """intersect(tag_keys, bitmap=-1)
+
+        Intersect the bitmaps of tag keys, stopping as soon as no Slider is left.
+
+        :param tag_keys: The tag keys to intersect.
+        :type tag_keys: Iterator[Tuple[CSFSliderTagType, Any]]
+        :param bitmap: The bitmap to start from. Default is -1, which has every bit set.
+        :type bitmap: int, optional
+        :return: A bitmap of the Sliders with every tag key. The starting bitmap if there are no tag keys.
+        :rtype: int
+        """
+        # -1 has every bit set, so it is the identity for the first intersection.
+        for tag_key in tag_keys:
+            bitmap &= self._library.get(tag_key, 0)
+            if not bitmap:
+                break
+        return bitmap
+
+    def get_all_bitmap(self) -> int:
+        """ Retrieve a bitmap of every Slider within the index. """
+        return self.to_bitmap(self._ordinal_by_identifier.values())
+
+    def get_ordinal(self, slider_identifier: str) -> Union[int, None]:
+        """ Retrieve the ordinal of a Slider by its identifier. """
+        return self._ordinal_by_identifier.get(slider_identifier, None)
+
+    def to_sliders(self, bitmap: int) -> Tuple[CSFSlider]:
+        """ Convert a bitmap into the Sliders it contains, in ordinal order. """
+        sliders_by_ordinal = self._sliders_by_ordinal
+        sliders: List[CSFSlider] = list()
+        for ordinal in self.iterate_ordinals(bitmap):
+            slider = sliders_by_ordinal[ordinal]
+            if slider is None:
+                continue
+            sliders.append(slider)
+        return tuple(sliders)
+
+    def iterate_sliders(self) -> Iterator[Tuple[int, CSFSlider]]:
+        """ Iterate the Sliders within the index along with their ordinal, in ordinal order. """
+        for (ordinal, slider) in enumerate(self._sliders_by_ordinal):
+            if slider is None:
+                continue
+            yield ordinal, slider
+
+    def get_first_slider(self, bitmap: int) -> Union[CSFSlider, None]:
+        """ Retrieve the Slider with the lowest ordinal within a bitmap or None if the bitmap is empty. """
+        if not bitmap:
+            return None
+        return self._sliders_by_ordinal[self.get_first_ordinal(bitmap)]
+
+    @staticmethod
+    def get_first_ordinal(bitmap: int) -> Union[int, None]:
+        """ Retrieve the lowest ordinal set in a bitmap or None if the bitmap is empty. """
+        if not bitmap:
+            return None
+        # Isolates the lowest set bit.
+        return (bitmap & -bitmap).bit_length() - 1
+
+    @staticmethod
+    def to_bitmap(ordinals: Iterator[int]) -> int:
+        """ Convert ordinals into a bitmap. """
+        ordinals = tuple(ordinals)
+        if not ordinals:
+            return 0
+        data = bytearray((max(ordinals) >> 3) + 1)
+        for ordinal in ordinals:
+            data[ordinal >> 3] |= 1 << (ordinal & 7)
+        return int.from_bytes(data, 'little')
+
+    @staticmethod
+    def iterate_ordinals(bitmap: int) -> Iterator[int]:
+        """ Iterate the ordinals set in a bitmap, in ascending order. """
+        if not bitmap:
+            return
+        # Reversed so that string position equals ordinal.
+        bits = bin(bitmap)[:1:-1]
+        ordinal = bits.find('1')
+        while ordinal != -1:
+            yield ordinal
+            ordinal = bits.find('1', ordinal + 1)
+
+    @staticmethod
+    def count(bitmap: int) -> int:
+        """ Count the Sliders contained in a bitmap. """
+        return bin(bitmap).count('1')
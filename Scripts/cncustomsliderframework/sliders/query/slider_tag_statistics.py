@@ -0,0 +1,95 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, Dict, Tuple
+
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+
+
+class CSFSliderTagStatistics:
+    """ The number of Sliders of each tag key of an index, summarized per tag type.
+
+    The statistics are kept up to date by the index as Sliders are organized, added and removed, so reading them never walks the bitmaps of the index.
+
+    """
+    def __init__(self) -> None:
+        self._counts: Dict[Tuple[CSFSliderTagType, Any], int] = dict()
+        self._number_of_values_by_tag_type: Dict[CSFSliderTagType, int] = dict()
+        self._total_count_by_tag_type: Dict[CSFSliderTagType, int] = dict()
+
+    @property
+    def number_of_keys(self) -> int:
+        """ The number of tag keys with at least one Slider. """
+        return len(self._counts)
+
+    @property
+    def total_count(self) -> int:
+        """ The number of tag keys of all Sliders combined. """
+        return sum(self._total_count_by_tag_type.values())
+
+    @property
+    def tag_types(self) -> Tuple[CSFSliderTagType]:
+        """ The tag types with at least one Slider. """
+        return tuple(self._number_of_values_by_tag_type.keys())
+
+    def get_count(self, tag_key: Tuple[CSFSliderTagType, Any]) -> int:
+        """ Retrieve the number of Sliders with a tag key. """
+        return self._counts.get(tag_key, 0)
+
+    def get_counts(self, tag_type: CSFSliderTagType=None) -> Dict[Tuple[CSFSliderTagType, Any], int]:
+        """get_counts(tag_type=None)
+
+        Retrieve the number of Sliders of each tag key.
+
+        :param tag_type: If specified, only tag keys of this tag type are included. Default is None.
+        :type tag_type: CSFSliderTagType, optional
+        :return: The number of Sliders organized by tag key.
+        :rtype: Dict[Tuple[CSFSliderTagType, Any], int]
+        """
+        if tag_type is None:
+            return dict(self._counts)
+        return {tag_key: count for (tag_key, count) in self._counts.items() if tag_key[0] == tag_type}
+
+    def get_number_of_values(self, tag_type: CSFSliderTagType) -> int:
+        """ Retrieve the number of distinct values of a tag type. """
+        return self._number_of_values_by_tag_type.get(tag_type, 0)
+
+    def get_total_count(self, tag_type: CSFSliderTagType) -> int:
+        """ Retrieve the number of tag keys of a tag type of all Sliders combined. """
+        return self._total_count_by_tag_type.get(tag_type, 0)
+
+    def get_largest_keys(self, limit: int=10) -> Tuple[Tuple[Tuple[CSFSliderTagType, Any], int]]:
+        """ Retrieve the tag keys with the most Sliders along with their number of Sliders, largest first. """
+        return tuple(sorted(self._counts.items(), key=lambda item: item[1], reverse=True)[:limit])
+
+    def _set_count(self, tag_key: Tuple[CSFSliderTagType, Any], count: int) -> None:
+        tag_type = tag_key[0]
+        previous_count = self._counts.get(tag_key, 0)
+        if count == previous_count:
+            return
+        if not previous_count:
+            self._number_of_values_by_tag_type[tag_type] = self._number_of_values_by_tag_type.get(tag_type, 0) + 1
+        self._total_count_by_tag_type[tag_type] = self._total_count_by_tag_type.get(tag_type, 0) + count - previous_count
+        if count:
+            self._counts[tag_key] = count
+            return
+        del self._counts[tag_key]
+        self._number_of_values_by_tag_type[tag_type] -= 1
+        if not self._number_of_values_by_tag_type[tag_type]:
+            del self._number_of_values_by_tag_type[tag_type]
+            del self._total_count_by_tag_type[tag_type]
+
+    def __repr__(self) -> str:
+        return '<number_of_keys: {}, total_count: {}, tag_types: {}>'.format(
+            self.number_of_keys,
+            self.total_count,
+            ', '.join(['{}: {} values, {} total'.format(tag_type.name, self.get_number_of_values(tag_type), self.get_total_count(tag_type)) for tag_type in self.tag_types])
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
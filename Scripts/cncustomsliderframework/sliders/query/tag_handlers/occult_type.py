@@ -0,0 +1,30 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Tuple, Any
+
+from cncustomsliderframework.dtos.sliders.slider import CSFSlider
+from cncustomsliderframework.sliders.query.tag_handlers.slider_tag_handler import CSFSliderTagHandler
+from cncustomsliderframework.sliders.slider_query_registry import CSFSliderQueryRegistry
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from sims4communitylib.enums.common_occult_type import CommonOccultType
+
+
+@CSFSliderQueryRegistry.register_tag_handler(tag_type=CSFSliderTagType.OCCULT_TYPE)
+class CSFOccultTypeTagHandler(CSFSliderTagHandler):
+    """ Tags. Sliders not limited to any occult type are tagged with every occult type. """
+
+    # noinspection PyMissingOrEmptyDocstring
+    def get_tags(self, slider: CSFSlider) -> Tuple[Any]:
+        if slider.available_for.occult_types:
+            return tuple(slider.available_for.occult_types)
+        return tuple([occult_type for occult_type in CommonOccultType.values if occult_type != CommonOccultType.NONE])
+
+    # noinspection PyMissingOrEmptyDocstring
+    def applies(self, slider: CSFSlider) -> bool:
+        return True
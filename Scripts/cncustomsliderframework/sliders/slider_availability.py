@@ -0,0 +1,139 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, Dict, Tuple, Union
+
+from cncustomsliderframework.dtos.sims.sim_details import CSFSimDetails
+from cncustomsliderframework.modinfo import ModInfo
+from cncustomsliderframework.sim_details_cache import CSFSimDetailsCache
+from sims.sim_info import SimInfo
+from sims4communitylib.classes.calculations.common_available_for_sim import CommonAvailableForSim
+from sims4communitylib.enums.common_age import CommonAge
+from sims4communitylib.enums.common_gender import CommonGender
+from sims4communitylib.enums.common_occult_type import CommonOccultType
+from sims4communitylib.enums.common_species import CommonSpecies
+from sims4communitylib.enums.sim_type import CommonSimType
+from sims4communitylib.logging.has_log import HasLog
+from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.services.common_service import CommonService
+
+
+class CSFSliderAvailability(CommonService, HasLog):
+    """ Availability of Sliders for Sims expressed as bitmasks.
+
+    Every gender, age, species, occult type and sim type is given a bit. A Slider is given a mask of the values it is available for, with every bit of a section set when it does not limit that section. A Sim is given a signature with the bit of its gender, age, species, current occult type and sim type set, so a Slider is available for a Sim when the mask contains the whole signature.
+
+    Signatures are cached per distinct details, which are read from the cached details of the Sim.
+
+    """
+    _SECTIONS: Tuple[Tuple[str, Any], ...] = (
+        ('genders', CommonGender),
+        ('ages', CommonAge),
+        ('species', CommonSpecies),
+        ('occult_types', CommonOccultType),
+        ('sim_types', CommonSimType),
+    )
+    _BIT_BY_VALUE: Dict[str, Dict[Any, int]] = None
+    _SECTION_MASKS: Dict[str, int] = None
+    _NO_SIGNATURE = object()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._signatures: Dict[CSFSimDetails, Union[int, None]] = dict()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def log_identifier(self) -> str:
+        return 'csf_slider_availability'
+
+    @classmethod
+    def _get_layout(cls) -> Tuple[Dict[str, Dict[Any, int]], Dict[str, int]]:
+        if cls._BIT_BY_VALUE is None:
+            bit_by_value: Dict[str, Dict[Any, int]] = dict()
+            section_masks: Dict[str, int] = dict()
+            bit = 0
+            for (section, enum_type) in cls._SECTIONS:
+                bit_by_value[section] = dict()
+                section_masks[section] = 0
+                for value in enum_type.values:
+                    bit_by_value[section][value] = bit
+                    section_masks[section] |= 1 << bit
+                    bit += 1
+            cls._SECTION_MASKS = section_masks
+            cls._BIT_BY_VALUE = bit_by_value
+        return cls._BIT_BY_VALUE, cls._SECTION_MASKS
+
+    @classmethod
+    def get_slider_mask(cls, available_for: CommonAvailableForSim, available_for_sim_types: Tuple[CommonSimType]=()) -> Union[int, None]:
+        """get_slider_mask(available_for, available_for_sim_types=())
+
+        Compute the availability mask of a Slider.
+
+        :param available_for: The availability of a Slider.
+        :type available_for: CommonAvailableForSim
+        :param available_for_sim_types: The sim types the Slider is available for. Default is every sim type.
+        :type available_for_sim_types: Tuple[CommonSimType], optional
+        :return: A mask of the values the Slider is available for or None if one of the values has no bit.
+        :rtype: Union[int, None]
+        """
+        (bit_by_value, section_masks) = cls._get_layout()
+        mask = 0
+        for ((section, _), values) in zip(cls._SECTIONS, (
+            available_for.genders,
+            available_for.ages,
+            available_for.species,
+            available_for.occult_types,
+            available_for_sim_types
+        )):
+            if not values:
+                mask |= section_masks[section]
+                continue
+            for value in values:
+                bit = bit_by_value[section].get(value, None)
+                if bit is None:
+                    return None
+                mask |= 1 << bit
+        return mask
+
+    def get_sim_signature(self, sim_info: SimInfo) -> Union[int, None]:
+        """get_sim_signature(sim_info)
+
+        Retrieve the availability signature of a Sim.
+
+        :param sim_info: An instance of a Sim.
+        :type sim_info: SimInfo
+        :return: A bitmask with the bit of the gender, age, species, current occult type and sim type of the Sim set or None if one of them has no bit.
+        :rtype: Union[int, None]
+        """
+        sim_details = CSFSimDetailsCache().get_details(sim_info)
+        signature = self._signatures.get(sim_details, CSFSliderAvailability._NO_SIGNATURE)
+        if signature is CSFSliderAvailability._NO_SIGNATURE:
+            signature = self._compute_sim_signature(sim_details)
+            self._signatures[sim_details] = signature
+        return signature
+
+    def _compute_sim_signature(self, sim_details: CSFSimDetails) -> Union[int, None]:
+        (bit_by_value, _) = self._get_layout()
+        signature = 0
+        for ((section, _), value) in zip(CSFSliderAvailability._SECTIONS, (
+            sim_details.gender,
+            sim_details.age,
+            sim_details.species,
+            sim_details.occult_type,
+            sim_details.sim_type
+        )):
+            bit = bit_by_value[section].get(value, None)
+            if bit is None:
+                return None
+            signature |= 1 << bit
+        return signature
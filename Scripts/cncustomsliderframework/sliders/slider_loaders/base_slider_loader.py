@@ -6,7 +6,8 @@ https://creativecommons.org/licenses/by-nd/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from typing import Tuple, Iterator, Any
+import hashlib
+from typing import Tuple, Iterator, Any, List, Union
 
 from cncustomsliderframework.dtos.sliders.slider import CSFSlider
 from cncustomsliderframework.modinfo import ModInfo
@@ -35,6 +36,14 @@ class CSFBaseSliderLoader(CommonService, HasLog):
         """ The names of snippets containing sliders. """
         raise NotImplementedError()
 
+    @property
+    def snippet_fingerprints(self) -> Union[Tuple[str], None]:
+        """ A fingerprint of each snippet read by the last load, made of the instance id of the snippet and a hash of its tuning. None if any snippet has no fingerprint. """
+        snippet_fingerprints: Union[List[str], None] = getattr(self, '_snippet_fingerprints', None)
+        if snippet_fingerprints is None:
+            return None
+        return tuple(snippet_fingerprints)
+
     @CommonExceptionHandler.catch_exceptions(ModInfo.get_identity(), fallback_return=tuple())
     def load(self) -> Iterator[CSFSlider]:
         """load()
@@ -45,8 +54,10 @@ class CSFBaseSliderLoader(CommonService, HasLog):
         :rtype: Iterator[CSFSlider]
         """
         snippet_names: Tuple[str] = self.snippet_names
+        self._snippet_fingerprints: Union[List[str], None] = list()
 
         for snippet_package in CommonResourceUtils.load_instances_with_any_tags(Types.SNIPPET, snippet_names):
+            self._add_snippet_fingerprint(snippet_package)
             try:
                 sliders: Tuple[CSFSlider] = tuple(self._load(snippet_package))
 
@@ -62,3 +73,53 @@ class CSFBaseSliderLoader(CommonService, HasLog):
 
     def _load(self, package_slider: Any) -> Tuple[CSFSlider]:
         raise NotImplementedError()
+
+    def _get_tuning_values(self, package_slider: Any) -> Union[Tuple[Any], None]:
+        # Loaders that do not provide the tuning values of their snippets have no fingerprint, so their Sliders are always organized again.
+        return None
+
+    def _add_snippet_fingerprint(self, snippet_package: Any) -> None:
+        if self._snippet_fingerprints is None:
+            return
+        try:
+            snippet_fingerprint = self._get_snippet_fingerprint(snippet_package)
+        except Exception as ex:
+            self.log.format_error('Error while creating a fingerprint of \'{}\''.format(snippet_package), exception=ex)
+            snippet_fingerprint = None
+        if snippet_fingerprint is None:
+            self._snippet_fingerprints = None
+            return
+        self._snippet_fingerprints.append(snippet_fingerprint)
+
+    def _get_snippet_fingerprint(self, snippet_package: Any) -> Union[str, None]:
+        tuning_values = self._get_tuning_values(snippet_package)
+        if tuning_values is None:
+            return None
+        tuning_text = ','.join([self._to_fingerprint_text(tuning_value) for tuning_value in tuning_values])
+        return '{}:{}'.format(getattr(snippet_package, 'guid64', 0), hashlib.md5(tuning_text.encode('utf-8')).hexdigest())
+
+    def _to_fingerprint_text(self, value: Any) -> str:
+        # Each kind of tuning value is converted explicitly, so the text only depends on the tuning and never on object identity or how a type happens to represent itself.
+        if value is None:
+            return 'N'
+        if isinstance(value, bool):
+            return 'B{}'.format(int(value))
+        if isinstance(value, int):
+            # Enum members are ints as well and are converted to their value.
+            return 'I{}'.format(int(value))
+        if isinstance(value, float):
+            return 'F{}'.format(value.hex())
+        if isinstance(value, str):
+            return 'S{}:{}'.format(len(value), value)
+        if isinstance(value, (set, frozenset)):
+            # Set order differs between sessions, so the values are sorted.
+            return '{{{}}}'.format(','.join(sorted([self._to_fingerprint_text(item) for item in value])))
+        if isinstance(value, (list, tuple)):
+            return '({})'.format(','.join([self._to_fingerprint_text(item) for item in value]))
+        if all(hasattr(value, attribute_name) for attribute_name in ('type', 'group', 'instance')):
+            # A resource key.
+            return 'K{}:{}:{}'.format(int(value.type), int(value.group), int(value.instance))
+        if hasattr(value, 'hash'):
+            # A Localized String, which is identified by the hash of its text.
+            return 'L{}'.format(int(value.hash))
+        raise TypeError('Unable to create a fingerprint of a tuning value of type {}'.format(type(value)))
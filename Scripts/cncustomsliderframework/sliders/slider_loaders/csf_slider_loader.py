@@ -6,11 +6,11 @@ https://creativecommons.org/licenses/by-nd/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from typing import Tuple, List
+from typing import Tuple, List, Any
 
 from cncustomsliderframework.dtos.sliders.slider import CSFSlider
 from cncustomsliderframework.sliders.slider_loaders.base_slider_loader import CSFBaseSliderLoader
-from cncustomsliderframework.tunings.custom_slider_collection import CSFCustomSliderInfoCollection
+from cncustomsliderframework.tunings.custom_slider_collection import CSFCustomSliderInfoCollection, CSFCustomSliderInfo
 
 
 class CSFCustomSliderFrameworkSliderLoader(CSFBaseSliderLoader):
@@ -37,3 +37,10 @@ class CSFCustomSliderFrameworkSliderLoader(CSFBaseSliderLoader):
                 continue
             sliders.append(slider)
         return tuple(sliders)
+
+    def _get_tuning_values(self, package_slider_info_collection: CSFCustomSliderInfoCollection) -> Tuple[Any]:
+        tuning_names: Tuple[str] = tuple(sorted(CSFCustomSliderInfo.FACTORY_TUNABLES.keys()))
+        tuning_values: List[Any] = list()
+        for package_slider_info in getattr(package_slider_info_collection, 'custom_slider_info_list', tuple()):
+            tuning_values.append(tuple([(tuning_name, getattr(package_slider_info, tuning_name, None)) for tuning_name in tuning_names]))
+        return tuple(tuning_values)
@@ -6,17 +6,30 @@ https://creativecommons.org/licenses/by-nd/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-import collections
-from typing import List, Dict, Any, Tuple, Set, Callable
+import hashlib
+from typing import List, Dict, Any, Tuple, Set, Callable, Iterator, FrozenSet, Union
 
 from cncustomsliderframework.dtos.sliders.slider import CSFSlider
 from cncustomsliderframework.enums.query_type import CSFQueryType
 from cncustomsliderframework.enums.string_ids import CSFStringId
 from cncustomsliderframework.modinfo import ModInfo
+from cncustomsliderframework.queries.query_cache import CSFQueryCache
+from cncustomsliderframework.sliders.query.prepared_slider_query import CSFPreparedSliderQuery, CSFSliderQueryParameter
+from cncustomsliderframework.sliders.query.slider_category_view import CSFSliderCategoryView
+from cncustomsliderframework.sliders.query.slider_index_snapshot import CSFSliderIndexSnapshot
 from cncustomsliderframework.sliders.query.slider_query import CSFSliderQuery
+from cncustomsliderframework.sliders.query.slider_query_expression import CSFSliderQueryExpression
+from cncustomsliderframework.sliders.query.slider_query_plan import CSFSliderQueryPlan
+from cncustomsliderframework.sliders.query.slider_search_index import CSFSliderSearchIndex
+from cncustomsliderframework.sliders.query.slider_table import CSFSliderTable
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.query.slider_tag_statistics import CSFSliderTagStatistics
 from cncustomsliderframework.sliders.query.tag_handlers.slider_tag_handler import CSFSliderTagHandler
+from cncustomsliderframework.sliders.slider_query_tag import CSFSliderQueryTag
 from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from cncustomsliderframework.sliders.tag_filters.sim_details import CSFSimDetailsSliderFilter
 from cncustomsliderframework.sliders.tag_filters.slider_tag_filter import CSFSliderTagFilter
+from sims.sim_info import SimInfo
 from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
 from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
 from sims4communitylib.events.interval.common_interval_event_service import CommonIntervalEventRegistry
@@ -24,7 +37,8 @@ from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLat
 from sims4communitylib.logging.has_log import HasLog
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
 from sims4communitylib.notifications.common_basic_notification import CommonBasicNotification
-from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand
+from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
+    CommonConsoleCommandArgument
 from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
 from sims4communitylib.services.common_service import CommonService
 from sims4communitylib.utils.common_log_registry import CommonLogRegistry
@@ -34,6 +48,11 @@ verbose_log = CommonLogRegistry().register_log(ModInfo.get_identity(), 'csf_slid
 
 class CSFSliderQueryRegistry(CommonService, HasLog):
     """ Registry handling slider queries. """
+    DEFAULT_QUERY_CACHE_SIZE = 256
+    DEFAULT_COLLECTION_BUDGET_MILLISECONDS = 0
+    DEFAULT_COLLECTION_TICK_MILLISECONDS = 10
+    DEFAULT_COLLECTION_PROGRESS_INTERVAL = 250
+    MAXIMUM_CATEGORY_VIEWS = 32
 
     # noinspection PyMissingOrEmptyDocstring
     @property
@@ -50,19 +69,108 @@ class CSFSliderQueryRegistry(CommonService, HasLog):
         return self.__tag_handlers
 
     @property
-    def slider_library(self) -> Dict[Tuple[CSFSliderTagType, Any], Set[str]]:
-        """ A library of sliders organized by filter keys. """
-        return self._slider_library
+    def _is_organized(self) -> bool:
+        # Before the first collection, the sliders will be picked up by the collection itself. Changes made while a collection runs are queued and applied once it is complete.
+        return self._generation > 0
 
-    @slider_library.setter
-    def slider_library(self, value: Dict[Tuple[CSFSliderTagType, Any], Set[str]]):
-        self._slider_library = value
+    @property
+    def slider_library(self) -> Dict[Tuple[CSFSliderTagType, Any], int]:
+        """ A library of slider bitmaps organized by filter keys. """
+        return self._index.library
+
+    @property
+    def index(self) -> CSFSliderTagIndex:
+        """ The index used to locate sliders. """
+        return self._index
+
+    @property
+    def slider_table(self) -> CSFSliderTable:
+        """ The sliders stored column by column, used for bulk questions about all sliders at once. It is built again after sliders are added, removed or updated. """
+        if self._slider_table is None:
+            self._slider_table = CSFSliderTable(self._index)
+        return self._slider_table
+
+    @property
+    def tag_statistics(self) -> CSFSliderTagStatistics:
+        """ The number of sliders of each tag key and of each tag type. """
+        return self._index.statistics
+
+    @property
+    def search_index(self) -> CSFSliderSearchIndex:
+        """ The index used to search sliders by name, author and tags. It is built again after sliders are added, removed or updated. """
+        if self._search_index is None:
+            self._search_index = CSFSliderSearchIndex(self._index)
+        return self._search_index
+
+    @property
+    def generation(self) -> int:
+        """ The generation of the index. It changes every time the sliders are organized. """
+        return self._generation
+
+    @property
+    def revision(self) -> int:
+        """ The revision of the sliders. It changes every time the sliders are organized, added, removed or updated. """
+        return self._revision
+
+    @property
+    def query_cache(self) -> CSFQueryCache:
+        """ A cache of query results for the current generation. """
+        return self._query_cache
+
+    @property
+    def collection_budget_milliseconds(self) -> int:
+        """ The time sliders may be collected for within a single game tick. If zero, sliders are collected all at once. """
+        return self._collection_budget_milliseconds
+
+    @collection_budget_milliseconds.setter
+    def collection_budget_milliseconds(self, value: int):
+        self._collection_budget_milliseconds = max(0, value)
+
+    @property
+    def collection_tick_milliseconds(self) -> int:
+        """ The time between the game ticks sliders are collected in. """
+        return self._collection_tick_milliseconds
+
+    @collection_tick_milliseconds.setter
+    def collection_tick_milliseconds(self, value: int):
+        self._collection_tick_milliseconds = max(1, value)
+
+    @property
+    def collection_progress_interval(self) -> int:
+        """ The number of sliders collected between progress notifications. """
+        return self._collection_progress_interval
+
+    @collection_progress_interval.setter
+    def collection_progress_interval(self, value: int):
+        self._collection_progress_interval = max(1, value)
+
+    @property
+    def use_index_snapshot(self) -> bool:
+        """ Whether organized sliders are saved to and restored from a snapshot file. """
+        return self._use_index_snapshot
+
+    @use_index_snapshot.setter
+    def use_index_snapshot(self, value: bool):
+        self._use_index_snapshot = value
 
     def __init__(self) -> None:
         from cncustomsliderframework.sliders.slider_registry import CSFSliderRegistry
         super().__init__()
         self._collecting = False
-        self.slider_library = collections.defaultdict(set)
+        self._collection_dispatcher = None
+        self._collection_budget_milliseconds = CSFSliderQueryRegistry.DEFAULT_COLLECTION_BUDGET_MILLISECONDS
+        self._collection_tick_milliseconds = CSFSliderQueryRegistry.DEFAULT_COLLECTION_TICK_MILLISECONDS
+        self._collection_progress_interval = CSFSliderQueryRegistry.DEFAULT_COLLECTION_PROGRESS_INTERVAL
+        self._use_index_snapshot = True
+        self._pending_changes: List[Tuple[Callable[[Any], bool], Any]] = list()
+        self._index = CSFSliderTagIndex()
+        self._search_index: Union[CSFSliderSearchIndex, None] = None
+        self._slider_table: Union[CSFSliderTable, None] = None
+        self._generation = 0
+        self._revision = 0
+        self._category_views: Dict[FrozenSet[Any], CSFSliderCategoryView] = dict()
+        self._category_views_revision = 0
+        self._query_cache = CSFQueryCache(max_size=CSFSliderQueryRegistry.DEFAULT_QUERY_CACHE_SIZE)
         self.__tag_handlers: List[CSFSliderTagHandler] = list()
         self._all: List[CSFSlider] = list()
         self._registry = CSFSliderRegistry()
@@ -83,176 +191,424 @@ class CSFSliderQueryRegistry(CommonService, HasLog):
         """ Create a query for sliders. """
         return CSFSliderQuery(slider_filters, query_type=query_type)
 
+    def prepare_query(
+        self,
+        slider_filters: Tuple[CSFSliderTagFilter],
+        parameters: Tuple[CSFSliderQueryParameter],
+        query_type: CSFQueryType=CSFQueryType.ALL_PLUS_ANY
+    ) -> CSFPreparedSliderQuery:
+        """ Prepare a query for sliders, to be bound to the values of its parameters each time it is used. Like CSFPreparedSliderQuery, the query type defaults to ALL_PLUS_ANY. """
+        return CSFPreparedSliderQuery(slider_filters, parameters=parameters, query_type=query_type)
+
     def has_sliders(self, queries: Tuple[CSFSliderQuery]) -> bool:
-        """ Determine if sliders are available for tags. """
+        """ Determine if sliders are available for tags.
+
+        .. note:: Sliders are never looked up, the queries are only evaluated against the index.
+
+        """
         self.log.format_with_message('Checking if has sliders', queries=queries)
-        for _ in self.get_sliders(queries):
-            return True
+        # Reuses results stored by get_sliders without counting a hit or a miss, since nothing is stored here.
+        cached_sliders = self._query_cache.peek(self._generation, frozenset([query.signature for query in queries]))
+        if cached_sliders is not None:
+            return len(cached_sliders) > 0
+        for query in queries:
+            if self._query_bitmap(query):
+                return True
         return False
 
+    def locate_first(
+        self,
+        tag_keys: Iterator[Tuple[CSFSliderTagType, Any]],
+        exclude_tag_keys: Iterator[Tuple[CSFSliderTagType, Any]]=(),
+        include_any_tag_keys: Iterator[Tuple[CSFSliderTagType, Any]]=()
+    ) -> Union[CSFSlider, None]:
+        """locate_first(tag_keys, exclude_tag_keys=(), include_any_tag_keys=())
+
+        Locate the first slider, in the order sliders were collected, that has all of the tag keys.
+
+        :param tag_keys: The tag keys the slider must have.
+        :type tag_keys: Iterator[Tuple[CSFSliderTagType, Any]]
+        :param exclude_tag_keys: The tag keys the slider must not have. Default is an empty collection.
+        :type exclude_tag_keys: Iterator[Tuple[CSFSliderTagType, Any]], optional
+        :param include_any_tag_keys: The slider must have at least one of these tag keys. Default is an empty collection, which does not limit the slider.
+        :type include_any_tag_keys: Iterator[Tuple[CSFSliderTagType, Any]], optional
+        :return: The first slider with all of the tag keys, at least one of the include any tag keys and none of the excluded tag keys or None if no slider matches.
+        :rtype: Union[CSFSlider, None]
+        """
+        index = self._index
+        found_bitmap = index.intersect(tag_keys)
+        if not found_bitmap or found_bitmap == -1:
+            return None
+        include_any_tag_keys = tuple(include_any_tag_keys)
+        if include_any_tag_keys:
+            found_via_any_tags_bitmap = 0
+            for include_any_tag_key in include_any_tag_keys:
+                found_via_any_tags_bitmap |= index.get_bitmap(include_any_tag_key)
+            found_bitmap &= found_via_any_tags_bitmap
+            if not found_bitmap:
+                return None
+        for exclude_tag_key in exclude_tag_keys:
+            found_bitmap &= ~index.get_bitmap(exclude_tag_key)
+            if not found_bitmap:
+                return None
+        return index.get_first_slider(found_bitmap)
+
+    def count_sliders(self, queries: Tuple[CSFSliderQuery]) -> int:
+        """ Count the sliders matching the queries.
+
+        .. note:: Sliders are never looked up, the queries are only evaluated against the index.
+
+        """
+        self.log.format_with_message('Counting sliders', queries=queries)
+        # Reuses results stored by get_sliders without counting a hit or a miss, since nothing is stored here.
+        cached_sliders = self._query_cache.peek(self._generation, frozenset([query.signature for query in queries]))
+        if cached_sliders is not None:
+            return len(cached_sliders)
+        found_bitmap = 0
+        for query in queries:
+            found_bitmap |= self._query_bitmap(query)
+        return self._index.count(found_bitmap)
+
     def get_all_sliders(self) -> Tuple[CSFSlider]:
-        """ Get all sliders. """
-        if self._collecting:
-            return tuple()
+        """ Get all sliders.
+
+        .. note:: While sliders are being collected, the sliders of the previous collection are returned.
+
+        """
         return tuple(self._all)
 
     def get_sliders(self, queries: Tuple[CSFSliderQuery]) -> Set[CSFSlider]:
-        """ Retrieve sliders matching the queries. """
+        """ Retrieve sliders matching the queries. A new set is returned on every call.
+
+        .. note:: While sliders are being collected, queries are answered using the sliders of the previous collection.
+
+        """
         self.log.format_with_message('Getting sliders', queries=queries)
-        if self._collecting:
-            return set()
-        sliders = set()
+        signature = frozenset([query.signature for query in queries])
+        cached_sliders = self._query_cache.get(self._generation, signature)
+        if cached_sliders is not None:
+            self.log.debug('Found cached sliders {}'.format(len(cached_sliders)))
+            return set(cached_sliders)
+        found_bitmap = 0
         for query in queries:
-            found_sliders = self._query_sliders(query)
-            if found_sliders:
-                sliders = sliders | found_sliders
+            found_bitmap |= self._query_bitmap(query)
+        sliders = frozenset(self._index.to_sliders(found_bitmap))
+        self._query_cache.put(self._generation, signature, sliders)
         if verbose_log.enabled:
             verbose_log.debug('Finished locating sliders [{}]'.format(',\n'.join(['{}:{}'.format(str(slider.raw_display_name), slider.author) for slider in sliders])))
-        return sliders
+        # The cached sliders are shared, every caller receives its own copy.
+        return set(sliders)
+
+    def get_category_view(self, queries: Tuple[CSFSliderQuery]) -> CSFSliderCategoryView:
+        """get_category_view(queries)
+
+        Retrieve the sliders matching the queries sorted by name and grouped by category.
+
+        .. note:: Views are kept until the sliders are organized, added, removed or updated, so showing the same sliders again does no sorting or grouping.
+
+        :param queries: The queries the sliders must match.
+        :type queries: Tuple[CSFSliderQuery]
+        :return: A view of the sliders matching the queries.
+        :rtype: CSFSliderCategoryView
+        """
+        if self._category_views_revision != self._revision:
+            self._category_views.clear()
+            self._category_views_revision = self._revision
+        signature = frozenset([query.signature for query in queries])
+        category_view = self._category_views.get(signature, None)
+        if category_view is not None:
+            return category_view
+        category_view = CSFSliderCategoryView(self.get_sliders(queries))
+        if len(self._category_views) >= CSFSliderQueryRegistry.MAXIMUM_CATEGORY_VIEWS:
+            self._category_views.clear()
+        self._category_views[signature] = category_view
+        self.log.format_with_message('Created category view.', category_view=category_view, revision=self._revision)
+        return category_view
+
+    def search_sliders(self, text: str, queries: Tuple[CSFSliderQuery]=None, limit: int=10) -> Tuple[CSFSlider]:
+        """search_sliders(text, queries=None, limit=10)
+
+        Search for sliders by name, author and tags, best match first.
+
+        :param text: The text to search for.
+        :type text: str
+        :param queries: If specified, only sliders matching these queries will be returned. Default is None.
+        :type queries: Tuple[CSFSliderQuery], optional
+        :param limit: The maximum number of sliders to return. Default is 10.
+        :type limit: int, optional
+        :return: The sliders best matching the text.
+        :rtype: Tuple[CSFSlider]
+        """
+        self.log.format_with_message('Searching sliders', text=text, queries=queries, limit=limit)
+        available_bitmap = -1
+        if queries is not None:
+            available_bitmap = 0
+            for query in queries:
+                available_bitmap |= self._query_bitmap(query)
+        return self.search_index.search(text, limit=limit, available_bitmap=available_bitmap)
+
+    def get_sliders_by_expression(self, expression: CSFSliderQueryExpression) -> Set[CSFSlider]:
+        """get_sliders_by_expression(expression)
+
+        Retrieve sliders located by an expression. A new set is returned on every call.
+
+        :param expression: The expression to evaluate.
+        :type expression: CSFSliderQueryExpression
+        :return: The sliders located by the expression.
+        :rtype: Set[CSFSlider]
+        """
+        self.log.format_with_message('Getting sliders by expression', expression=expression)
+        cached_sliders = self._query_cache.get(self._generation, expression)
+        if cached_sliders is not None:
+            return set(cached_sliders)
+        sliders = frozenset(self._index.to_sliders(self._expression_bitmap(expression)))
+        self._query_cache.put(self._generation, expression, sliders)
+        return set(sliders)
+
+    def count_sliders_by_expression(self, expression: CSFSliderQueryExpression) -> int:
+        """ Count the sliders located by an expression.
+
+        .. note:: Sliders are never looked up, the expression is only evaluated against the index.
+
+        """
+        self.log.format_with_message('Counting sliders by expression', expression=expression)
+        # Reuses results stored by get_sliders_by_expression without counting a hit or a miss, since nothing is stored here.
+        cached_sliders = self._query_cache.peek(self._generation, expression)
+        if cached_sliders is not None:
+            return len(cached_sliders)
+        return self._index.count(self._expression_bitmap(expression))
+
+    def _expression_bitmap(self, expression: CSFSliderQueryExpression) -> int:
+        index = self._index
+        folded_expression = expression.fold(index)
+        self.log.format_with_message('Folded expression', expression=folded_expression)
+        found_bitmap = folded_expression.evaluate(index)
+        self.log.debug('Found sliders {}'.format(index.count(found_bitmap)))
+        return found_bitmap
+
+    def get_sliders_available_for(self, sim_info: SimInfo) -> Tuple[CSFSlider]:
+        """get_sliders_available_for(sim_info)
+
+        Retrieve every slider available for a Sim, regardless of its category or tags.
+
+        :param sim_info: An instance of a Sim.
+        :type sim_info: SimInfo
+        :return: The sliders available for the gender, age, species, current occult type and sim type of the Sim.
+        :rtype: Tuple[CSFSlider]
+        """
+        slider_table = self.slider_table
+        return slider_table.to_sliders(slider_table.get_available_bitmap(sim_info))
+
+    def get_sliders_for_modifier(self, modifier_id: int) -> Tuple[CSFSlider]:
+        """ Retrieve the sliders changing a modifier, either with their positive or their negative modifier id. """
+        index = self._index
+        return index.to_sliders(index.get_bitmap((CSFSliderTagType.MODIFIER_ID, modifier_id)))
+
+    def get_sliders_bound(self, query: CSFSliderQuery, bound_tags: Iterator[CSFSliderQueryTag]) -> Dict[Tuple[CSFSliderTagType, Any], Set[CSFSlider]]:
+        """get_sliders_bound(query, bound_tags)
+
+        Retrieve sliders matching a query once for each bound tag, as if the bound tag was an Include All tag of the query.
+
+        The tags of the query are only evaluated once and are shared by every bound tag. Results are cached the same as :func:`get_sliders` for a query including the bound tag.
+
+        :param query: The query shared by every bound tag.
+        :type query: CSFSliderQuery
+        :param bound_tags: The tags to evaluate the query with.
+        :type bound_tags: Iterator[CSFSliderQueryTag]
+        :return: The sliders matching the query, organized by the key of each bound tag.
+        :rtype: Dict[Tuple[CSFSliderTagType, Any], Set[CSFSlider]]
+        """
+        bound_keys = tuple(set([bound_tag.key for bound_tag in bound_tags]))
+        self.log.format_with_message('Getting sliders bound', query=query, bound_keys=bound_keys)
+        (include_all_keys, include_any_keys, exclude_keys, query_type) = query.signature
+        sliders_by_key: Dict[Tuple[CSFSliderTagType, Any], Set[CSFSlider]] = dict()
+        signature_by_key: Dict[Tuple[CSFSliderTagType, Any], Any] = dict()
+        for bound_key in bound_keys:
+            signature = frozenset([(include_all_keys | {bound_key}, include_any_keys, exclude_keys, query_type)])
+            cached_sliders = self._query_cache.get(self._generation, signature)
+            if cached_sliders is not None:
+                sliders_by_key[bound_key] = set(cached_sliders)
+                continue
+            signature_by_key[bound_key] = signature
+        self.log.debug('Found cached sliders for {} of {} bound keys'.format(len(sliders_by_key), len(bound_keys)))
+        if not signature_by_key:
+            return sliders_by_key
+
+        index = self._index
+        plan = CSFSliderQueryPlan.create(query, index, has_bound_key=True)
+        self.log.format_with_message('Query plan', plan=plan.explain(index))
+        for (bound_key, bitmap) in plan.execute_bound(index, signature_by_key.keys()).items():
+            sliders = frozenset(index.to_sliders(bitmap))
+            self._query_cache.put(self._generation, signature_by_key[bound_key], sliders)
+            sliders_by_key[bound_key] = set(sliders)
+        return sliders_by_key
 
     def _query_sliders(self, query: CSFSliderQuery) -> Set[CSFSlider]:
+        return set(self._index.to_sliders(self._query_bitmap(query)))
+
+    def _query_bitmap(self, query: CSFSliderQuery) -> int:
         self.log.format_with_message('Querying for sliders using query: {}'.format(query))
-        all_tags = query.include_all_tags
-        any_tags = query.include_any_tags
-        exclude_tags = query.exclude_tags
-        found_slider_identifiers = None
-        for include_all_tag in all_tags:
-            if include_all_tag is None:
-                continue
-            if include_all_tag.key not in self.slider_library:
-                # One of the All keys is not within the slider library! This means no sliders match ALL tags.
-                return set()
-            new_found_sliders = self.slider_library[include_all_tag.key]
-            if found_slider_identifiers is not None:
-                self.log.debug('Looking for tag {}'.format(include_all_tag))
-                self.log.debug('Before intersect for all_tags {}'.format(len(found_slider_identifiers)))
-                new_found_sliders = found_slider_identifiers & new_found_sliders
-                self.log.debug('After intersect for all_tags {}'.format(len(new_found_sliders)))
-            else:
-                self.log.debug('Found with all_tags {}'.format(len(new_found_sliders)))
-            found_slider_identifiers = new_found_sliders
-
-        if found_slider_identifiers is None and all_tags:
-            self.log.debug('No sliders found for all_tags {}'.format(all_tags))
-            return set()
-
-        self.log.debug('After all_tags {}'.format(len(found_slider_identifiers)))
+        index = self._index
+        plan = CSFSliderQueryPlan.create(query, index)
+        self.log.format_with_message('Query plan', plan=plan.explain(index))
+        found_bitmap = plan.execute(index)
+        self.log.debug('Found sliders {}'.format(index.count(found_bitmap)))
         if verbose_log.enabled:
-            found_all_sliders: List[CSFSlider] = list()
-            for slider_identifier in found_slider_identifiers:
-                slider = self._registry.locate_by_identifier(slider_identifier)
-                if slider is None:
-                    continue
-                found_all_sliders.append(slider)
-            verbose_log.format_with_message('Found sliders via all tags', sliders=',\n'.join(['{}:{}'.format(str(found_slider.raw_display_name), found_slider.author) for found_slider in found_all_sliders]))
-
-        found_sliders_via_any_tags = set()
-        for include_any_tag in any_tags:
-            if include_any_tag is None:
-                continue
-            if include_any_tag.key not in self.slider_library:
-                continue
-            found_sliders_via_any_tags = found_sliders_via_any_tags | self.slider_library[include_any_tag.key]
+            verbose_log.debug('Returning sliders [{}]'.format(',\n'.join(['{}:{}'.format(str(found_slider.raw_display_name), found_slider.author) for found_slider in index.to_sliders(found_bitmap)])))
+        return found_bitmap
 
-        self.log.debug('Found sliders via any {}'.format(len(found_sliders_via_any_tags)))
+    def add_slider(self, slider: CSFSlider) -> bool:
+        """add_slider(slider)
 
-        if verbose_log.enabled:
-            found_any_sliders: List[CSFSlider] = list()
-            for slider_identifier in found_sliders_via_any_tags:
-                slider = self._registry.locate_by_identifier(slider_identifier)
-                if slider is None:
-                    continue
-                found_any_sliders.append(slider)
-            verbose_log.format_with_message('Found sliders via any tags', sliders=',\n'.join(['{}:{}'.format(str(found_slider.raw_display_name), found_slider.author) for found_slider in found_any_sliders]))
-
-        if found_slider_identifiers is None:
-            self.log.debug('No sliders found for all_tags.')
-            if not all_tags:
-                self.log.debug('Returning any tags.')
-                return found_sliders_via_any_tags
-        else:
-            query_type = query.query_type
-            if not any_tags and (query_type == CSFQueryType.ALL_INTERSECT_ANY or query_type == CSFQueryType.ALL_INTERSECT_ANY_MUST_HAVE_ONE):
-                query_type = CSFQueryType.ALL_PLUS_ANY
-            if query_type == CSFQueryType.ALL_PLUS_ANY:
-                found_slider_identifiers = found_slider_identifiers | found_sliders_via_any_tags
-            elif query_type == CSFQueryType.ALL_INTERSECT_ANY:
-                found_slider_identifiers = found_slider_identifiers & found_sliders_via_any_tags
-
-            if query_type == CSFQueryType.ALL_PLUS_ANY_MUST_HAVE_ONE:
-                if not found_sliders_via_any_tags:
-                    return set()
-                found_slider_identifiers = found_slider_identifiers | found_sliders_via_any_tags
-            elif query_type == CSFQueryType.ALL_INTERSECT_ANY_MUST_HAVE_ONE:
-                if not found_sliders_via_any_tags:
-                    return set()
-                found_slider_identifiers = found_slider_identifiers & found_sliders_via_any_tags
-
-        if found_slider_identifiers is None:
-            self.log.debug('No found sliders after combining any tags. All Tags: {} Any Tags: {}'.format(all_tags, any_tags))
-            return set()
-
-        self.log.debug('After any tags {}'.format(len(found_slider_identifiers)))
-
-        excluded = set()
-        for exclude_tag in exclude_tags:
-            if exclude_tag is None:
-                continue
-            if exclude_tag.key not in self.slider_library:
-                continue
-            excluded = excluded | self.slider_library[exclude_tag.key]
+        Add a Slider to the organized sliders without organizing every slider again.
 
-        self.log.debug('Excluding sliders {}'.format(len(excluded)))
+        :param slider: The Slider to add.
+        :type slider: CSFSlider
+        :return: True, if the Slider was added. False, if not, such as when the sliders have not been organized yet. A Slider added during a collection is added again once the collection is complete.
+        :rtype: bool
+        """
+        self._queue_change_during_collection(self.add_slider, slider)
+        if not self._is_organized:
+            return False
+        changed_tag_keys = self._index.add_slider(slider, self._get_tag_keys(slider, tuple(self._tag_handlers)))
+        if not changed_tag_keys:
+            return False
+        self._all = (*self._all, slider)
+        self._search_index = None
+        self._slider_table = None
+        self._revision += 1
+        self._invalidate_cached_queries(changed_tag_keys)
+        return True
 
-        if excluded:
-            found_slider_identifiers = found_slider_identifiers - excluded
+    def remove_slider(self, slider_identifier: str) -> bool:
+        """remove_slider(slider_identifier)
 
-        self.log.debug('After exclude sliders {}'.format(len(found_slider_identifiers)))
-        found_sliders: List[CSFSlider] = list()
-        for slider_identifier in found_slider_identifiers:
-            slider = self._registry.locate_by_identifier(slider_identifier)
-            if slider is None:
-                continue
-            found_sliders.append(slider)
+        Remove a Slider from the organized sliders without organizing every slider again.
 
-        if verbose_log.enabled:
-            verbose_log.debug('Returning sliders [{}]'.format(',\n'.join(['{}:{}'.format(str(found_slider.raw_display_name), found_slider.author) for found_slider in found_sliders])))
-        return set(found_sliders)
+        :param slider_identifier: The identifier of the Slider to remove.
+        :type slider_identifier: str
+        :return: True, if the Slider was removed. False, if not.
+        :rtype: bool
+        """
+        self._queue_change_during_collection(self.remove_slider, slider_identifier)
+        if not self._is_organized:
+            return False
+        changed_tag_keys = self._index.remove_slider(slider_identifier)
+        if not changed_tag_keys:
+            return False
+        self._all = tuple([slider for slider in self._all if slider.unique_identifier != slider_identifier])
+        self._search_index = None
+        self._slider_table = None
+        self._revision += 1
+        self._invalidate_cached_queries(changed_tag_keys)
+        return True
+
+    def update_slider(self, slider: CSFSlider) -> bool:
+        """update_slider(slider)
+
+        Replace an organized Slider with the same identifier without organizing every slider again.
+
+        :param slider: The Slider to update.
+        :type slider: CSFSlider
+        :return: True, if the Slider was updated. False, if not.
+        :rtype: bool
+        """
+        self._queue_change_during_collection(self.update_slider, slider)
+        if not self._is_organized:
+            return False
+        changed_tag_keys = self._index.update_slider(slider, self._get_tag_keys(slider, tuple(self._tag_handlers)))
+        if not changed_tag_keys:
+            return False
+        slider_identifier = slider.unique_identifier
+        self._all = (*[existing_slider for existing_slider in self._all if existing_slider.unique_identifier != slider_identifier], slider)
+        self._search_index = None
+        self._slider_table = None
+        self._revision += 1
+        self._invalidate_cached_queries(changed_tag_keys)
+        return True
+
+    def _queue_change_during_collection(self, apply_change: Callable[[Any], bool], change: Any) -> None:
+        if not self._collecting:
+            return
+        # The collection may have read the sliders before this change, so it is applied again once the collection is complete.
+        self._pending_changes.append((apply_change, change))
+
+    def _invalidate_cached_queries(self, changed_tag_keys: Set[Tuple[CSFSliderTagType, Any]]) -> None:
+        def _is_affected(signature: Union[FrozenSet[Tuple[FrozenSet[Any], FrozenSet[Any], FrozenSet[Any], CSFQueryType]], CSFSliderQueryExpression]) -> bool:
+            if isinstance(signature, CSFSliderQueryExpression):
+                # Expressions locating Sliders without any of their tags, such as negations, change whenever any Slider changes.
+                return not signature.is_limited_to_tags or not changed_tag_keys.isdisjoint(signature.tag_keys)
+            for (include_all_keys, include_any_keys, exclude_keys, _) in signature:
+                if not changed_tag_keys.isdisjoint(include_all_keys) or not changed_tag_keys.isdisjoint(include_any_keys) or not changed_tag_keys.isdisjoint(exclude_keys):
+                    return True
+            return False
+
+        number_of_invalidated_queries = self._query_cache.invalidate(_is_affected)
+        self.log.format_with_message('Invalidated cached queries.', changed_tag_keys=changed_tag_keys, number_of_invalidated_queries=number_of_invalidated_queries)
 
-    def _organize(self, sliders: Tuple[CSFSlider]):
+    def _get_tag_keys(self, slider: CSFSlider, tag_handlers: Tuple[CSFSliderTagHandler]) -> Tuple[Tuple[CSFSliderTagType, Any]]:
+        self.log.format_with_message('Handling tags for Slider', cas_part=slider.name)
+        slider_tag_keys = list()
+        for tag_handler in tag_handlers:
+            if not tag_handler.applies(slider):
+                continue
+            tag_type = tag_handler.tag_type
+            for slider_tag in tag_handler.get_tags(slider):
+                slider_tag_keys.append((tag_type, slider_tag))
+        self.log.format_with_message('Applied tags to slider.', display_name=slider.name, keys=slider_tag_keys)
+        return tuple(slider_tag_keys)
+
+    def _organize(self, slider_tag_keys: Iterator[Tuple[CSFSlider, Tuple[Tuple[CSFSliderTagType, Any]]]]) -> CSFSliderTagIndex:
         self.log.debug('Collecting Sliders Query Data...')
-        self.slider_library.clear()
-        new_slider_library = dict()
-        tag_handlers = tuple(self._tag_handlers)
-        for slider in sliders:
-            self.log.format_with_message('Handling tags for Slider', cas_part=slider.name)
-            slider_identifier = slider.unique_identifier
-            slider_tag_keys = list()
-            for tag_handler in tag_handlers:
-                if not tag_handler.applies(slider):
-                    continue
-                tag_type = tag_handler.tag_type
-                for slider_tag in tag_handler.get_tags(slider):
-                    tag_key = (tag_type, slider_tag)
-                    slider_tag_keys.append(tag_key)
-                    if tag_key not in new_slider_library:
-                        new_slider_library[tag_key] = set()
-                    if slider_identifier in new_slider_library[tag_key]:
-                        continue
-                    new_slider_library[tag_key].add(slider_identifier)
-            self.log.format_with_message('Applied tags to slider.', display_name=slider.name, keys=slider_tag_keys)
-
-        self.log.format_with_message('Completed collecting Sliders Query Data.', slider_library=new_slider_library)
-        self.slider_library = new_slider_library
+        new_index = CSFSliderTagIndex.build(slider_tag_keys)
+        number_of_sim_details = new_index.add_combined_keys(CSFSliderTagType.SIM_DETAILS, CSFSimDetailsSliderFilter.SIM_DETAILS_TAG_TYPES)
+        self.log.format_with_message('Precomputed Sim Details.', number_of_sim_details=number_of_sim_details)
+        self.log.format_with_message('Slider tag statistics.', statistics=new_index.statistics)
+        self.log.format_with_message('Completed collecting Sliders Query Data.', slider_library=new_index.library)
+        return new_index
+
+    def _swap(self, sliders: Tuple[CSFSlider], new_index: CSFSliderTagIndex) -> None:
+        # Readers are served by the previous index until both the sliders and the index are replaced together. The search index is built the first time it is needed.
+        self._all = sliders
+        self._index = new_index
+        self._search_index = None
+        self._slider_table = None
+        self._generation += 1
+        self._revision += 1
+        pending_changes = tuple(self._pending_changes)
+        self._pending_changes.clear()
+        for (apply_change, change) in pending_changes:
+            apply_change(change)
+        self.log.format_with_message('Swapped in new Sliders.', generation=self._generation, number_of_pending_changes=len(pending_changes))
 
     def trigger_collection(self, show_loading_notification: bool=True) -> None:
         """trigger_collection(show_loading_notification=True)
 
         Trigger the action to collect all sliders and organize them by a number of tags.
 
+        .. note:: If the collection budget is greater than zero, sliders are collected a few at a time over multiple game ticks and queries made in the meantime will not see them. Otherwise, as by default, they are collected all at once.
+
         :param show_loading_notification: If set to True, the Loading Sliders notification will be shown. If set to False, the Loading Sliders notification will not be shown. Default is True.
         :type show_loading_notification: bool, optional
         """
+        def _on_progress(number_of_handled_sliders: int, number_of_sliders: int) -> None:
+            if not show_loading_notification:
+                return
+            CommonBasicNotification(
+                CSFStringId.LOADING_SLIDERS,
+                CSFStringId.STRING_PLUS_STRING,
+                description_tokens=(CSFStringId.LOADING_SLIDERS_DESCRIPTION, '{}/{}'.format(number_of_handled_sliders, number_of_sliders))
+            ).show()
+
+        def _on_finished(number_of_sliders: int) -> None:
+            if number_of_sliders == -1:
+                return
+            CommonBasicNotification(
+                CSFStringId.FINISHED_LOADING_SLIDERS,
+                CSFStringId.FINISHED_LOADING_SLIDERS_DESCRIPTION,
+                description_tokens=(str(number_of_sliders),)
+            ).show()
+
         def _recollect_data() -> None:
             try:
                 if show_loading_notification:
@@ -260,14 +616,10 @@ class CSFSliderQueryRegistry(CommonService, HasLog):
                         CSFStringId.LOADING_SLIDERS,
                         CSFStringId.LOADING_SLIDERS_DESCRIPTION
                     ).show()
-                number_of_sliders = self._collect()
-                if number_of_sliders == -1:
+                if self.collection_budget_milliseconds <= 0:
+                    _on_finished(self._collect())
                     return
-                CommonBasicNotification(
-                    CSFStringId.FINISHED_LOADING_SLIDERS,
-                    CSFStringId.FINISHED_LOADING_SLIDERS_DESCRIPTION,
-                    description_tokens=(str(number_of_sliders),)
-                ).show()
+                self._collect_over_time(on_progress=_on_progress, on_finished=_on_finished)
             except Exception as ex:
                 self.log.error('Error occurred while collecting sliders.', exception=ex)
                 self._collecting = False
@@ -278,34 +630,115 @@ class CSFSliderQueryRegistry(CommonService, HasLog):
             return -1
         self._collecting = True
         try:
-            stop_watch = CommonStopWatch()
-            stop_watch.start()
-            self._all = tuple(self._registry.sliders.values())
-            self.log.format_with_message(
-                'Loaded Sliders',
-                all_list=self._all,
-            )
-            enabled = self.log.enabled
-            self.log.enable()
-            self.log.debug('Took {}s to collect {} Sliders.'.format('%.3f' % (stop_watch.stop()), len(self._all)))
-            if not enabled:
-                self.log.disable()
-            stop_watch.start()
-            self._organize(self._all)
-            self._collecting = False
-            self.log.enable()
-            self.log.debug('Took {}s to organize Sliders'.format('%.3f' % (stop_watch.stop())))
-            if not enabled:
-                self.log.disable()
-            if self.log.enabled:
-                self.log.debug('Loaded {} Sliders.'.format(len(self._all)))
+            for _ in self._collect_in_steps():
+                pass
             return len(self._all)
         except Exception as ex:
             self.log.error('Error occurred while collecting Sliders.', exception=ex)
+            self._pending_changes.clear()
             return -1
         finally:
             self._collecting = False
 
+    def _collect_over_time(self, on_progress: Callable[[int, int], None]=None, on_finished: Callable[[int], None]=None) -> bool:
+        if self._collecting:
+            return False
+        self._collecting = True
+        collection_steps = self._collect_in_steps()
+        collection_budget_milliseconds = self.collection_budget_milliseconds
+        progress_interval = self.collection_progress_interval
+        total_stop_watch = CommonStopWatch()
+        total_stop_watch.start()
+        # Progress, ticks and the time spent within ticks, shared between ticks.
+        collection_state = [0, 0, 0.0]
+
+        def _finish(number_of_sliders: int) -> None:
+            CommonIntervalEventRegistry().unregister_dispatch(self._collection_dispatcher)
+            self._collection_dispatcher = None
+            self._collecting = False
+            enabled = self.log.enabled
+            self.log.enable()
+            self.log.debug('Took {}s over {} ticks ({}s within ticks) to collect and organize {} Sliders.'.format('%.3f' % (total_stop_watch.stop()), collection_state[1], '%.3f' % (collection_state[2]), number_of_sliders))
+            if not enabled:
+                self.log.disable()
+            if on_finished is not None:
+                on_finished(number_of_sliders)
+
+        def _collect_for_one_tick() -> None:
+            tick_stop_watch = CommonStopWatch()
+            tick_stop_watch.start()
+            collection_state[1] += 1
+            try:
+                for (number_of_handled_sliders, number_of_sliders) in collection_steps:
+                    if number_of_handled_sliders - collection_state[0] >= progress_interval:
+                        collection_state[0] = number_of_handled_sliders
+                        if on_progress is not None:
+                            on_progress(number_of_handled_sliders, number_of_sliders)
+                    if tick_stop_watch.interval() * 1000 >= collection_budget_milliseconds:
+                        collection_state[2] += tick_stop_watch.stop()
+                        return
+            except Exception as ex:
+                self.log.error('Error occurred while collecting Sliders.', exception=ex)
+                self._pending_changes.clear()
+                collection_state[2] += tick_stop_watch.stop()
+                _finish(-1)
+                return
+            collection_state[2] += tick_stop_watch.stop()
+            _finish(len(self._all))
+
+        self._collection_dispatcher = CommonIntervalEventRegistry().register_dispatcher(ModInfo.get_identity(), self.collection_tick_milliseconds, _collect_for_one_tick)
+        return True
+
+    def _get_index_fingerprint(self, tag_handlers: Tuple[CSFSliderTagHandler]) -> Union[str, None]:
+        slider_fingerprint = self._registry.fingerprint
+        if slider_fingerprint is None:
+            return None
+        tag_handler_names = ['{}.{}:{}'.format(tag_handler.__class__.__module__, tag_handler.__class__.__qualname__, tag_handler.tag_type.name) for tag_handler in tag_handlers]
+        combined_tag_type_names = [tag_type.name for tag_type in CSFSimDetailsSliderFilter.SIM_DETAILS_TAG_TYPES]
+        return hashlib.md5('|'.join((slider_fingerprint, *tag_handler_names, *combined_tag_type_names)).encode('utf-8')).hexdigest()
+
+    def _collect_in_steps(self) -> Iterator[Tuple[int, int]]:
+        # Yields the number of sliders handled so far and the total number of sliders after each slider, after organizing them and after saving the snapshot, so each of those happens in its own step. The new sliders are swapped in during the last step.
+        stop_watch = CommonStopWatch()
+        stop_watch.start()
+        sliders = tuple(self._registry.sliders.values())
+        self.log.format_with_message(
+            'Loaded Sliders',
+            all_list=sliders,
+        )
+        enabled = self.log.enabled
+        self.log.enable()
+        self.log.debug('Took {}s to collect {} Sliders.'.format('%.3f' % (stop_watch.stop()), len(sliders)))
+        if not enabled:
+            self.log.disable()
+        stop_watch.start()
+        number_of_sliders = len(sliders)
+        tag_handlers = tuple(self._tag_handlers)
+        fingerprint = self._get_index_fingerprint(tag_handlers)
+        new_index = None
+        if fingerprint is not None and self.use_index_snapshot:
+            new_index = CSFSliderIndexSnapshot().load(fingerprint, sliders)
+        if new_index is None:
+            slider_tag_keys: List[Tuple[CSFSlider, Tuple[Tuple[CSFSliderTagType, Any]]]] = list()
+            for slider in sliders:
+                slider_tag_keys.append((slider, self._get_tag_keys(slider, tag_handlers)))
+                yield len(slider_tag_keys), number_of_sliders
+            new_index = self._organize(slider_tag_keys)
+            if fingerprint is not None and self.use_index_snapshot:
+                yield number_of_sliders, number_of_sliders
+                CSFSliderIndexSnapshot().save(new_index, fingerprint)
+        else:
+            self.log.debug('Restored organized Sliders from the snapshot.')
+        yield number_of_sliders, number_of_sliders
+        self._collecting = False
+        self._swap(sliders, new_index)
+        self.log.enable()
+        self.log.debug('Took {}s to organize Sliders'.format('%.3f' % (stop_watch.stop())))
+        if not enabled:
+            self.log.disable()
+        if self.log.enabled:
+            self.log.debug('Loaded {} Sliders.'.format(len(self._all)))
+
     @classmethod
     def register_tag_handler(cls, tag_type: CSFSliderTagType) -> Callable[[Any], Any]:
         """ Register a tag handler. """
@@ -345,3 +778,66 @@ def _csf_command_reload_sliders(output: CommonConsoleCommandOutput):
         return
     CSFSliderQueryRegistry().trigger_collection()
     output('Finished triggering a reload. Now you must wait for the Sliders to finish loading. A notification will appear in the top right of your screen when they are done loading.')
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    'csf.show_query_cache',
+    'Show statistics of the slider query cache.'
+)
+def _csf_command_show_query_cache(output: CommonConsoleCommandOutput):
+    query_registry = CSFSliderQueryRegistry()
+    query_cache = query_registry.query_cache
+    total = query_cache.hits + query_cache.misses
+    output(f'Slider Index Generation: {query_registry.generation}')
+    output(f'Cached Queries: {query_cache.size}/{query_cache.max_size}')
+    output(f'Hits: {query_cache.hits} Misses: {query_cache.misses} Evictions: {query_cache.evictions}')
+    if total > 0:
+        output('Hit Rate: {}%'.format('%.1f' % (query_cache.hits * 100.0 / total)))
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    'csf.set_query_cache_size',
+    'Set the maximum number of slider query results kept in the cache.',
+    command_arguments=(
+        CommonConsoleCommandArgument('size', 'Number', 'The maximum number of query results to keep. Zero disables the cache.'),
+    ),
+)
+def _csf_command_set_query_cache_size(output: CommonConsoleCommandOutput, size: int):
+    if size is None or size < 0:
+        output('Failed, the size must be zero or greater.')
+        return
+    CSFSliderQueryRegistry().query_cache.max_size = size
+    output(f'Slider query cache size set to {size}.')
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    'csf.set_collection_budget',
+    'Set the time sliders may be collected for within a single game tick.',
+    command_arguments=(
+        CommonConsoleCommandArgument('milliseconds', 'Number', 'The time in milliseconds to collect sliders for each game tick. Zero collects all sliders at once.'),
+    ),
+)
+def _csf_command_set_collection_budget(output: CommonConsoleCommandOutput, milliseconds: int):
+    if milliseconds is None or milliseconds < 0:
+        output('Failed, the time must be zero or greater.')
+        return
+    CSFSliderQueryRegistry().collection_budget_milliseconds = milliseconds
+    if milliseconds == 0:
+        output('Sliders will be collected all at once.')
+        return
+    output(f'Sliders will be collected for {milliseconds}ms each game tick.')
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    'csf.clear_slider_index_cache',
+    'Delete the saved snapshot of the organized sliders, so they are organized again on the next reload.'
+)
+def _csf_command_clear_slider_index_cache(output: CommonConsoleCommandOutput):
+    if not CSFSliderIndexSnapshot().delete():
+        output('No saved snapshot of the organized sliders exists.')
+        return
+    output('Deleted the saved snapshot of the organized sliders.')
@@ -6,6 +6,7 @@ https://creativecommons.org/licenses/by-nd/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
+import hashlib
 from typing import Iterator, Dict, List, Union
 
 from cncustomsliderframework.dtos.sliders.slider import CSFSlider
@@ -23,6 +24,7 @@ class CSFSliderRegistry(CommonService, HasLog):
     def __init__(self) -> None:
         super().__init__()
         self._loaded = False
+        self._fingerprint: Union[str, None] = None
         self.sliders: Dict[str, CSFSlider] = None
         from cncustomsliderframework.sliders.slider_loaders.csf_slider_loader import \
             CSFCustomSliderFrameworkSliderLoader
@@ -51,6 +53,11 @@ class CSFSliderRegistry(CommonService, HasLog):
     def sliders(self, value: Dict[str, CSFSlider]):
         self._sliders = value
 
+    @property
+    def fingerprint(self) -> Union[str, None]:
+        """ A fingerprint of the snippets the sliders were loaded from. None if a loader has no fingerprint or if sliders were added, removed or updated since they were loaded. """
+        return self._fingerprint
+
     @property
     def slider_loaders(self) -> List[CSFBaseSliderLoader]:
         """ Loaders that load sliders. """
@@ -82,6 +89,46 @@ class CSFSliderRegistry(CommonService, HasLog):
         if unique_id in self.sliders:
             return False
         self.sliders[unique_id] = slider
+        self._fingerprint = None
+        from cncustomsliderframework.sliders.slider_query_registry import CSFSliderQueryRegistry
+        CSFSliderQueryRegistry().add_slider(slider)
+        return True
+
+    def remove_slider(self, identifier: str) -> bool:
+        """remove_slider(identifier)
+
+        Remove a Slider from the registry.
+
+        :param identifier: The identifier of a Slider.
+        :type identifier: str
+        :return: True, if the slider was successfully removed. False, if not.
+        :rtype: bool
+        """
+        if identifier not in self.sliders:
+            return False
+        del self.sliders[identifier]
+        self._fingerprint = None
+        from cncustomsliderframework.sliders.slider_query_registry import CSFSliderQueryRegistry
+        CSFSliderQueryRegistry().remove_slider(identifier)
+        return True
+
+    def update_slider(self, slider: CSFSlider) -> bool:
+        """update_slider(slider)
+
+        Replace a Slider in the registry with a Slider that has the same identifier.
+
+        :param slider: An instance of a Slider
+        :type slider: CSFSlider
+        :return: True, if the slider was successfully updated. False, if no slider with the same identifier exists.
+        :rtype: bool
+        """
+        unique_id = slider.unique_identifier
+        if unique_id not in self.sliders:
+            return False
+        self.sliders[unique_id] = slider
+        self._fingerprint = None
+        from cncustomsliderframework.sliders.slider_query_registry import CSFSliderQueryRegistry
+        CSFSliderQueryRegistry().update_slider(slider)
         return True
 
     def load(self) -> None:
@@ -99,6 +146,7 @@ class CSFSliderRegistry(CommonService, HasLog):
                 sliders_library[slider.unique_identifier] = slider
 
             self.sliders = sliders_library
+            self._fingerprint = self._create_fingerprint()
             self._loaded = True
         except Exception as ex:
             self.log.error('Error occurred while loading sliders.', exception=ex)
@@ -110,6 +158,18 @@ class CSFSliderRegistry(CommonService, HasLog):
                     continue
                 yield slider
 
+    def _create_fingerprint(self) -> Union[str, None]:
+        snippet_fingerprints: List[str] = list()
+        for slider_loader in self.slider_loaders:
+            loader_snippet_fingerprints = slider_loader.snippet_fingerprints
+            if loader_snippet_fingerprints is None:
+                return None
+            loader_name = '{}.{}'.format(slider_loader.__class__.__module__, slider_loader.__class__.__qualname__)
+            for snippet_fingerprint in loader_snippet_fingerprints:
+                snippet_fingerprints.append('{}:{}'.format(loader_name, snippet_fingerprint))
+        # Snippets are not always loaded in the same order.
+        return hashlib.md5('|'.join(sorted(snippet_fingerprints)).encode('utf-8')).hexdigest()
+
     def _get_sliders(self) -> Iterator[CSFSlider]:
         result: Iterator[CSFSlider] = self.sliders.values()
         return result
@@ -20,3 +20,6 @@ class CSFSliderTagType(CommonInt):
     CUSTOM_TAG: 'CSFSliderTagType' = 6
     UNIQUE_IDENTIFIER: 'CSFSliderTagType' = 7
     SLIDER_NAME: 'CSFSliderTagType' = 8
+    OCCULT_TYPE: 'CSFSliderTagType' = 9
+    SIM_TYPE: 'CSFSliderTagType' = 10
+    MODIFIER_ID: 'CSFSliderTagType' = 11
@@ -0,0 +1,31 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Tuple
+
+from cncustomsliderframework.sliders.slider_query_tag import CSFSliderQueryTag
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from cncustomsliderframework.sliders.tag_filters.slider_tag_filter import CSFSliderTagFilter
+from sims4communitylib.enums.common_occult_type import CommonOccultType
+
+
+class CSFOccultTypeSliderFilter(CSFSliderTagFilter):
+    """ Filter Sliders by Occult Type. """
+    def __init__(self, occult_type: CommonOccultType) -> None:
+        super().__init__(True, tag_type=CSFSliderTagType.OCCULT_TYPE)
+        self._occult_type = occult_type
+
+    # noinspection PyMissingOrEmptyDocstring
+    def get_tags(self) -> Tuple[CSFSliderQueryTag]:
+        return CSFSliderQueryTag(self.tag_type, self._occult_type),
+
+    def __str__(self) -> str:
+        return '{}: {}'.format(
+            self.__class__.__name__,
+            self._occult_type
+        )
@@ -8,37 +8,51 @@ Copyright (c) COLONOLNUTTY
 """
 from typing import Tuple
 
+from cncustomsliderframework.sim_details_cache import CSFSimDetailsCache
 from cncustomsliderframework.sliders.slider_query_tag import CSFSliderQueryTag
 from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
 from cncustomsliderframework.sliders.tag_filters.slider_tag_filter import CSFSliderTagFilter
 from sims.sim_info import SimInfo
 from sims4communitylib.enums.common_age import CommonAge
+from sims4communitylib.enums.common_gender import CommonGender
+from sims4communitylib.enums.common_occult_type import CommonOccultType
 from sims4communitylib.enums.common_species import CommonSpecies
-from sims4communitylib.utils.sims.common_age_utils import CommonAgeUtils
-from sims4communitylib.utils.sims.common_gender_utils import CommonGenderUtils
 from sims4communitylib.utils.sims.common_sim_name_utils import CommonSimNameUtils
 
 
 class CSFSimDetailsSliderFilter(CSFSliderTagFilter):
-    """ Filter Sliders by Sim Details. """
+    """ Filter Sliders by Sim Details.
+
+    .. note:: The Sliders matching each combination of Sim Details are precomputed when Sliders are organized, so this filter locates them with a single tag.
+
+    """
+    SIM_DETAILS_TAG_TYPES: Tuple[CSFSliderTagType, ...] = (
+        CSFSliderTagType.GENDER,
+        CSFSliderTagType.AGE,
+        CSFSliderTagType.SPECIES,
+        CSFSliderTagType.OCCULT_TYPE,
+    )
+
     def __init__(self, sim_info: SimInfo) -> None:
         super().__init__(True, tag_type=CSFSliderTagType.SIM_DETAILS)
         self._sim_info = sim_info
 
+    @staticmethod
+    def get_sim_details(sim_info: SimInfo) -> Tuple[CommonGender, CommonAge, CommonSpecies, CommonOccultType]:
+        """ Retrieve the details of a Sim, in the order of SIM_DETAILS_TAG_TYPES. """
+        return CSFSimDetailsCache().get_details(sim_info).availability_key
+
     # noinspection PyMissingOrEmptyDocstring
     def get_tags(self) -> Tuple[CSFSliderQueryTag]:
-        result: Tuple[CSFSliderQueryTag] = (
-            CSFSliderQueryTag(CSFSliderTagType.GENDER, CommonGenderUtils.get_gender(self._sim_info)),
-            CSFSliderQueryTag(CSFSliderTagType.AGE, CommonAge.get_age(self._sim_info)),
-            CSFSliderQueryTag(CSFSliderTagType.SPECIES, CommonSpecies.get_species(self._sim_info)),
-        )
-        return result
+        return CSFSliderQueryTag(self.tag_type, self.get_sim_details(self._sim_info)),
 
     def __str__(self) -> str:
-        return '{}: {}, Gender: {}, Age: {}, Species: {}'.format(
+        (gender, age, species, occult_type) = self.get_sim_details(self._sim_info)
+        return '{}: {}, Gender: {}, Age: {}, Species: {}, Occult Type: {}'.format(
             self.__class__.__name__,
             CommonSimNameUtils.get_full_name(self._sim_info),
-            CommonGenderUtils.get_gender(self._sim_info),
-            CommonAgeUtils.get_age(self._sim_info),
-            CommonSpecies.get_species(self._sim_info),
+            gender,
+            age,
+            species,
+            occult_type,
         )
@@ -0,0 +1,40 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Tuple
+
+from cncustomsliderframework.sliders.slider_query_tag import CSFSliderQueryTag
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from cncustomsliderframework.sliders.tag_filters.slider_tag_filter import CSFSliderTagFilter
+from sims4communitylib.enums.sim_type import CommonSimType
+
+
+class CSFSimTypeSliderFilter(CSFSliderTagFilter):
+    """ Include Sliders available for a Sim Type, which are the Sliders limited to the Sim Type and the Sliders not limited to any Sim Type.
+
+    .. note:: The tags of the filter are Include Any tags, use it with a query type that intersects Include All and Include Any tags.
+
+    """
+    # Sliders not limited to any Sim Type are tagged with this Sim Type.
+    UNRESTRICTED_SIM_TYPE = CommonSimType.NONE
+
+    def __init__(self, sim_type: CommonSimType) -> None:
+        super().__init__(False, tag_type=CSFSliderTagType.SIM_TYPE)
+        self._sim_type = sim_type
+
+    # noinspection PyMissingOrEmptyDocstring
+    def get_tags(self) -> Tuple[CSFSliderQueryTag]:
+        if self._sim_type == CSFSimTypeSliderFilter.UNRESTRICTED_SIM_TYPE:
+            return CSFSliderQueryTag(self.tag_type, self._sim_type),
+        return CSFSliderQueryTag(self.tag_type, self._sim_type), CSFSliderQueryTag(self.tag_type, CSFSimTypeSliderFilter.UNRESTRICTED_SIM_TYPE)
+
+    def __str__(self) -> str:
+        return '{}: {}'.format(
+            self.__class__.__name__,
+            self._sim_type
+        )
@@ -16,7 +16,9 @@ from sims4.tuning.tunable import Tunable, TunableList, HasTunableFactory, AutoFa
     TunableEnumEntry
 from sims4.tuning.tunable_base import GroupNames
 from sims4communitylib.enums.common_gender import CommonGender
+from sims4communitylib.enums.common_occult_type import CommonOccultType
 from sims4communitylib.enums.common_species import CommonSpecies
+from sims4communitylib.enums.sim_type import CommonSimType
 from cncustomsliderframework.enums.slider_category import CSFSliderCategory
 
 
@@ -36,6 +38,8 @@ class CSFCustomSliderInfo(HasTunableFactory, AutoFactoryInit):
         'available_for_genders': TunableEnumSet(enum_type=CommonGender, default_enum_list=frozenset((CommonGender.MALE, CommonGender.FEMALE))),
         'available_for_ages': TunableEnumSet(enum_type=Age, default_enum_list=frozenset((Age.BABY, Age.TODDLER, Age.CHILD, Age.TEEN, Age.YOUNGADULT, Age.ADULT, Age.ELDER))),
         'available_for_species': TunableEnumSet(enum_type=CommonSpecies, default_enum_list=frozenset((CommonSpecies.HUMAN, CommonSpecies.SMALL_DOG, CommonSpecies.LARGE_DOG, CommonSpecies.CAT))),
+        'available_for_occult_types': TunableEnumSet(enum_type=CommonOccultType, default_enum_list=frozenset()),
+        'available_for_sim_types': TunableEnumSet(enum_type=CommonSimType, default_enum_list=frozenset()),
         'slider_categories': TunableEnumSet(enum_type=CSFSliderCategory, default_enum_list=frozenset((CSFSliderCategory.OTHER,))),
         'tags': TunableSet(tunable=Tunable(tunable_type=str, default=''), tuning_group=GroupNames.TAG),
     }
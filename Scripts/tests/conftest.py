@@ -0,0 +1,143 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import enum
+import importlib.abc
+import importlib.machinery
+import os
+import sys
+import time
+import types
+
+# The game and Sims 4 Community Library modules only exist within the game, so placeholders are imported in their place while testing.
+_GAME_MODULE_ROOTS = ('sims4communitylib', 'sims', 'sims4', 'protocolbuffers', 'services', 'sims4modsettingsmenu', 'enum_lib')
+
+
+class _PlaceholderMeta(type):
+    def __getattr__(cls, name: str):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return _Placeholder
+
+
+class _Placeholder(metaclass=_PlaceholderMeta):
+    def __init__(self, *_, **__) -> None:
+        pass
+
+    def __call__(self, *args, **kwargs):
+        # Used as a decorator, the decorated function is kept as is.
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return _Placeholder()
+
+    def __getattr__(self, name: str):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return _Placeholder()
+
+
+class _CommonSimDataStorageMetaclass(_PlaceholderMeta):
+    """ Stands in for the metaclass of the Sim data storage of Sims 4 Community Library, so metaclasses derived from it are metaclasses as well. """
+    pass
+
+
+class _CommonIntMeta(enum.EnumMeta):
+    @property
+    def values(cls):
+        return tuple(cls)
+
+
+class CommonInt(enum.IntEnum, metaclass=_CommonIntMeta):
+    """ Stands in for the CommonInt of Sims 4 Community Library. """
+    pass
+
+
+class _Log:
+    enabled = False
+
+    def __getattr__(self, name: str):
+        return lambda *_, **__: None
+
+
+class HasLog:
+    """ Stands in for the HasLog of Sims 4 Community Library, with logging disabled. """
+    def __init__(self, *_, **__) -> None:
+        pass
+
+    @property
+    def log(self) -> _Log:
+        return _Log()
+
+
+class _SingletonMeta(type):
+    _instances = dict()
+
+    def __call__(cls, *args, **kwargs):
+        if cls not in cls._instances:
+            cls._instances[cls] = super().__call__(*args, **kwargs)
+        return cls._instances[cls]
+
+
+class CommonService(metaclass=_SingletonMeta):
+    """ Stands in for the CommonService of Sims 4 Community Library. """
+    pass
+
+
+class CommonStopWatch:
+    """ Stands in for the CommonStopWatch of Sims 4 Community Library. """
+    def __init__(self) -> None:
+        self._start_time = time.perf_counter()
+
+    def start(self) -> None:
+        self._start_time = time.perf_counter()
+
+    def interval(self) -> float:
+        return time.perf_counter() - self._start_time
+
+    def stop(self) -> float:
+        return time.perf_counter() - self._start_time
+
+
+_PLACEHOLDERS_BY_NAME = {
+    'CommonInt': CommonInt,
+    'HasLog': HasLog,
+    'HasClassLog': HasLog,
+    'CommonService': CommonService,
+    'CommonStopWatch': CommonStopWatch,
+    '_CommonSimDataStorageMetaclass': _CommonSimDataStorageMetaclass,
+}
+
+
+class _GameModule(types.ModuleType):
+    def __getattr__(self, name: str):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        if name in _PLACEHOLDERS_BY_NAME:
+            return _PLACEHOLDERS_BY_NAME[name]
+        placeholder = _PlaceholderMeta(name, (_Placeholder,), dict())
+        setattr(self, name, placeholder)
+        return placeholder
+
+
+class _GameModuleFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def find_spec(self, name: str, path, target=None):
+        if name.split('.')[0] in _GAME_MODULE_ROOTS:
+            return importlib.machinery.ModuleSpec(name, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        module = _GameModule(spec.name)
+        module.__path__ = list()
+        return module
+
+    def exec_module(self, module) -> None:
+        pass
+
+
+sys.meta_path.insert(0, _GameModuleFinder())
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
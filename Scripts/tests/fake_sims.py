@@ -0,0 +1,163 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import copy
+import json
+from typing import Any, Dict, List, Tuple
+
+from cncustomsliderframework import custom_slider_application_service, slider_edit_session
+from cncustomsliderframework.custom_slider_application_service import CSFCustomSliderApplicationService
+from cncustomsliderframework.dtos.sims import facial_modifier_set
+from cncustomsliderframework.dtos.sliders.applied_sliders_library_by_sim_type import CSFAppliedSliderLibraryBySimType
+from sims4communitylib.events.event_handling import common_event_registry
+from sims4communitylib.utils.sims import common_sim_utils
+
+SIM_TYPE = 'human'
+MODIFIER_LISTS = ('body_modifiers', 'aged_body_modifiers', 'face_modifiers', 'aged_face_modifiers')
+
+
+class FakeModifier:
+    """ A modifier of facial attributes. """
+    def __init__(self, key: int=0, amount: float=0.0) -> None:
+        self.key = key
+        self.amount = amount
+
+
+class FakeFacialAttributes:
+    """ Facial attributes serialized as JSON rather than as a protocol buffer. """
+    Modifier = FakeModifier
+
+    def __init__(self) -> None:
+        for modifier_list in MODIFIER_LISTS:
+            setattr(self, modifier_list, list())
+        self.sculpts: List[int] = list()
+
+    def MergeFromString(self, serialized_facial_attributes: bytes) -> None:
+        data = json.loads(serialized_facial_attributes.decode('utf-8')) if serialized_facial_attributes else dict()
+        for modifier_list in MODIFIER_LISTS:
+            getattr(self, modifier_list).extend([FakeModifier(key, amount) for (key, amount) in data.get(modifier_list, ())])
+        self.sculpts.extend(data.get('sculpts', ()))
+
+    def SerializeToString(self) -> bytes:
+        data: Dict[str, Any] = {modifier_list: [(modifier.key, modifier.amount) for modifier in getattr(self, modifier_list)] for modifier_list in MODIFIER_LISTS}
+        data['sculpts'] = list(self.sculpts)
+        return json.dumps(data).encode('utf-8')
+
+
+class FakeSimInfo:
+    """ A Sim with serialized facial attributes, counting how often they are resent. """
+    def __init__(self, sim_id: int, face_modifiers: Tuple[Tuple[int, float], ...]=()) -> None:
+        self.sim_id = sim_id
+        facial_attributes = FakeFacialAttributes()
+        for (key, amount) in face_modifiers:
+            facial_attributes.face_modifiers.append(FakeModifier(key, amount))
+            facial_attributes.aged_face_modifiers.append(FakeModifier(key, amount))
+        self.facial_attributes = facial_attributes.SerializeToString()
+        self.number_of_resends = 0
+
+    def resend_facial_attributes(self) -> None:
+        self.number_of_resends += 1
+
+
+class FakeCustomSlider:
+    """ A face or body Slider available for every Sim. """
+    def __init__(self, raw_display_name: str, positive_modifier_id: int, negative_modifier_id: int, is_face_modifier: bool=True) -> None:
+        self.raw_display_name = raw_display_name
+        self.positive_modifier_id = positive_modifier_id
+        self.negative_modifier_id = negative_modifier_id
+        self.is_face_modifier = is_face_modifier
+        self.is_body_modifier = not is_face_modifier
+        self.minimum_value = -100.0
+        self.maximum_value = 100.0
+
+    def is_available_for(self, _) -> bool:
+        return True
+
+    def get_modifier_ids(self) -> Tuple[int, ...]:
+        return self.positive_modifier_id, self.negative_modifier_id
+
+    def has_positive_modifier_id(self) -> bool:
+        return self.positive_modifier_id != 0
+
+    def has_negative_modifier_id(self) -> bool:
+        return self.negative_modifier_id != 0
+
+    def __repr__(self) -> str:
+        return self.raw_display_name
+
+
+class FakeSimSliderSystemData:
+    """ Persisted slider values of each Sim, counting how often they are written. """
+    applied_sliders_by_sim_id: Dict[int, CSFAppliedSliderLibraryBySimType] = dict()
+    number_of_writes = 0
+
+    def __init__(self, sim_info: FakeSimInfo) -> None:
+        self._sim_id = sim_info.sim_id
+
+    @property
+    def applied_sliders(self) -> CSFAppliedSliderLibraryBySimType:
+        applied_sliders = FakeSimSliderSystemData.applied_sliders_by_sim_id.get(self._sim_id, None)
+        if applied_sliders is None:
+            return CSFAppliedSliderLibraryBySimType(dict())
+        return copy.deepcopy(applied_sliders)
+
+    @applied_sliders.setter
+    def applied_sliders(self, value: CSFAppliedSliderLibraryBySimType) -> None:
+        FakeSimSliderSystemData.number_of_writes += 1
+        FakeSimSliderSystemData.applied_sliders_by_sim_id[self._sim_id] = copy.deepcopy(value)
+
+
+class _FakeSimDetails:
+    sim_type = SIM_TYPE
+
+
+class FakeSimDetailsCache:
+    """ Every Sim is of the same sim type. """
+    def get_details(self, _) -> _FakeSimDetails:
+        return _FakeSimDetails()
+
+
+class FakeEventRegistry:
+    """ Records dispatched events rather than handling them. """
+    dispatched_events: List[Any] = list()
+
+    def dispatch(self, event: Any) -> None:
+        FakeEventRegistry.dispatched_events.append(event)
+
+
+class _FakeSimUtils:
+    @staticmethod
+    def get_sim_id(sim_info: FakeSimInfo) -> int:
+        return sim_info.sim_id
+
+
+def create_application_service(monkeypatch) -> CSFCustomSliderApplicationService:
+    """ Create an application service changing fake Sims, with persisted values and dispatched events recorded by the fakes. """
+    FakeSimSliderSystemData.applied_sliders_by_sim_id = dict()
+    FakeSimSliderSystemData.number_of_writes = 0
+    FakeEventRegistry.dispatched_events = list()
+    for module in (custom_slider_application_service, facial_modifier_set):
+        monkeypatch.setattr(module, 'BlobSimFacialCustomizationData', FakeFacialAttributes)
+    for module in (custom_slider_application_service, slider_edit_session):
+        monkeypatch.setattr(module, 'CSFSimSliderSystemData', FakeSimSliderSystemData)
+        monkeypatch.setattr(module, 'CSFSimDetailsCache', FakeSimDetailsCache)
+    monkeypatch.setattr(custom_slider_application_service, 'CommonSimUtils', _FakeSimUtils)
+    monkeypatch.setattr(common_sim_utils, 'CommonSimUtils', _FakeSimUtils)
+    monkeypatch.setattr(common_event_registry, 'CommonEventRegistry', FakeEventRegistry)
+    # A new instance, rather than the shared service.
+    application_service = object.__new__(CSFCustomSliderApplicationService)
+    application_service.__init__()
+    return application_service
+
+
+def get_persisted_value(sim_info: FakeSimInfo, custom_slider: FakeCustomSlider) -> Any:
+    """ Retrieve the persisted value of a Slider for a Sim or None if no value is persisted. """
+    library = FakeSimSliderSystemData(sim_info).applied_sliders.get_library(SIM_TYPE)
+    if library is None or custom_slider.raw_display_name not in library.sliders:
+        return None
+    return library.get_value(custom_slider.raw_display_name)
@@ -0,0 +1,51 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import random
+from typing import Any, List, Set, Tuple
+
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+
+GENDERS = ('male', 'female')
+AGES = ('child', 'teen', 'adult', 'elder')
+CATEGORIES = ('head', 'body', 'eyes')
+CUSTOM_TAGS = ('a', 'b', 'c', 'd')
+
+
+class FakeSlider:
+    """ A Slider with only the attributes the index and search read, along with the tag keys it is indexed by. """
+    def __init__(self, unique_identifier: str, raw_display_name: str, author: str='', tags: Tuple[str, ...]=(), tag_keys: Tuple[Tuple[CSFSliderTagType, Any], ...]=()) -> None:
+        self.unique_identifier = unique_identifier
+        self.name = raw_display_name
+        self.raw_display_name = raw_display_name
+        self.author = author
+        self.tags = tags
+        self.tag_keys = tag_keys
+
+    def __repr__(self) -> str:
+        return self.unique_identifier
+
+
+def create_fake_library(number_of_sliders: int=120, seed: int=1) -> List[FakeSlider]:
+    """ Create Sliders with random genders, ages, categories and custom tags. """
+    generator = random.Random(seed)
+    sliders: List[FakeSlider] = list()
+    for number in range(number_of_sliders):
+        tag_keys: List[Tuple[CSFSliderTagType, Any]] = [(CSFSliderTagType.ALL, 'all')]
+        tag_keys.extend([(CSFSliderTagType.GENDER, gender) for gender in generator.sample(GENDERS, generator.randint(1, 2))])
+        tag_keys.extend([(CSFSliderTagType.AGE, age) for age in generator.sample(AGES, generator.randint(1, 3))])
+        tag_keys.extend([(CSFSliderTagType.CATEGORY, category) for category in generator.sample(CATEGORIES, generator.randint(1, 2))])
+        tags = tuple(generator.sample(CUSTOM_TAGS, generator.randint(0, 2)))
+        tag_keys.extend([(CSFSliderTagType.CUSTOM_TAG, tag) for tag in tags])
+        sliders.append(FakeSlider('slider_{}'.format(number), 'Slider {}'.format(number), author='author_{}'.format(number % 3), tags=tags, tag_keys=tuple(tag_keys)))
+    return sliders
+
+
+def get_all_tag_keys(sliders: List[FakeSlider]) -> Set[Tuple[CSFSliderTagType, Any]]:
+    """ Collect the tag keys of every Slider. """
+    return set([tag_key for slider in sliders for tag_key in slider.tag_keys])
@@ -0,0 +1,104 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import pytest
+
+from cncustomsliderframework.enums.query_type import CSFQueryType
+from cncustomsliderframework.sliders.query.prepared_slider_query import CSFPreparedSliderQuery, CSFSliderQueryParameter
+from cncustomsliderframework.sliders.query.slider_query import CSFSliderQuery
+from cncustomsliderframework.sliders.query.slider_query_plan import CSFSliderQueryPlan
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.slider_query_registry import CSFSliderQueryRegistry
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from fake_sliders import AGES, CATEGORIES, GENDERS, create_fake_library
+from test_slider_query_plan import _TagKeysFilter
+
+ALL_KEY = (CSFSliderTagType.ALL, 'all')
+EXCLUDED_KEY = (CSFSliderTagType.CUSTOM_TAG, 'd')
+
+
+def _create_prepared_query(query_type: CSFQueryType=CSFQueryType.ALL_PLUS_ANY, max_bound_queries: int=128) -> CSFPreparedSliderQuery:
+    return CSFPreparedSliderQuery(
+        (_TagKeysFilter((ALL_KEY,), True), _TagKeysFilter((EXCLUDED_KEY,), True, exclude_tags=True)),
+        parameters=(
+            CSFSliderQueryParameter(CSFSliderTagType.GENDER),
+            CSFSliderQueryParameter(CSFSliderTagType.AGE, match_all_tags=False),
+            CSFSliderQueryParameter(CSFSliderTagType.CATEGORY, exclude_tags=True)
+        ),
+        query_type=query_type,
+        max_bound_queries=max_bound_queries
+    )
+
+
+def _create_equivalent_query(gender: str, age: str, category: str, query_type: CSFQueryType) -> CSFSliderQuery:
+    return CSFSliderQuery(
+        (
+            _TagKeysFilter((ALL_KEY, (CSFSliderTagType.GENDER, gender)), True),
+            _TagKeysFilter(((CSFSliderTagType.AGE, age),), False),
+            _TagKeysFilter((EXCLUDED_KEY, (CSFSliderTagType.CATEGORY, category)), True, exclude_tags=True)
+        ),
+        query_type=query_type
+    )
+
+
+def test_bind_maps_parameters_to_tags():
+    bound_query = _create_prepared_query().bind('male', 'teen', 'head')
+    assert [tag.key for tag in bound_query.include_all_tags] == [ALL_KEY, (CSFSliderTagType.GENDER, 'male')]
+    assert [tag.key for tag in bound_query.include_any_tags] == [(CSFSliderTagType.AGE, 'teen')]
+    assert [tag.key for tag in bound_query.exclude_tags] == [EXCLUDED_KEY, (CSFSliderTagType.CATEGORY, 'head')]
+    assert bound_query.query_type == CSFQueryType.ALL_PLUS_ANY
+
+
+def test_bound_signature_matches_equivalent_query():
+    for query_type in CSFQueryType:
+        bound_query = _create_prepared_query(query_type=query_type).bind('female', 'elder', 'eyes')
+        assert bound_query.signature == _create_equivalent_query('female', 'elder', 'eyes', query_type).signature
+
+
+def test_bound_query_locates_the_same_sliders_as_equivalent_query():
+    sliders = create_fake_library()
+    index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    for query_type in CSFQueryType:
+        prepared_query = _create_prepared_query(query_type=query_type)
+        for gender in GENDERS:
+            for age in AGES:
+                for category in CATEGORIES:
+                    bound_plan = CSFSliderQueryPlan.create(prepared_query.bind(gender, age, category), index)
+                    plan = CSFSliderQueryPlan.create(_create_equivalent_query(gender, age, category, query_type), index)
+                    assert bound_plan.execute(index) == plan.execute(index), plan.explain(index)
+
+
+def test_bind_reuses_bound_queries_for_equal_values():
+    prepared_query = _create_prepared_query()
+    bound_query = prepared_query.bind('male', 'teen', 'head')
+    assert prepared_query.bind('male', 'teen', 'head') is bound_query
+    assert prepared_query.bind('male', 'teen', 'body') is not bound_query
+
+
+def test_bind_evicts_bound_queries_when_full():
+    prepared_query = _create_prepared_query(max_bound_queries=2)
+    first_bound_query = prepared_query.bind('male', 'teen', 'head')
+    second_bound_query = prepared_query.bind('male', 'teen', 'body')
+    assert prepared_query.bind('male', 'teen', 'head') is first_bound_query
+    prepared_query.bind('male', 'teen', 'eyes')
+    assert prepared_query.bind('male', 'teen', 'head') is not first_bound_query
+    assert prepared_query.bind('male', 'teen', 'body') is not second_bound_query
+
+
+def test_bind_rejects_the_wrong_number_of_values():
+    prepared_query = _create_prepared_query()
+    with pytest.raises(ValueError):
+        prepared_query.bind('male', 'teen')
+    with pytest.raises(ValueError):
+        prepared_query.bind('male', 'teen', 'head', 'extra')
+
+
+def test_registry_prepares_queries_with_the_same_default_query_type():
+    registry = object.__new__(CSFSliderQueryRegistry)
+    prepared_query = registry.prepare_query((_TagKeysFilter((ALL_KEY,), True),), (CSFSliderQueryParameter(CSFSliderTagType.GENDER),))
+    assert prepared_query.query_type == CSFPreparedSliderQuery((), ()).query_type == CSFQueryType.ALL_PLUS_ANY
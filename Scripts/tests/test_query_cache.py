@@ -0,0 +1,137 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import random
+
+from cncustomsliderframework.queries.query_cache import CSFQueryCache
+
+
+class _ReferenceCache:
+    """ A list based least recently used cache, most recently used last. """
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.generation = 0
+        self.entries = list()
+
+    def get(self, generation: int, signature):
+        self._update_generation(generation)
+        for (index, (stored_signature, result)) in enumerate(self.entries):
+            if stored_signature == signature:
+                self.entries.append(self.entries.pop(index))
+                return result
+        return None
+
+    def put(self, generation: int, signature, result) -> None:
+        self._update_generation(generation)
+        self.entries = [entry for entry in self.entries if entry[0] != signature]
+        self.entries.append((signature, result))
+        self.entries = self.entries[-self.max_size:]
+
+    def _update_generation(self, generation: int) -> None:
+        if generation != self.generation:
+            self.entries = list()
+            self.generation = generation
+
+
+def test_matches_a_reference_least_recently_used_cache():
+    generator = random.Random(7)
+    cache = CSFQueryCache(max_size=8)
+    reference = _ReferenceCache(8)
+    generation = 0
+    for step in range(5000):
+        if generator.random() < 0.01:
+            generation += 1
+        signature = frozenset([generator.randrange(20)])
+        if generator.random() < 0.5:
+            assert cache.get(generation, signature) == reference.get(generation, signature), step
+        else:
+            cache.put(generation, signature, ('result', step))
+            reference.put(generation, signature, ('result', step))
+        assert cache.size == len(reference.entries)
+
+
+def test_least_recently_used_result_is_evicted():
+    cache = CSFQueryCache(max_size=2)
+    cache.put(0, 'a', 1)
+    cache.put(0, 'b', 2)
+    assert cache.get(0, 'a') == 1
+    cache.put(0, 'c', 3)
+    assert cache.get(0, 'b') is None
+    assert cache.get(0, 'a') == 1
+    assert cache.get(0, 'c') == 3
+    assert cache.evictions == 1
+
+
+def test_a_new_generation_discards_every_result():
+    cache = CSFQueryCache()
+    cache.put(0, 'a', 1)
+    cache.put(0, 'b', 2)
+    assert cache.get(1, 'a') is None
+    assert cache.size == 0
+    assert cache.generation == 1
+    cache.put(1, 'a', 3)
+    assert cache.get(1, 'a') == 3
+    # A result produced for an older generation replaces the newer results as well.
+    cache.put(0, 'b', 4)
+    assert cache.get(0, 'a') is None
+    assert cache.get(0, 'b') == 4
+
+
+def test_statistics():
+    cache = CSFQueryCache()
+    assert cache.get(0, 'a') is None
+    cache.put(0, 'a', 1)
+    assert cache.get(0, 'a') == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.clear()
+    assert cache.size == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.clear(reset_statistics=True)
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+
+def test_invalidate_discards_matching_results():
+    cache = CSFQueryCache()
+    for signature in range(10):
+        cache.put(0, signature, signature)
+    assert cache.invalidate(lambda signature: signature % 2 == 0) == 5
+    assert [cache.get(0, signature) for signature in range(10)] == [None, 1, None, 3, None, 5, None, 7, None, 9]
+
+
+def test_size_bound():
+    cache = CSFQueryCache(max_size=4)
+    for signature in range(4):
+        cache.put(0, signature, signature)
+    cache.max_size = 2
+    assert cache.size == 2
+    assert cache.get(0, 3) == 3
+    assert cache.get(0, 1) is None
+    cache.max_size = 0
+    cache.put(0, 'a', 1)
+    assert cache.size == 0
+    assert cache.get(0, 'a') is None
+
+
+def test_none_results_are_not_stored():
+    cache = CSFQueryCache()
+    cache.put(0, 'a', None)
+    assert cache.size == 0
+
+
+def test_peek_does_not_count_or_reorder():
+    cache = CSFQueryCache(max_size=2)
+    cache.put(0, 'a', 1)
+    cache.put(0, 'b', 2)
+    assert cache.peek(0, 'a') == 1
+    assert cache.peek(0, 'missing') is None
+    assert cache.peek(1, 'a') is None
+    assert (cache.hits, cache.misses, cache.generation) == (0, 0, 0)
+    cache.put(0, 'c', 3)
+    # 'a' was only peeked at, so it is still the least recently used result.
+    assert cache.peek(0, 'a') is None
+    assert cache.peek(0, 'b') == 2
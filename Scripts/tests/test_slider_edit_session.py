@@ -0,0 +1,89 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import pytest
+
+from fake_sims import FakeCustomSlider, FakeSimInfo, FakeSimSliderSystemData, create_application_service, get_persisted_value
+
+NOSE = FakeCustomSlider('Nose', 1, 2)
+CHIN = FakeCustomSlider('Chin', 3, 4)
+BELLY = FakeCustomSlider('Belly', 5, 6, is_face_modifier=False)
+
+
+def _create_sim_info() -> FakeSimInfo:
+    return FakeSimInfo(1, face_modifiers=((1, 0.5),))
+
+
+def test_commit_applies_every_change_at_once(monkeypatch):
+    application_service = create_application_service(monkeypatch)
+    sim_info = _create_sim_info()
+    with application_service.edit_sliders(sim_info, persist_value=True) as edit_session:
+        assert edit_session.apply_slider(CHIN, -30.0)
+        assert edit_session.apply_slider(BELLY, 20.0)
+        assert edit_session.remove_slider(NOSE)
+        # Nothing reaches the Sim until the session is committed.
+        assert sim_info.number_of_resends == 0
+        assert FakeSimSliderSystemData.number_of_writes == 0
+    assert not edit_session.is_open
+    assert sim_info.number_of_resends == 1
+    assert FakeSimSliderSystemData.number_of_writes == 1
+    assert application_service.get_current_slider_value(sim_info, NOSE) == 0.0
+    assert application_service.get_current_slider_value(sim_info, CHIN) == pytest.approx(-30.0)
+    assert application_service.get_current_slider_value(sim_info, BELLY) == pytest.approx(20.0)
+    assert get_persisted_value(sim_info, CHIN) == -30.0
+    assert get_persisted_value(sim_info, BELLY) == 20.0
+    assert get_persisted_value(sim_info, NOSE) is None
+    assert [(custom_slider, new_value) for (custom_slider, _, new_value) in edit_session.changed_values] == [(CHIN, -30.0), (BELLY, 20.0), (NOSE, 0.0)]
+
+
+def test_rollback_leaves_the_sim_and_persisted_values_unchanged(monkeypatch):
+    application_service = create_application_service(monkeypatch)
+    sim_info = _create_sim_info()
+    application_service.apply_slider(sim_info, CHIN, 40.0, persist_value=True)
+    facial_attributes = sim_info.facial_attributes
+    number_of_writes = FakeSimSliderSystemData.number_of_writes
+    edit_session = application_service.edit_sliders(sim_info, persist_value=True)
+    assert edit_session.apply_slider(CHIN, -10.0)
+    assert edit_session.apply_slider(NOSE, 80.0)
+    assert edit_session.reset_slider(BELLY)
+    edit_session.rollback()
+    assert not edit_session.is_open
+    assert edit_session.changed_values == tuple()
+    assert sim_info.facial_attributes is facial_attributes
+    assert sim_info.number_of_resends == 1
+    assert FakeSimSliderSystemData.number_of_writes == number_of_writes
+    assert get_persisted_value(sim_info, CHIN) == 40.0
+    assert get_persisted_value(sim_info, NOSE) is None
+    assert application_service.get_current_slider_value(sim_info, NOSE) == pytest.approx(50.0)
+
+
+def test_session_is_rolled_back_when_its_block_raises(monkeypatch):
+    application_service = create_application_service(monkeypatch)
+    sim_info = _create_sim_info()
+    facial_attributes = sim_info.facial_attributes
+    with pytest.raises(ValueError):
+        with application_service.edit_sliders(sim_info, persist_value=True) as edit_session:
+            edit_session.apply_slider(CHIN, 25.0)
+            raise ValueError()
+    assert not edit_session.is_open
+    assert sim_info.facial_attributes is facial_attributes
+    assert sim_info.number_of_resends == 0
+    assert FakeSimSliderSystemData.number_of_writes == 0
+    assert get_persisted_value(sim_info, CHIN) is None
+
+
+def test_closed_session_cannot_be_changed(monkeypatch):
+    application_service = create_application_service(monkeypatch)
+    edit_session = application_service.edit_sliders(_create_sim_info())
+    edit_session.commit()
+    with pytest.raises(RuntimeError):
+        edit_session.apply_slider(CHIN, 10.0)
+    with pytest.raises(RuntimeError):
+        edit_session.commit()
+    with pytest.raises(RuntimeError):
+        edit_session.rollback()
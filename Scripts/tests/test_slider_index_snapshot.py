@@ -0,0 +1,125 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import enum
+import json
+import os
+
+import pytest
+
+from cncustomsliderframework.enums.slider_category import CSFSliderCategory
+from cncustomsliderframework.sliders.query import slider_index_snapshot
+from cncustomsliderframework.sliders.query.slider_index_snapshot import CSFSliderIndexSnapshot
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from fake_sliders import FakeSlider, create_fake_library
+
+FINGERPRINT = 'fingerprint'
+
+
+class _Gender(enum.IntEnum):
+    MALE = 1
+    FEMALE = 2
+
+
+class _Age(enum.IntEnum):
+    CHILD = 1
+    TEEN = 2
+    ADULT = 3
+    ELDER = 4
+
+
+class _JSONIOUtils:
+    @staticmethod
+    def write_to_file(file_path: str, data) -> bool:
+        with open(file_path, 'w') as file:
+            json.dump(data, file)
+        return True
+
+    @staticmethod
+    def load_from_file(file_path: str):
+        with open(file_path) as file:
+            return json.load(file)
+
+
+@pytest.fixture
+def snapshot(monkeypatch, tmp_path) -> CSFSliderIndexSnapshot:
+    # Game enums are placeholders while testing, so the values of the fake sliders are members of stand in enums.
+    monkeypatch.setattr(CSFSliderIndexSnapshot, 'ENUM_TYPES_BY_TAG_TYPE', {CSFSliderTagType.GENDER: _Gender, CSFSliderTagType.AGE: _Age, CSFSliderTagType.CATEGORY: CSFSliderCategory})
+    monkeypatch.setattr(CSFSliderIndexSnapshot, 'file_path', property(lambda _: os.path.join(str(tmp_path), 'csf', CSFSliderIndexSnapshot.FILE_NAME)))
+    monkeypatch.setattr(slider_index_snapshot, 'CommonJSONIOUtils', _JSONIOUtils)
+    return CSFSliderIndexSnapshot()
+
+
+def _to_enum_value(tag_type: CSFSliderTagType, value):
+    if tag_type == CSFSliderTagType.GENDER:
+        return _Gender[value.upper()]
+    if tag_type == CSFSliderTagType.AGE:
+        return _Age[value.upper()]
+    if tag_type == CSFSliderTagType.CATEGORY:
+        return {'head': CSFSliderCategory.FACE, 'body': CSFSliderCategory.BODY, 'eyes': CSFSliderCategory.OTHER}[value]
+    return value
+
+
+def _create_sliders():
+    return [
+        FakeSlider(slider.unique_identifier, slider.raw_display_name, tag_keys=tuple([(tag_type, _to_enum_value(tag_type, value)) for (tag_type, value) in slider.tag_keys]))
+        for slider in create_fake_library(number_of_sliders=40)
+    ]
+
+
+def _create_index(sliders) -> CSFSliderTagIndex:
+    index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    index.add_combined_keys(CSFSliderTagType.SIM_DETAILS, (CSFSliderTagType.GENDER, CSFSliderTagType.AGE))
+    return index
+
+
+def test_saved_index_is_loaded_unchanged(snapshot: CSFSliderIndexSnapshot):
+    sliders = _create_sliders()
+    index = _create_index(sliders)
+    # A removed slider leaves an empty ordinal, which is saved as well.
+    index.remove_slider(sliders[0].unique_identifier)
+    assert snapshot.save(index, FINGERPRINT)
+    loaded_index = snapshot.load(FINGERPRINT, sliders[1:])
+    assert loaded_index is not None
+    assert loaded_index.get_state() == index.get_state()
+    assert loaded_index.get_bitmap((CSFSliderTagType.SIM_DETAILS, (_Gender.MALE, _Age.TEEN))) == index.get_bitmap((CSFSliderTagType.SIM_DETAILS, (_Gender.MALE, _Age.TEEN)))
+
+
+def test_snapshot_with_a_different_fingerprint_is_not_loaded(snapshot: CSFSliderIndexSnapshot):
+    sliders = _create_sliders()
+    assert snapshot.save(_create_index(sliders), FINGERPRINT)
+    assert snapshot.load('other fingerprint', sliders) is None
+
+
+def test_snapshot_of_a_different_version_is_not_loaded(snapshot: CSFSliderIndexSnapshot, monkeypatch):
+    sliders = _create_sliders()
+    assert snapshot.save(_create_index(sliders), FINGERPRINT)
+    monkeypatch.setattr(CSFSliderIndexSnapshot, 'VERSION', CSFSliderIndexSnapshot.VERSION + 1)
+    assert snapshot.load(FINGERPRINT, sliders) is None
+
+
+def test_snapshot_is_not_loaded_when_the_loaded_sliders_differ(snapshot: CSFSliderIndexSnapshot):
+    sliders = _create_sliders()
+    assert snapshot.save(_create_index(sliders), FINGERPRINT)
+    assert snapshot.load(FINGERPRINT, sliders[1:]) is None
+    assert snapshot.load(FINGERPRINT, (*sliders, FakeSlider('added', 'Added'))) is None
+
+
+def test_snapshot_with_an_unknown_tag_value_is_not_loaded(snapshot: CSFSliderIndexSnapshot):
+    sliders = _create_sliders()
+    assert snapshot.save(_create_index(sliders), FINGERPRINT)
+    data = _JSONIOUtils.load_from_file(snapshot.file_path)
+    data['library'][0][0] = [CSFSliderTagType.GENDER.name, '__class__']
+    _JSONIOUtils.write_to_file(snapshot.file_path, data)
+    assert snapshot.load(FINGERPRINT, sliders) is None
+
+
+def test_missing_snapshot_is_not_loaded_or_deleted(snapshot: CSFSliderIndexSnapshot):
+    assert snapshot.load(FINGERPRINT, _create_sliders()) is None
+    assert not snapshot.delete()
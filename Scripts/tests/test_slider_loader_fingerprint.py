@@ -0,0 +1,93 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import enum
+from typing import Any, Tuple
+
+import pytest
+
+from cncustomsliderframework.sliders.slider_loaders.base_slider_loader import CSFBaseSliderLoader
+
+
+class _Gender(enum.IntEnum):
+    MALE = 1
+    FEMALE = 2
+
+
+class _LocalizedString:
+    def __init__(self, string_hash: int) -> None:
+        self.hash = string_hash
+
+
+class _ResourceKey:
+    def __init__(self, resource_type: int, group: int, instance: int) -> None:
+        self.type = resource_type
+        self.group = group
+        self.instance = instance
+
+
+class _Snippet:
+    def __init__(self, guid64: int, tuning_values: Tuple[Any, ...]) -> None:
+        self.guid64 = guid64
+        self.tuning_values = tuning_values
+
+
+class _SliderLoader(CSFBaseSliderLoader):
+    def _get_tuning_values(self, package_slider: _Snippet) -> Tuple[Any]:
+        return package_slider.tuning_values
+
+
+def _create_tuning_values(genders=(_Gender.MALE, _Gender.FEMALE), tags=('nose', 'chin'), minimum_value: float=-100.0, display_name_hash: int=0x1234) -> Tuple[Any, ...]:
+    # Collections and objects are created anew each time, so equal snippets share no objects.
+    return (
+        (
+            ('available_for_genders', frozenset(genders)),
+            ('slider_display_name', _LocalizedString(display_name_hash)),
+            ('slider_icon', _ResourceKey(0x2f7d0004, 0, 0xabcdef)),
+            ('slider_minimum_value', minimum_value),
+            ('slider_positive_modifier_id', 42),
+            ('slider_raw_display_name', 'Nose Width'),
+            ('slider_description', None),
+            ('tags', set(tags)),
+            ('use_sim_details', True),
+        ),
+    )
+
+
+def _get_fingerprint(tuning_values: Tuple[Any, ...]) -> str:
+    return _SliderLoader()._get_snippet_fingerprint(_Snippet(1, tuning_values))
+
+
+def test_equal_snippets_have_equal_fingerprints():
+    fingerprint = _get_fingerprint(_create_tuning_values())
+    assert _get_fingerprint(_create_tuning_values(genders=(_Gender.FEMALE, _Gender.MALE), tags=('chin', 'nose'))) == fingerprint
+    assert fingerprint.startswith('1:')
+
+
+def test_changed_snippets_have_different_fingerprints():
+    fingerprint = _get_fingerprint(_create_tuning_values())
+    assert _get_fingerprint(_create_tuning_values(genders=(_Gender.MALE,))) != fingerprint
+    assert _get_fingerprint(_create_tuning_values(tags=('nose',))) != fingerprint
+    assert _get_fingerprint(_create_tuning_values(minimum_value=-99.5)) != fingerprint
+    assert _get_fingerprint(_create_tuning_values(display_name_hash=0x4321)) != fingerprint
+
+
+def test_values_of_different_types_have_different_fingerprint_text():
+    loader = _SliderLoader()
+    texts = [loader._to_fingerprint_text(value) for value in (None, True, 1, 1.0, '1', (1,), frozenset((1,)), _LocalizedString(1), _ResourceKey(1, 1, 1))]
+    assert len(set(texts)) == len(texts)
+    assert loader._to_fingerprint_text(('a,b',)) != loader._to_fingerprint_text(('a', 'b'))
+
+
+def test_unsupported_tuning_values_have_no_fingerprint():
+    loader = _SliderLoader()
+    with pytest.raises(TypeError):
+        loader._to_fingerprint_text(object())
+    loader._snippet_fingerprints = list()
+    loader._add_snippet_fingerprint(_Snippet(1, (object(),)))
+    assert loader.snippet_fingerprints is None
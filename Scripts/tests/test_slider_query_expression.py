@@ -0,0 +1,139 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import random
+from typing import Any, Set, Tuple
+
+import pytest
+
+from cncustomsliderframework.enums.query_type import CSFQueryType
+from cncustomsliderframework.sliders.query.slider_query_expression import CSFSliderAndExpression, CSFSliderConstantExpression, CSFSliderOrExpression, CSFSliderQueryExpression, CSFSliderTagExpression
+from cncustomsliderframework.sliders.query.slider_query_plan import CSFSliderQueryPlan
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.slider_query_tag import CSFSliderQueryTag
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from fake_sliders import FakeSlider, create_fake_library, get_all_tag_keys
+from test_slider_query_plan import MISSING_KEY, _create_query, _random_keys
+from test_slider_query_registry import _create_registry, _finish_collection, _start_collection
+
+
+def _tag(tag_key: Tuple[CSFSliderTagType, Any]) -> CSFSliderTagExpression:
+    return CSFSliderTagExpression(CSFSliderQueryTag(*tag_key))
+
+
+def _random_expression(generator: random.Random, tag_keys, depth: int=3) -> Tuple[CSFSliderQueryExpression, Any]:
+    # Creates an expression together with a function locating the same Sliders one Slider at a time.
+    if depth == 0 or generator.random() < 0.3:
+        tag_key = generator.choice(tag_keys)
+        return _tag(tag_key), lambda slider: tag_key in slider.tag_keys
+    kind = generator.choice(('and', 'or', 'not'))
+    if kind == 'not':
+        (operand, matches) = _random_expression(generator, tag_keys, depth - 1)
+        return ~operand, lambda slider: not matches(slider)
+    operands = [_random_expression(generator, tag_keys, depth - 1) for _ in range(generator.randint(1, 3))]
+    if kind == 'and':
+        return CSFSliderAndExpression(*[operand for (operand, _) in operands]), lambda slider: all(matches(slider) for (_, matches) in operands)
+    return CSFSliderOrExpression(*[operand for (operand, _) in operands]), lambda slider: any(matches(slider) for (_, matches) in operands)
+
+
+def test_from_query_matches_the_query_plan_for_every_query_type():
+    sliders = create_fake_library()
+    index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    tag_keys = sorted(get_all_tag_keys(sliders), key=str)
+    generator = random.Random(5)
+    for query_type in CSFQueryType:
+        for _ in range(200):
+            all_keys = _random_keys(generator, tag_keys, 3)
+            any_keys = _random_keys(generator, tag_keys, 3)
+            exclude_keys = _random_keys(generator, tag_keys, 2)
+            query = _create_query(all_keys, any_keys, exclude_keys, query_type)
+            expression = CSFSliderQueryExpression.from_query(query)
+            assert expression.evaluate(index) == CSFSliderQueryPlan.create(query, index).execute(index), expression
+
+
+def test_evaluate_matches_brute_force():
+    sliders = create_fake_library()
+    index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    tag_keys = sorted(get_all_tag_keys(sliders), key=str) + [MISSING_KEY]
+    generator = random.Random(6)
+    for _ in range(300):
+        (expression, matches) = _random_expression(generator, tag_keys)
+        expected = set([slider for slider in sliders if matches(slider)])
+        assert set(index.to_sliders(expression.evaluate(index))) == expected, expression
+
+
+def test_missing_tags_are_folded_into_constants():
+    sliders = create_fake_library()
+    index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    tag_a = _tag((CSFSliderTagType.CUSTOM_TAG, 'a'))
+    missing = _tag(MISSING_KEY)
+    assert missing.fold(index) == CSFSliderConstantExpression(False)
+    assert (tag_a & missing).fold(index) == CSFSliderConstantExpression(False)
+    assert (tag_a | missing).fold(index) == tag_a
+    assert (~missing).fold(index) == CSFSliderConstantExpression(True)
+    assert (tag_a & ~missing).fold(index) == tag_a
+    assert (~~tag_a).fold(index) == tag_a
+
+
+def test_equal_sub_expressions_are_evaluated_once():
+    sliders = create_fake_library()
+    index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    (a, b, c, d) = [_tag((CSFSliderTagType.CUSTOM_TAG, value)) for value in ('a', 'b', 'c', 'd')]
+    # Operands are normalized, so the order they are written in does not matter.
+    assert (a | b) == (b | a)
+    assert (a & (b & c)) == ((c & a) & b)
+    evaluated_keys = list()
+    get_bitmap = index.get_bitmap
+
+    def _get_bitmap(tag_key: Tuple[CSFSliderTagType, Any]) -> int:
+        evaluated_keys.append(tag_key)
+        return get_bitmap(tag_key)
+
+    index.get_bitmap = _get_bitmap
+    expression = ((a | b) & c) | ((b | a) & d) | ((a | b) & ~c)
+    found_bitmap = expression.evaluate(index)
+    index.get_bitmap = get_bitmap
+    assert sorted(evaluated_keys, key=str) == sorted([tag.tag.key for tag in (a, b, c, d)], key=str)
+    # Every Slider has either c or not c, so all Sliders with a or b are located.
+    assert found_bitmap == get_bitmap(a.tag.key) | get_bitmap(b.tag.key)
+
+
+@pytest.mark.parametrize('expression, is_limited_to_tags', (
+    (_tag((CSFSliderTagType.CUSTOM_TAG, 'a')), True),
+    (~_tag((CSFSliderTagType.CUSTOM_TAG, 'a')), False),
+    (_tag((CSFSliderTagType.CUSTOM_TAG, 'a')) & ~_tag((CSFSliderTagType.CUSTOM_TAG, 'b')), True),
+    (_tag((CSFSliderTagType.CUSTOM_TAG, 'a')) | ~_tag((CSFSliderTagType.CUSTOM_TAG, 'b')), False),
+    (CSFSliderConstantExpression(True), False),
+))
+def test_is_limited_to_tags(expression: CSFSliderQueryExpression, is_limited_to_tags: bool):
+    assert expression.is_limited_to_tags == is_limited_to_tags
+
+
+def _identifiers(sliders) -> Set[str]:
+    return set([slider.unique_identifier for slider in sliders])
+
+
+def test_registry_caches_expressions_until_sliders_with_their_tags_change():
+    sliders = create_fake_library(number_of_sliders=30)
+    registry = _create_registry(sliders)
+    _finish_collection(_start_collection(registry))
+    limited = _tag((CSFSliderTagType.CUSTOM_TAG, 'a')) & ~_tag((CSFSliderTagType.CUSTOM_TAG, 'b'))
+    negated = ~_tag((CSFSliderTagType.CUSTOM_TAG, 'a'))
+    expected_limited = _identifiers([slider for slider in sliders if (CSFSliderTagType.CUSTOM_TAG, 'a') in slider.tag_keys and (CSFSliderTagType.CUSTOM_TAG, 'b') not in slider.tag_keys])
+    assert _identifiers(registry.get_sliders_by_expression(limited)) == expected_limited
+    assert registry.count_sliders_by_expression(limited) == len(expected_limited)
+    assert _identifiers(registry.get_sliders_by_expression(negated)) == _identifiers([slider for slider in sliders if (CSFSliderTagType.CUSTOM_TAG, 'a') not in slider.tag_keys])
+    assert registry.query_cache.peek(registry.generation, limited) is not None
+    # A Slider without any of the tags of the limited expression only changes the negated expression.
+    registry.add_slider(FakeSlider('added', 'Added', tag_keys=((CSFSliderTagType.ALL, 'all'), (CSFSliderTagType.CUSTOM_TAG, 'c'))))
+    assert registry.query_cache.peek(registry.generation, limited) is not None
+    assert registry.query_cache.peek(registry.generation, negated) is None
+    assert 'added' in _identifiers(registry.get_sliders_by_expression(negated))
+    registry.add_slider(FakeSlider('added_a', 'Added A', tag_keys=((CSFSliderTagType.ALL, 'all'), (CSFSliderTagType.CUSTOM_TAG, 'a'))))
+    assert registry.query_cache.peek(registry.generation, limited) is None
+    assert _identifiers(registry.get_sliders_by_expression(limited)) == expected_limited | {'added_a'}
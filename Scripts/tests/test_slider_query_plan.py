@@ -0,0 +1,137 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import random
+from typing import Any, Tuple
+
+from cncustomsliderframework.enums.query_type import CSFQueryType
+from cncustomsliderframework.sliders.query.slider_query import CSFSliderQuery
+from cncustomsliderframework.sliders.query.slider_query_plan import CSFSliderQueryPlan
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.slider_query_tag import CSFSliderQueryTag
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from cncustomsliderframework.sliders.tag_filters.slider_tag_filter import CSFSliderTagFilter
+from fake_sliders import create_fake_library, get_all_tag_keys
+
+MISSING_KEY = (CSFSliderTagType.CUSTOM_TAG, 'missing')
+MUST_HAVE_ONE_QUERY_TYPES = (CSFQueryType.ALL_PLUS_ANY_MUST_HAVE_ONE, CSFQueryType.ALL_INTERSECT_ANY_MUST_HAVE_ONE)
+PLUS_QUERY_TYPES = (CSFQueryType.ALL_PLUS_ANY, CSFQueryType.ALL_PLUS_ANY_MUST_HAVE_ONE)
+INTERSECT_QUERY_TYPES = (CSFQueryType.ALL_INTERSECT_ANY, CSFQueryType.ALL_INTERSECT_ANY_MUST_HAVE_ONE)
+
+
+class _TagKeysFilter(CSFSliderTagFilter):
+    def __init__(self, tag_keys: Tuple[Tuple[CSFSliderTagType, Any], ...], match_all_tags: bool, exclude_tags: bool=False) -> None:
+        super().__init__(match_all_tags, exclude_tags=exclude_tags)
+        self._tag_keys = tag_keys
+
+    def get_tags(self) -> Tuple[CSFSliderQueryTag]:
+        return tuple([CSFSliderQueryTag(tag_type, value) for (tag_type, value) in self._tag_keys])
+
+
+def _create_query(all_keys, any_keys, exclude_keys, query_type: CSFQueryType) -> CSFSliderQuery:
+    return CSFSliderQuery(
+        (
+            _TagKeysFilter(tuple(all_keys), True),
+            _TagKeysFilter(tuple(any_keys), False),
+            _TagKeysFilter(tuple(exclude_keys), True, exclude_tags=True)
+        ),
+        query_type=query_type
+    )
+
+
+def _brute_force(sliders, all_keys, any_keys, exclude_keys, query_type: CSFQueryType):
+    library_keys = get_all_tag_keys(sliders)
+    matches_any = set([slider for slider in sliders if any(tag_key in slider.tag_keys for tag_key in any_keys)])
+    if not all_keys:
+        # A query with only Include Any tags ignores its Exclude tags.
+        return matches_any
+    if not all(tag_key in library_keys for tag_key in all_keys):
+        # No Slider has every Include All tag, so nothing is located, even through the Include Any tags.
+        return set()
+    if not any_keys and query_type in INTERSECT_QUERY_TYPES:
+        # Without Include Any tags there is nothing to intersect with, so only the Include All tags are matched.
+        query_type = CSFQueryType.ALL_PLUS_ANY
+    if query_type in MUST_HAVE_ONE_QUERY_TYPES and not any(tag_key in library_keys for tag_key in any_keys):
+        return set()
+    matches_all = set([slider for slider in sliders if all(tag_key in slider.tag_keys for tag_key in all_keys)])
+    if query_type in PLUS_QUERY_TYPES:
+        found = matches_all | matches_any
+    else:
+        found = matches_all & matches_any
+    return set([slider for slider in found if not any(tag_key in slider.tag_keys for tag_key in exclude_keys)])
+
+
+def _random_keys(generator: random.Random, tag_keys, maximum: int):
+    keys = generator.sample(tag_keys, generator.randint(0, maximum))
+    if generator.random() < 0.1:
+        keys.append(MISSING_KEY)
+    return keys
+
+
+def test_execute_matches_brute_force():
+    sliders = create_fake_library()
+    index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    tag_keys = sorted(get_all_tag_keys(sliders), key=str)
+    generator = random.Random(3)
+    for _ in range(500):
+        all_keys = _random_keys(generator, tag_keys, 3)
+        any_keys = _random_keys(generator, tag_keys, 3)
+        exclude_keys = _random_keys(generator, tag_keys, 2)
+        query_type = generator.choice(tuple(CSFQueryType))
+        plan = CSFSliderQueryPlan.create(_create_query(all_keys, any_keys, exclude_keys, query_type), index)
+        expected = _brute_force(sliders, all_keys, any_keys, exclude_keys, query_type)
+        assert set(index.to_sliders(plan.execute(index))) == expected, plan.explain(index)
+
+
+def test_execute_bound_matches_brute_force():
+    sliders = create_fake_library()
+    index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    tag_keys = sorted(get_all_tag_keys(sliders), key=str)
+    bound_keys = [tag_key for tag_key in tag_keys if tag_key[0] == CSFSliderTagType.AGE] + [MISSING_KEY]
+    generator = random.Random(4)
+    for _ in range(200):
+        all_keys = _random_keys(generator, tag_keys, 2)
+        any_keys = _random_keys(generator, tag_keys, 2)
+        exclude_keys = _random_keys(generator, tag_keys, 2)
+        query_type = generator.choice(tuple(CSFQueryType))
+        plan = CSFSliderQueryPlan.create(_create_query(all_keys, any_keys, exclude_keys, query_type), index, has_bound_key=True)
+        bitmaps = plan.execute_bound(index, bound_keys)
+        assert set(bitmaps.keys()) == set(bound_keys)
+        for bound_key in bound_keys:
+            expected = _brute_force(sliders, (*all_keys, bound_key), any_keys, exclude_keys, query_type)
+            assert set(index.to_sliders(bitmaps[bound_key])) == expected, plan.explain(index)
+
+
+def test_keys_are_ordered_by_count():
+    sliders = create_fake_library()
+    index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    tag_keys = sorted(get_all_tag_keys(sliders), key=str)
+    plan = CSFSliderQueryPlan.create(_create_query(tag_keys[:6], (), tag_keys[6:12], CSFQueryType.ALL_PLUS_ANY), index)
+    all_counts = [index.get_count(tag_key) for tag_key in plan.include_all_keys]
+    exclude_counts = [index.get_count(tag_key) for tag_key in plan.exclude_keys]
+    assert set(plan.include_all_keys) == set(tag_keys[:6])
+    assert all_counts == sorted(all_counts)
+    assert exclude_counts == sorted(exclude_counts, reverse=True)
+
+
+def test_plan_with_a_missing_include_all_key_is_empty():
+    sliders = create_fake_library()
+    index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    plan = CSFSliderQueryPlan.create(_create_query(((CSFSliderTagType.ALL, 'all'), MISSING_KEY), (), (), CSFQueryType.ALL_PLUS_ANY), index)
+    assert plan.is_empty
+    assert plan.execute(index) == 0
+    assert plan.execute_bound(index, ((CSFSliderTagType.AGE, 'teen'),)) == {(CSFSliderTagType.AGE, 'teen'): 0}
+
+
+def test_plan_with_only_include_any_keys():
+    sliders = create_fake_library()
+    index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    plan = CSFSliderQueryPlan.create(_create_query((), ((CSFSliderTagType.CUSTOM_TAG, 'a'), MISSING_KEY), ((CSFSliderTagType.CUSTOM_TAG, 'b'),), CSFQueryType.ALL_INTERSECT_ANY), index)
+    assert plan.is_any_only
+    assert plan.include_any_keys == ((CSFSliderTagType.CUSTOM_TAG, 'a'),)
+    assert plan.execute(index) == index.get_bitmap((CSFSliderTagType.CUSTOM_TAG, 'a'))
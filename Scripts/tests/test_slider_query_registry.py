@@ -0,0 +1,123 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, Dict, Tuple
+
+from cncustomsliderframework.sliders.query.tag_handlers.slider_tag_handler import CSFSliderTagHandler
+from cncustomsliderframework.sliders.slider_query_registry import CSFSliderQueryRegistry
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from fake_sliders import FakeSlider, create_fake_library
+
+
+class _FakeTagHandler(CSFSliderTagHandler):
+    def get_tags(self, slider: FakeSlider) -> Tuple[Any]:
+        return tuple([value for (tag_type, value) in slider.tag_keys if tag_type == self.tag_type])
+
+    def applies(self, slider: FakeSlider) -> bool:
+        return True
+
+
+class _FakeSliderRegistry:
+    def __init__(self, sliders) -> None:
+        self.sliders: Dict[str, FakeSlider] = {slider.unique_identifier: slider for slider in sliders}
+        self.fingerprint = None
+
+
+def _create_registry(sliders) -> CSFSliderQueryRegistry:
+    # A new instance, rather than the shared service, with tag handlers reading the tag keys of the fake sliders.
+    registry = object.__new__(CSFSliderQueryRegistry)
+    registry.__init__()
+    registry._registry = _FakeSliderRegistry(sliders)
+    for tag_type in (CSFSliderTagType.ALL, CSFSliderTagType.GENDER, CSFSliderTagType.AGE, CSFSliderTagType.CATEGORY, CSFSliderTagType.CUSTOM_TAG):
+        registry.add_tag_handler(_FakeTagHandler, tag_type)
+    return registry
+
+
+def _start_collection(registry: CSFSliderQueryRegistry):
+    # Collects the way the time sliced collection does, the steps are only run when the test advances them.
+    registry._collecting = True
+    collection_steps = registry._collect_in_steps()
+    next(collection_steps)
+    return collection_steps
+
+
+def _finish_collection(collection_steps) -> None:
+    for _ in collection_steps:
+        pass
+
+
+def _all_identifiers(registry: CSFSliderQueryRegistry):
+    return set([slider.unique_identifier for slider in registry.index.to_sliders(registry.index.get_bitmap((CSFSliderTagType.ALL, 'all')))])
+
+
+def test_changes_during_the_first_collection_are_applied_once_it_completes():
+    sliders = create_fake_library(number_of_sliders=20)
+    registry = _create_registry(sliders)
+    collection_steps = _start_collection(registry)
+    added = FakeSlider('added', 'Added', tag_keys=((CSFSliderTagType.ALL, 'all'), (CSFSliderTagType.CUSTOM_TAG, 'added')))
+    updated = FakeSlider(sliders[1].unique_identifier, 'Updated', tag_keys=((CSFSliderTagType.ALL, 'all'), (CSFSliderTagType.CUSTOM_TAG, 'updated')))
+    # The collection has already read the sliders, so none of these changes are within what it collected.
+    assert not registry.add_slider(added)
+    assert not registry.remove_slider(sliders[0].unique_identifier)
+    assert not registry.update_slider(updated)
+    _finish_collection(collection_steps)
+    assert not registry._collecting
+    assert _all_identifiers(registry) == set([slider.unique_identifier for slider in sliders[1:]]) | {'added'}
+    assert registry.index.to_sliders(registry.index.get_bitmap((CSFSliderTagType.CUSTOM_TAG, 'updated'))) == (updated,)
+    assert added in registry.get_all_sliders()
+    assert sliders[0] not in registry.get_all_sliders()
+
+
+def test_changes_during_a_recollection_are_served_by_the_previous_index_and_replayed_on_the_new_one():
+    sliders = create_fake_library(number_of_sliders=20)
+    registry = _create_registry(sliders)
+    _finish_collection(_start_collection(registry))
+    previous_index = registry.index
+    collection_steps = _start_collection(registry)
+    added = FakeSlider('added', 'Added', tag_keys=((CSFSliderTagType.ALL, 'all'), (CSFSliderTagType.CUSTOM_TAG, 'added')))
+    updated = FakeSlider(sliders[1].unique_identifier, 'Updated', tag_keys=((CSFSliderTagType.ALL, 'all'), (CSFSliderTagType.CUSTOM_TAG, 'updated')))
+    assert registry.add_slider(added)
+    assert registry.remove_slider(sliders[0].unique_identifier)
+    assert registry.update_slider(updated)
+    # Until the collection completes, the previous index keeps serving reads, with the changes applied to it.
+    assert registry.index is previous_index
+    assert _all_identifiers(registry) == set([slider.unique_identifier for slider in sliders[1:]]) | {'added'}
+    assert len(registry._pending_changes) == 3
+    _finish_collection(collection_steps)
+    assert registry.index is not previous_index
+    assert registry._pending_changes == []
+    assert _all_identifiers(registry) == set([slider.unique_identifier for slider in sliders[1:]]) | {'added'}
+    assert registry.index.to_sliders(registry.index.get_bitmap((CSFSliderTagType.CUSTOM_TAG, 'added'))) == (added,)
+    assert registry.index.to_sliders(registry.index.get_bitmap((CSFSliderTagType.CUSTOM_TAG, 'updated'))) == (updated,)
+    assert sliders[1] not in registry.get_all_sliders()
+    assert updated in registry.get_all_sliders()
+
+
+def test_changes_to_the_same_slider_are_replayed_in_order():
+    sliders = create_fake_library(number_of_sliders=20)
+    registry = _create_registry(sliders)
+    collection_steps = _start_collection(registry)
+    added = FakeSlider('added', 'Added', tag_keys=((CSFSliderTagType.ALL, 'all'), (CSFSliderTagType.CUSTOM_TAG, 'added')))
+    updated = FakeSlider('added', 'Updated', tag_keys=((CSFSliderTagType.ALL, 'all'), (CSFSliderTagType.CUSTOM_TAG, 'updated')))
+    registry.add_slider(added)
+    registry.update_slider(updated)
+    registry.remove_slider(sliders[2].unique_identifier)
+    registry.add_slider(sliders[2])
+    _finish_collection(collection_steps)
+    assert _all_identifiers(registry) == set([slider.unique_identifier for slider in sliders]) | {'added'}
+    assert registry.index.get_bitmap((CSFSliderTagType.CUSTOM_TAG, 'added')) == 0
+    assert registry.index.to_sliders(registry.index.get_bitmap((CSFSliderTagType.CUSTOM_TAG, 'updated'))) == (updated,)
+
+
+def test_changes_after_a_collection_are_not_queued():
+    sliders = create_fake_library(number_of_sliders=20)
+    registry = _create_registry(sliders)
+    _finish_collection(_start_collection(registry))
+    assert registry.remove_slider(sliders[0].unique_identifier)
+    assert registry._pending_changes == []
+    assert sliders[0].unique_identifier not in _all_identifiers(registry)
@@ -0,0 +1,139 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import random
+import re
+
+from cncustomsliderframework.sliders.query.slider_search_index import CSFSliderSearchIndex
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from fake_sliders import FakeSlider
+
+NAMES = (
+    'Nose Width', 'Wide Nose', 'Nose Tip Height', 'Nostril Size', 'Jaw Width', 'Jaw Angle', 'Eye Size', 'Eye Corner Height',
+    'Ear Point', 'Ear Size', 'Mouth Corners', 'Lip Fullness', 'Chin Length', 'Cheek Volume', 'Brow Ridge', 'Neck Length',
+    'Shoulder Width', 'Waist Size', 'Hip Width', 'Thigh Size'
+)
+AUTHORS = ('colonolnutty', 'sculptor', 'morpher')
+TAGS = ('face', 'body', 'detail', 'symmetry')
+
+
+def _create_sliders():
+    generator = random.Random(5)
+    sliders = list()
+    for (number, name) in enumerate(NAMES):
+        tags = tuple(generator.sample(TAGS, generator.randint(0, 2)))
+        sliders.append(FakeSlider('slider_{}'.format(number), name, author=AUTHORS[number % len(AUTHORS)], tags=tags, tag_keys=((CSFSliderTagType.ALL, 'all'),)))
+    return sliders
+
+
+def _build(sliders) -> CSFSliderSearchIndex:
+    return CSFSliderSearchIndex(CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders]))
+
+
+def _words(text: str):
+    return [word for word in re.split('[^0-9a-z]+', text.lower()) if word]
+
+
+def _brute_force_prefix_matches(sliders, text: str):
+    # A Slider matches by prefix when the text starts at the start of a word of its name, author or one of its tags.
+    matches = set()
+    for slider in sliders:
+        for term in (slider.raw_display_name, slider.author, *slider.tags):
+            term = term.lower()
+            word_starts = [0] + [match.end() for match in re.finditer('[^0-9a-z]+', term)]
+            if any(term[word_start:].startswith(text) for word_start in word_starts):
+                matches.add(slider)
+    return matches
+
+
+def test_prefix_matches_rank_before_fuzzy_matches():
+    sliders = _create_sliders()
+    search_index = _build(sliders)
+    texts = set()
+    for slider in sliders:
+        for word in _words(slider.raw_display_name) + _words(slider.author) + [tag for tag in slider.tags]:
+            texts.update([word[:length] for length in range(1, len(word) + 1)])
+    for text in sorted(texts):
+        expected = _brute_force_prefix_matches(sliders, text)
+        located = search_index.search(text, limit=len(sliders))
+        assert set(located[:len(expected)]) == expected, text
+
+
+def test_exact_name_ranks_first():
+    sliders = _create_sliders()
+    search_index = _build(sliders)
+    for slider in sliders:
+        assert search_index.search(slider.raw_display_name, limit=1) == (slider,)
+
+
+def test_name_matches_rank_before_author_and_tag_matches():
+    sliders = [
+        FakeSlider('by_author', 'Jaw Width', author='nose sculptor'),
+        FakeSlider('by_name', 'Nose Width', author='someone'),
+    ]
+    search_index = _build(sliders)
+    assert search_index.search('nose') == (sliders[1], sliders[0])
+
+
+def test_swapped_characters_match_by_prefix():
+    sliders = _create_sliders()
+    search_index = _build(sliders)
+    located = search_index.search('nsoe', limit=3)
+    assert set(located) == set([slider for slider in sliders if slider.raw_display_name in ('Nose Width', 'Wide Nose', 'Nose Tip Height')])
+
+
+def test_one_changed_character_matches_by_trigrams():
+    sliders = _create_sliders()
+    search_index = _build(sliders)
+    generator = random.Random(6)
+    for slider in sliders:
+        word = max(_words(slider.raw_display_name), key=len)
+        position = generator.randrange(len(word))
+        substituted = word[:position] + ('x' if word[position] != 'x' else 'y') + word[position + 1:]
+        deleted = word[:position] + word[position + 1:]
+        inserted = word[:position] + 'x' + word[position:]
+        for text in (substituted, deleted, inserted):
+            assert slider in search_index.search(text, limit=len(sliders)), text
+
+
+def test_unrelated_text_matches_nothing():
+    search_index = _build(_create_sliders())
+    assert search_index.search('qqqzzz') == tuple()
+    assert search_index.search('   ') == tuple()
+    assert search_index.search('nose', limit=0) == tuple()
+
+
+def test_search_is_limited_to_available_sliders():
+    sliders = _create_sliders()
+    search_index = _build(sliders)
+    available_bitmap = CSFSliderTagIndex.to_bitmap(range(0, len(sliders), 2))
+    located = search_index.search('nose', limit=len(sliders), available_bitmap=available_bitmap)
+    assert located
+    assert all(sliders.index(slider) % 2 == 0 for slider in located)
+    assert search_index.search('nose', available_bitmap=0) == tuple()
+
+
+def test_search_respects_the_limit():
+    search_index = _build(_create_sliders())
+    assert len(search_index.search('e', limit=3)) == 3
+
+
+def test_removed_sliders_are_not_searched():
+    sliders = _create_sliders()
+    tag_index = CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+    tag_index.remove_slider(sliders[0].unique_identifier)
+    located = CSFSliderSearchIndex(tag_index).search('nose', limit=len(sliders))
+    assert sliders[0] not in located
+    assert sliders[1] in located
+
+
+def test_trigrams_are_split_by_word():
+    assert set(CSFSliderSearchIndex.get_trigrams('nose')) == {'  n', ' no', 'nos', 'ose', 'se '}
+    assert set(CSFSliderSearchIndex.get_trigrams('ab cd')) == {'  a', ' ab', 'ab ', '  c', ' cd', 'cd '}
+    assert CSFSliderSearchIndex.get_trigrams('') == tuple()
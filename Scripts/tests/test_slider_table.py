@@ -0,0 +1,148 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import random
+import types
+from typing import Tuple
+
+import pytest
+
+from cncustomsliderframework.dtos.sims.sim_details import CSFSimDetails
+from cncustomsliderframework.enums.modifier_types import CSFModifierType
+from cncustomsliderframework.enums.slider_category import CSFSliderCategory
+from cncustomsliderframework.sliders.query.slider_table import CSFSliderTable
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.slider_availability import CSFSliderAvailability
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from sims4communitylib.enums.enumtypes.common_int import CommonInt
+
+_Gender = CommonInt('_Gender', [('MALE', 1), ('FEMALE', 2)])
+_Age = CommonInt('_Age', [('CHILD', 1), ('TEEN', 2), ('ADULT', 3), ('ELDER', 4)])
+_Species = CommonInt('_Species', [('HUMAN', 1), ('DOG', 2), ('CAT', 3)])
+_OccultType = CommonInt('_OccultType', [('HUMAN', 1), ('VAMPIRE', 2), ('ALIEN', 3)])
+# More sim types than fit within 64 bits together with the other sections.
+_SimType = CommonInt('_SimType', [('SIM_TYPE_{}'.format(number), number) for number in range(1, 71)])
+_UnknownGender = CommonInt('_UnknownGender', [('OTHER', 99)])
+
+
+class _FakeSlider:
+    def __init__(self, unique_identifier: str, generator: random.Random) -> None:
+        self.unique_identifier = unique_identifier
+        self.available_for = types.SimpleNamespace(
+            genders=tuple(generator.sample(tuple(_Gender), generator.randint(0, 1))),
+            ages=tuple(generator.sample(tuple(_Age), generator.randint(0, 3))),
+            species=tuple(generator.sample(tuple(_Species), generator.randint(0, 2))),
+            occult_types=tuple(generator.sample(tuple(_OccultType), generator.randint(0, 1)))
+        )
+        self.available_for_sim_types = tuple(generator.sample(tuple(_SimType), generator.choice((0, 0, 1, 30))))
+        self.categories = tuple(generator.sample(tuple(CSFSliderCategory), generator.randint(1, 2)))
+        self.modifier_type = generator.choice(tuple(CSFModifierType))
+        self.minimum_value = generator.choice((-100.0, 0.0))
+        self.maximum_value = generator.choice((50.0, 100.0))
+        self.positive_modifier_id = generator.choice((0, generator.randint(1, 20)))
+        self.negative_modifier_id = generator.choice((0, generator.randint(1, 20), 2 ** 64 - 1))
+        self.availability_mask = CSFSliderAvailability.get_slider_mask(self.available_for, self.available_for_sim_types)
+
+    def is_available_for(self, sim_info: CSFSimDetails, sim_signature: int=None) -> bool:
+        for (values, value) in (
+            (self.available_for.genders, sim_info.gender),
+            (self.available_for.ages, sim_info.age),
+            (self.available_for.species, sim_info.species),
+            (self.available_for.occult_types, sim_info.occult_type),
+            (self.available_for_sim_types, sim_info.sim_type),
+        ):
+            if values and value not in values:
+                return False
+        return True
+
+    def get_modifier_ids(self) -> Tuple[int, ...]:
+        return tuple([modifier_id for modifier_id in (self.positive_modifier_id, self.negative_modifier_id) if modifier_id != 0])
+
+    def __repr__(self) -> str:
+        return self.unique_identifier
+
+
+@pytest.fixture(autouse=True)
+def _availability_layout(monkeypatch):
+    # Game enums are placeholders while testing, so availability is laid out over stand in enums.
+    monkeypatch.setattr(CSFSliderAvailability, '_SECTIONS', (('genders', _Gender), ('ages', _Age), ('species', _Species), ('occult_types', _OccultType), ('sim_types', _SimType)))
+    monkeypatch.setattr(CSFSliderAvailability, '_BIT_BY_VALUE', None)
+    monkeypatch.setattr(CSFSliderAvailability, '_SECTION_MASKS', None)
+    # noinspection PyProtectedMember
+    monkeypatch.setattr(CSFSliderAvailability, 'get_sim_signature', lambda self, sim_info: self._compute_sim_signature(sim_info))
+
+
+def _create_table(number_of_sliders: int=150, seed: int=1) -> Tuple[CSFSliderTable, Tuple[_FakeSlider, ...]]:
+    generator = random.Random(seed)
+    sliders = [_FakeSlider('slider_{}'.format(number), generator) for number in range(number_of_sliders)]
+    # A Slider with an availability value that has no bit is checked one Sim at a time.
+    sliders[3].available_for = types.SimpleNamespace(genders=(_UnknownGender.OTHER, _Gender.MALE), ages=(_Age.ADULT,), species=(), occult_types=())
+    sliders[3].available_for_sim_types = ()
+    sliders[3].availability_mask = CSFSliderAvailability.get_slider_mask(sliders[3].available_for, sliders[3].available_for_sim_types)
+    assert sliders[3].availability_mask is None
+    index = CSFSliderTagIndex.build([(slider, ((CSFSliderTagType.ALL, 'all'),)) for slider in sliders])
+    # Removed Sliders leave empty rows behind.
+    index.remove_slider(sliders[5].unique_identifier)
+    return CSFSliderTable(index), tuple([slider for slider in sliders if slider is not sliders[5]])
+
+
+def _create_sims(seed: int=2):
+    generator = random.Random(seed)
+    for _ in range(60):
+        yield CSFSimDetails(generator.choice(tuple(_Gender)), generator.choice(tuple(_Age)), generator.choice(tuple(_Species)), generator.choice(tuple(_OccultType)), generator.choice(tuple(_SimType)))
+
+
+def _brute_force(sliders, predicate) -> set:
+    return set([slider for slider in sliders if predicate(slider)])
+
+
+def test_masks_wider_than_64_bits_are_stored():
+    (slider_table, sliders) = _create_table()
+    assert max(slider_table.get_column(CSFSliderTable.SIM_TYPES)).bit_length() > 64
+    assert slider_table.number_of_rows == len(sliders) + 1
+    assert slider_table.get_value(CSFSliderTable.MODIFIER_TYPES, 5) == -1
+
+
+def test_available_bitmap_matches_brute_force():
+    (slider_table, sliders) = _create_table()
+    number_of_unmasked_matches = 0
+    for sim_info in _create_sims():
+        expected = _brute_force(sliders, lambda slider: slider.is_available_for(sim_info))
+        assert set(slider_table.to_sliders(slider_table.get_available_bitmap(sim_info))) == expected
+        number_of_unmasked_matches += 1 if sliders[3] in expected else 0
+        # The bitmap of a signature is kept, so asking again gives the same answer.
+        assert set(slider_table.to_sliders(slider_table.get_available_bitmap(sim_info))) == expected
+    assert number_of_unmasked_matches > 0
+
+
+def test_available_bitmap_without_signature_checks_each_slider():
+    (slider_table, sliders) = _create_table()
+    sim_info = CSFSimDetails(_UnknownGender.OTHER, _Age.ADULT, _Species.HUMAN, _OccultType.HUMAN, _SimType.SIM_TYPE_1)
+    expected = _brute_force(sliders, lambda slider: slider.is_available_for(sim_info))
+    assert sliders[3] in expected
+    assert set(slider_table.to_sliders(slider_table.get_available_bitmap(sim_info))) == expected
+
+
+def test_category_and_modifier_bitmaps_match_brute_force():
+    (slider_table, sliders) = _create_table()
+    for slider_category in CSFSliderCategory:
+        assert set(slider_table.to_sliders(slider_table.get_bitmap_for_category(slider_category))) == _brute_force(sliders, lambda slider: slider_category in slider.categories)
+    for modifier_type in CSFModifierType:
+        assert set(slider_table.to_sliders(slider_table.get_bitmap_for_modifier_type(modifier_type))) == _brute_force(sliders, lambda slider: slider.modifier_type == modifier_type)
+    for modifier_ids in ((1,), (2, 7, 19), (2 ** 64 - 1,), (0,), ()):
+        expected = _brute_force(sliders, lambda slider: any(modifier_id in slider.get_modifier_ids() for modifier_id in modifier_ids))
+        assert set(slider_table.to_sliders(slider_table.get_bitmap_for_modifiers(modifier_ids))) == expected
+
+
+def test_select_and_iterate_rows():
+    (slider_table, sliders) = _create_table()
+    bitmap = slider_table.select(CSFSliderTable.MINIMUM_VALUES, lambda minimum_value: minimum_value == 0.0)
+    assert set(slider_table.to_sliders(bitmap)) == _brute_force(sliders, lambda slider: slider.minimum_value == 0.0)
+    rows = list(slider_table.iterate_rows(bitmap, CSFSliderTable.MINIMUM_VALUES, CSFSliderTable.MAXIMUM_VALUES, CSFSliderTable.POSITIVE_MODIFIER_IDS))
+    assert rows == [(slider.minimum_value, slider.maximum_value, slider.positive_modifier_id) for slider in slider_table.to_sliders(bitmap)]
+
@@ -0,0 +1,157 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import random
+
+from cncustomsliderframework.sliders.query.slider_tag_index import CSFSliderTagIndex
+from cncustomsliderframework.sliders.slider_tag_type import CSFSliderTagType
+from fake_sliders import FakeSlider, create_fake_library, get_all_tag_keys
+
+
+def _build(sliders) -> CSFSliderTagIndex:
+    return CSFSliderTagIndex.build([(slider, slider.tag_keys) for slider in sliders])
+
+
+def _brute_force(sliders, tag_keys):
+    return set([slider for slider in sliders if all(tag_key in slider.tag_keys for tag_key in tag_keys)])
+
+
+def _assert_matches_brute_force(index: CSFSliderTagIndex, sliders) -> None:
+    for tag_key in get_all_tag_keys(sliders):
+        expected = _brute_force(sliders, (tag_key,))
+        assert set(index.to_sliders(index.get_bitmap(tag_key))) == expected
+        assert index.get_count(tag_key) == len(expected)
+    for tag_key in index.library.keys():
+        assert index.get_bitmap(tag_key) != 0
+
+
+def test_build_organizes_sliders_by_tag_key():
+    sliders = create_fake_library()
+    index = _build(sliders)
+    assert index.number_of_sliders == len(sliders)
+    _assert_matches_brute_force(index, sliders)
+    assert not index.has_key((CSFSliderTagType.CUSTOM_TAG, 'missing'))
+    assert index.get_bitmap((CSFSliderTagType.CUSTOM_TAG, 'missing')) == 0
+
+
+def test_build_skips_duplicate_identifiers():
+    sliders = create_fake_library(number_of_sliders=10)
+    index = _build([*sliders, FakeSlider(sliders[0].unique_identifier, 'Duplicate', tag_keys=((CSFSliderTagType.CUSTOM_TAG, 'duplicate'),))])
+    assert index.number_of_sliders == len(sliders)
+    assert not index.has_key((CSFSliderTagType.CUSTOM_TAG, 'duplicate'))
+
+
+def test_intersect_matches_brute_force():
+    sliders = create_fake_library()
+    index = _build(sliders)
+    all_tag_keys = sorted(get_all_tag_keys(sliders), key=str)
+    generator = random.Random(2)
+    for _ in range(200):
+        tag_keys = generator.sample(all_tag_keys, generator.randint(1, 4))
+        assert set(index.to_sliders(index.intersect(tag_keys))) == _brute_force(sliders, tag_keys)
+
+
+def test_intersect_without_tag_keys_returns_the_starting_bitmap():
+    index = _build(create_fake_library(number_of_sliders=10))
+    assert index.intersect(()) == -1
+    assert index.intersect((), bitmap=0b101) == 0b101
+
+
+def test_intersect_with_a_missing_tag_key_is_empty():
+    sliders = create_fake_library()
+    index = _build(sliders)
+    assert index.intersect(((CSFSliderTagType.ALL, 'all'), (CSFSliderTagType.CUSTOM_TAG, 'missing'))) == 0
+
+
+def test_bitmap_conversions():
+    ordinals = (0, 3, 7, 8, 64, 200)
+    bitmap = CSFSliderTagIndex.to_bitmap(ordinals)
+    assert tuple(CSFSliderTagIndex.iterate_ordinals(bitmap)) == ordinals
+    assert CSFSliderTagIndex.count(bitmap) == len(ordinals)
+    assert CSFSliderTagIndex.get_first_ordinal(bitmap) == 0
+    assert CSFSliderTagIndex.get_first_ordinal(bitmap & ~1) == 3
+    assert CSFSliderTagIndex.to_bitmap(()) == 0
+    assert tuple(CSFSliderTagIndex.iterate_ordinals(0)) == ()
+    assert CSFSliderTagIndex.get_first_ordinal(0) is None
+
+
+def test_sliders_are_returned_in_ordinal_order():
+    sliders = create_fake_library()
+    index = _build(sliders)
+    bitmap = index.get_bitmap((CSFSliderTagType.GENDER, 'male'))
+    located = index.to_sliders(bitmap)
+    assert list(located) == [slider for slider in sliders if slider in located]
+    assert index.get_first_slider(bitmap) is located[0]
+    assert index.get_first_slider(0) is None
+    assert [slider for (_, slider) in index.iterate_sliders()] == sliders
+
+
+def test_add_remove_and_update_match_brute_force():
+    sliders = create_fake_library()
+    index = _build(sliders[:80])
+    current = list(sliders[:80])
+    for slider in sliders[80:]:
+        changed_tag_keys = index.add_slider(slider, slider.tag_keys)
+        assert changed_tag_keys == set(slider.tag_keys)
+        current.append(slider)
+    assert index.add_slider(sliders[0], sliders[0].tag_keys) == set()
+    _assert_matches_brute_force(index, current)
+
+    for slider in sliders[::7]:
+        assert index.remove_slider(slider.unique_identifier) == set(slider.tag_keys)
+        current.remove(slider)
+    assert index.remove_slider('missing') == set()
+    assert index.number_of_sliders == len(current)
+    _assert_matches_brute_force(index, current)
+
+    updated = FakeSlider(sliders[1].unique_identifier, 'Updated', tag_keys=((CSFSliderTagType.ALL, 'all'), (CSFSliderTagType.CUSTOM_TAG, 'updated')))
+    changed_tag_keys = index.update_slider(updated, updated.tag_keys)
+    assert changed_tag_keys == set(sliders[1].tag_keys) | set(updated.tag_keys)
+    current[current.index(sliders[1])] = updated
+    assert index.get_ordinal(updated.unique_identifier) == 1
+    _assert_matches_brute_force(index, current)
+
+
+def test_removing_the_last_slider_of_a_tag_key_removes_the_key():
+    sliders = create_fake_library(number_of_sliders=10)
+    unique = FakeSlider('unique', 'Unique', tag_keys=((CSFSliderTagType.CUSTOM_TAG, 'unique'),))
+    index = _build([*sliders, unique])
+    assert index.has_key((CSFSliderTagType.CUSTOM_TAG, 'unique'))
+    index.remove_slider(unique.unique_identifier)
+    assert not index.has_key((CSFSliderTagType.CUSTOM_TAG, 'unique'))
+    assert index.get_count((CSFSliderTagType.CUSTOM_TAG, 'unique')) == 0
+
+
+def test_combined_keys_match_brute_force():
+    sliders = create_fake_library()
+    index = _build(sliders[:100])
+    index.add_combined_keys(CSFSliderTagType.SIM_DETAILS, (CSFSliderTagType.GENDER, CSFSliderTagType.AGE))
+    for slider in sliders[100:]:
+        index.add_slider(slider, slider.tag_keys)
+    index.remove_slider(sliders[0].unique_identifier)
+    current = sliders[1:]
+    genders = set([value for (tag_type, value) in get_all_tag_keys(sliders) if tag_type == CSFSliderTagType.GENDER])
+    ages = set([value for (tag_type, value) in get_all_tag_keys(sliders) if tag_type == CSFSliderTagType.AGE])
+    for gender in genders:
+        for age in ages:
+            expected = _brute_force(current, ((CSFSliderTagType.GENDER, gender), (CSFSliderTagType.AGE, age)))
+            assert set(index.to_sliders(index.get_bitmap((CSFSliderTagType.SIM_DETAILS, (gender, age))))) == expected
+
+
+def test_state_round_trip():
+    sliders = create_fake_library()
+    index = _build(sliders)
+    index.add_combined_keys(CSFSliderTagType.SIM_DETAILS, (CSFSliderTagType.GENDER, CSFSliderTagType.AGE))
+    index.remove_slider(sliders[3].unique_identifier)
+    restored = CSFSliderTagIndex.from_state(*index.get_state())
+    assert restored.library == index.library
+    assert restored.number_of_sliders == index.number_of_sliders
+    assert restored.get_ordinal(sliders[3].unique_identifier) is None
+    added = FakeSlider('added', 'Added', tag_keys=((CSFSliderTagType.GENDER, 'male'), (CSFSliderTagType.AGE, 'teen')))
+    restored.add_slider(added, added.tag_keys)
+    assert added in restored.to_sliders(restored.get_bitmap((CSFSliderTagType.SIM_DETAILS, ('male', 'teen'))))
@@ -0,0 +1,69 @@
+"""
+This file is part of the Custom Slider Framework licensed under the Creative Commons Attribution-NoDerivatives 4.0 International public license (CC BY-ND 4.0).
+
+https://creativecommons.org/licenses/by-nd/4.0/
+https://creativecommons.org/licenses/by-nd/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from cncustomsliderframework.events.slider_changed_event import CSFSliderValueChanged
+from cncustomsliderframework.events.sliders_changed_batch_event import CSFSlidersChangedBatch
+from fake_sims import FakeCustomSlider, FakeEventRegistry, FakeSimInfo, create_application_service
+
+NOSE = FakeCustomSlider('Nose', 1, 2)
+CHIN = FakeCustomSlider('Chin', 3, 4)
+
+
+class _ModIdentity:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+def _get_events(event_type):
+    return [event for event in FakeEventRegistry.dispatched_events if isinstance(event, event_type)]
+
+
+def test_one_batch_event_is_triggered_per_commit(monkeypatch):
+    application_service = create_application_service(monkeypatch)
+    sim_info = FakeSimInfo(1, face_modifiers=((1, 0.5),))
+    assert application_service.apply_sliders(sim_info, {NOSE: 20.0, CHIN: -40.0})
+    assert len(FakeEventRegistry.dispatched_events) == 1
+    (batch_event,) = _get_events(CSFSlidersChangedBatch)
+    assert batch_event.sim_info is sim_info
+    assert batch_event.sliders == (NOSE, CHIN)
+    assert batch_event.get_values(NOSE) == (50.0, 20.0)
+    assert batch_event.get_values(CHIN) == (0.0, -40.0)
+
+
+def test_no_event_is_triggered_without_changes_or_when_not_requested(monkeypatch):
+    application_service = create_application_service(monkeypatch)
+    sim_info = FakeSimInfo(1)
+    application_service.edit_sliders(sim_info).commit()
+    assert application_service.apply_slider(sim_info, NOSE, 20.0, trigger_event=False)
+    with application_service.edit_sliders(sim_info) as edit_session:
+        edit_session.apply_slider(CHIN, 10.0)
+        edit_session.rollback()
+    assert FakeEventRegistry.dispatched_events == []
+
+
+def test_slider_value_changed_events_are_only_triggered_once_opted_in(monkeypatch):
+    application_service = create_application_service(monkeypatch)
+    sim_info = FakeSimInfo(1)
+    mod_identity = _ModIdentity('listening_mod')
+    application_service.enable_slider_value_changed_events(mod_identity)
+    assert application_service.apply_sliders(sim_info, {NOSE: 20.0, CHIN: -40.0})
+    assert [(event.slider, event.old_value, event.new_value) for event in _get_events(CSFSliderValueChanged)] == [(NOSE, 0.0, 20.0), (CHIN, 0.0, -40.0)]
+    assert len(_get_events(CSFSlidersChangedBatch)) == 1
+    application_service.disable_slider_value_changed_events(mod_identity)
+    FakeEventRegistry.dispatched_events.clear()
+    assert application_service.apply_slider(sim_info, NOSE, 30.0)
+    assert _get_events(CSFSliderValueChanged) == []
+    assert len(_get_events(CSFSlidersChangedBatch)) == 1
+
+
+def test_get_values_spans_every_change_of_a_slider():
+    batch_event = CSFSlidersChangedBatch(FakeSimInfo(1), ((NOSE, 0.0, 20.0), (CHIN, 5.0, 0.0), (NOSE, 20.0, 60.0)))
+    assert batch_event.sliders == (NOSE, CHIN, NOSE)
+    assert batch_event.get_values(NOSE) == (0.0, 60.0)
+    assert batch_event.get_values(CHIN) == (5.0, 0.0)
+    assert batch_event.get_values(FakeCustomSlider('Ears', 7, 8)) is None